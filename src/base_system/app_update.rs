@@ -76,10 +76,10 @@ fn state_file_path() -> PathBuf {
 
 fn load_state() -> LocalUpdateState {
     let path = state_file_path();
-    let Ok(raw) = fs::read_to_string(&path) else {
+    let Ok(raw) = fs::read(&path) else {
         return LocalUpdateState::default();
     };
-    serde_json::from_str(&raw).unwrap_or_default()
+    serde_json::from_slice(&raw).unwrap_or_default()
 }
 
 fn save_state(state: &LocalUpdateState) -> Result<()> {
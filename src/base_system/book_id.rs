@@ -4,7 +4,6 @@ use regex::Regex;
 use std::sync::OnceLock;
 
 static RE_URL: OnceLock<Regex> = OnceLock::new();
-static RE_QS: OnceLock<Regex> = OnceLock::new();
 static RE_PAGE: OnceLock<Regex> = OnceLock::new();
 static RE_SHORT_LINK: OnceLock<Regex> = OnceLock::new();
 static HTTP_CLIENT: OnceLock<reqwest::blocking::Client> = OnceLock::new();
@@ -25,10 +24,6 @@ fn re_url() -> &'static Regex {
     RE_URL.get_or_init(|| Regex::new(r"https?://\S+").expect("compile RE_URL"))
 }
 
-fn re_qs() -> &'static Regex {
-    RE_QS.get_or_init(|| Regex::new(r"(?i)(book_id|bookId)=([0-9]+)").expect("compile RE_QS"))
-}
-
 fn re_page() -> &'static Regex {
     RE_PAGE.get_or_init(|| Regex::new(r"/page/(\d+)").expect("compile RE_PAGE"))
 }
@@ -49,16 +44,16 @@ fn http_client() -> &'static reqwest::blocking::Client {
     })
 }
 
-/// Extracts the host (without port) from a URL string, lowercased.
-fn url_host(url: &str) -> Option<String> {
+/// Extracts the host (without port) from a URL string, borrowed from the input.
+/// Callers compare it case-insensitively, so no lowercased copy is allocated.
+fn url_host(url: &str) -> Option<&str> {
+    let url = url.trim();
     let after_scheme = url
-        .trim()
         .strip_prefix("https://")
-        .or_else(|| url.trim().strip_prefix("http://"))?;
+        .or_else(|| url.strip_prefix("http://"))?;
     let host_and_rest = after_scheme.split('/').next()?;
     // Strip port if present
-    let host = host_and_rest.split(':').next()?;
-    Some(host.to_lowercase())
+    host_and_rest.split(':').next()
 }
 
 pub fn parse_book_id(input: &str) -> Option<String> {
@@ -71,14 +66,13 @@ pub fn parse_book_id(input: &str) -> Option<String> {
         return Some(trimmed.to_string());
     }
 
-    // If user pasted extra text around the URL, try to extract URL first.
-    let target = re_url()
-        .find(trimmed)
-        .map(|m| m.as_str())
-        .unwrap_or(trimmed);
+    book_id_from_target(url_target(trimmed))
+}
 
-    if let Some(caps) = re_qs().captures(target) {
-        return caps.get(2).map(|m| m.as_str().to_string());
+/// 从已提取出的链接（或原始输入）中按 query 参数、`/page/<id>` 的顺序取 book_id。
+fn book_id_from_target(target: &str) -> Option<String> {
+    if let Some(id) = query_book_id(target) {
+        return Some(id.to_string());
     }
 
     if let Some(caps) = re_page().captures(target) {
@@ -88,19 +82,54 @@ pub fn parse_book_id(input: &str) -> Option<String> {
     None
 }
 
+/// 查找 `book_id=<数字>` / `bookId=<数字>`（参数名不区分大小写）。
+/// 只关心这一个参数：逐个检查 `=` 前的参数名和其后的数字，不必为此跑带捕获组的正则。
+fn query_book_id(target: &str) -> Option<&str> {
+    const KEYS: [&[u8]; 2] = [b"book_id", b"bookid"];
+    let bytes = target.as_bytes();
+    for (eq, _) in target.match_indices('=') {
+        let key = &bytes[..eq];
+        let is_book_id_key = KEYS.iter().any(|name| {
+            key.len() >= name.len() && key[key.len() - name.len()..].eq_ignore_ascii_case(name)
+        });
+        if !is_book_id_key {
+            continue;
+        }
+        let value = &target[eq + 1..];
+        let digits = value.bytes().take_while(u8::is_ascii_digit).count();
+        if digits > 0 {
+            return Some(&value[..digits]);
+        }
+    }
+    None
+}
+
 /// Returns `true` if `input` contains a short-redirect share link from a
 /// known allowed domain (e.g. `https://changdunovel.com/t/E_HDbOHpMJA/`).
 pub fn is_short_link(input: &str) -> bool {
-    let trimmed = input.trim();
-    let target = re_url()
+    is_allowed_short_link_url(url_target(input.trim()))
+}
+
+/// If the user pasted extra text around a URL, returns just the URL;
+/// otherwise returns the input unchanged.
+fn url_target(trimmed: &str) -> &str {
+    re_url()
         .find(trimmed)
         .map(|m| m.as_str())
-        .unwrap_or(trimmed);
+        .unwrap_or(trimmed)
+}
+
+/// Short-link check for a URL that has already been extracted from the input.
+fn is_allowed_short_link_url(target: &str) -> bool {
     if !re_short_link().is_match(target) {
         return false;
     }
     url_host(target)
-        .map(|h| ALLOWED_SHORT_LINK_HOSTS.contains(&h.as_str()))
+        .map(|h| {
+            ALLOWED_SHORT_LINK_HOSTS
+                .iter()
+                .any(|allowed| allowed.eq_ignore_ascii_case(h))
+        })
         .unwrap_or(false)
 }
 
@@ -112,14 +141,24 @@ pub fn is_short_link(input: &str) -> bool {
 /// `input` is a short link.  Call it from a blocking context (e.g. inside
 /// `tokio::task::spawn_blocking`) when used from async code.
 pub fn resolve_book_id(input: &str) -> Option<String> {
-    if let Some(id) = parse_book_id(input) {
+    let trimmed = input.trim();
+    if trimmed.is_empty() {
+        return None;
+    }
+    if trimmed.chars().all(|c| c.is_ascii_digit()) {
+        return Some(trimmed.to_string());
+    }
+
+    // URL 只提取一次：既用于解析 book_id，也用于后续短链接跳转。
+    let url_match = re_url().find(trimmed).map(|m| m.as_str());
+    if let Some(id) = book_id_from_target(url_match.unwrap_or(trimmed)) {
         return Some(id);
     }
 
-    let trimmed = input.trim();
-    let url = re_url().find(trimmed).map(|m| m.as_str())?;
+    let url = url_match?;
 
-    if !is_short_link(url) {
+    // url 已是提取出的链接，直接校验，不再对它重复跑一遍 URL 正则。
+    if !is_allowed_short_link_url(url) {
         return None;
     }
 
@@ -167,6 +206,23 @@ mod tests {
         assert!(is_short_link("https://changdunovel.com/t/AbC-Def_123/"));
     }
 
+    #[test]
+    fn parse_book_id_from_camel_case_query() {
+        let url = "https://fanqienovel.com/reader?bookId=7423591956359416856&x=1";
+        assert_eq!(parse_book_id(url), Some("7423591956359416856".into()));
+    }
+
+    #[test]
+    fn parse_book_id_skips_query_key_without_digits() {
+        let url = "https://fanqienovel.com/reader?BOOK_ID=abc&bookId=7423591956359416856";
+        assert_eq!(parse_book_id(url), Some("7423591956359416856".into()));
+    }
+
+    #[test]
+    fn recognize_short_link_with_uppercase_host() {
+        assert!(is_short_link("https://ChangDuNovel.com/t/E_HDbOHpMJA/"));
+    }
+
     #[test]
     fn reject_short_link_from_unknown_host() {
         assert!(!is_short_link("https://example.com/t/E_HDbOHpMJA/"));
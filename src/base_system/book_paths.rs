@@ -79,9 +79,67 @@ pub fn migrate_legacy_cover_file(folder: &Path, book_name: Option<&str>) -> Opti
     }
 }
 
+/// 目录项是否为目录：类型取自 `read_dir` 返回的目录项本身，无需再 stat 一次；
+/// 仅符号链接才回退到跟随链接的 `is_dir()`，保持与 `Path::is_dir` 相同的判定。
+pub fn dir_entry_is_dir(entry: &std::fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(t) if t.is_symlink() => entry.path().is_dir(),
+        Ok(t) => t.is_dir(),
+        Err(_) => false,
+    }
+}
+
+/// 目录项是否为普通文件，判定方式同 [`dir_entry_is_dir`]。
+pub fn dir_entry_is_file(entry: &std::fs::DirEntry) -> bool {
+    match entry.file_type() {
+        Ok(t) if t.is_symlink() => entry.path().is_file(),
+        Ok(t) => t.is_file(),
+        Err(_) => false,
+    }
+}
+
+/// 清理预览阶段产生的封面目录：仅当目录内只有封面图片（`cover.*` 或旧版“书名.*”）时，
+/// 删除这些图片和目录本身；出现 status.json 等任何其他条目都说明已有真正的下载，保持不动。
+/// 返回目录是否被删除。
+pub fn remove_preview_cover_folder(folder: &Path, book_name: Option<&str>) -> bool {
+    // 单次 read_dir 扫描：目录不存在时直接失败返回；文件类型取自目录项，无需逐个 stat。
+    let Ok(read_dir) = std::fs::read_dir(folder) else {
+        return false;
+    };
+    let safe_name = book_name.map(|n| safe_fs_name(n, "_", 120));
+    let mut covers = Vec::new();
+    for ent in read_dir.flatten() {
+        let path = ent.path();
+        if !ent.file_type().is_ok_and(|t| t.is_file())
+            || !is_preview_cover_file(&path, safe_name.as_deref())
+        {
+            return false;
+        }
+        covers.push(path);
+    }
+    for p in &covers {
+        let _ = std::fs::remove_file(p);
+    }
+    // 此时目录应已为空；remove_dir 只删空目录，期间若有新文件写入会安全失败。
+    std::fs::remove_dir(folder).is_ok()
+}
+
+fn is_preview_cover_file(path: &Path, safe_name: Option<&str>) -> bool {
+    let (Some(stem), Some(ext)) = (
+        path.file_stem().and_then(|s| s.to_str()),
+        path.extension().and_then(|s| s.to_str()),
+    ) else {
+        return false;
+    };
+    let is_img = ["jpg", "jpeg", "png", "webp", "gif", "heic", "heif"]
+        .iter()
+        .any(|e| ext.eq_ignore_ascii_case(e));
+    is_img && (stem.eq_ignore_ascii_case(COVER_FILE_STEM) || safe_name == Some(stem))
+}
+
 #[cfg(test)]
 mod tests {
-    use super::{book_folder_name, legacy_book_folder_name};
+    use super::{book_folder_name, legacy_book_folder_name, remove_preview_cover_folder};
 
     #[test]
     fn cache_folder_name_is_stable_across_book_name_changes() {
@@ -92,4 +150,28 @@ mod tests {
             legacy_book_folder_name("123", Some("新书名"))
         );
     }
+
+    #[test]
+    fn preview_cover_folder_is_removed_only_when_it_holds_covers() {
+        let temp_dir = tempfile::tempdir().unwrap();
+
+        let preview = temp_dir.path().join("123");
+        std::fs::create_dir_all(&preview).unwrap();
+        std::fs::write(preview.join("cover.jpg"), b"img").unwrap();
+        std::fs::write(preview.join("书名.png"), b"img").unwrap();
+        assert!(remove_preview_cover_folder(&preview, Some("书名")));
+        assert!(!preview.exists());
+
+        let downloaded = temp_dir.path().join("456");
+        std::fs::create_dir_all(&downloaded).unwrap();
+        std::fs::write(downloaded.join("cover.jpg"), b"img").unwrap();
+        std::fs::write(downloaded.join("status.json"), b"{}").unwrap();
+        assert!(!remove_preview_cover_folder(&downloaded, None));
+        assert!(downloaded.join("cover.jpg").exists());
+
+        assert!(!remove_preview_cover_folder(
+            &temp_dir.path().join("789"),
+            None
+        ));
+    }
 }
@@ -9,6 +9,7 @@ use std::path::{Path, PathBuf};
 
 use serde::{Deserialize, Serialize};
 
+use super::book_paths;
 use super::config::{ConfigSpec, FieldMeta};
 
 pub const OUTPUT_FORMAT_TXT: &str = "txt";
@@ -613,19 +614,16 @@ impl Config {
 
         for entry in fs::read_dir(save_dir)? {
             let entry = entry?;
-            let path = entry.path();
-            if !path.is_dir() {
-                continue;
-            }
-
-            let Some(name) = path.file_name().and_then(OsStr::to_str) else {
+            // 先按名称前缀过滤，再用目录项自带的文件类型判断，省去每个条目一次 stat。
+            let file_name = entry.file_name();
+            let Some(name) = file_name.to_str() else {
                 continue;
             };
-
-            if !name.starts_with(&prefix) {
+            if !name.starts_with(&prefix) || !book_paths::dir_entry_is_dir(&entry) {
                 continue;
             }
 
+            let path = entry.path();
             if Self::status_folder_has_book_record(&path, book_id) {
                 folders.push(path);
             }
@@ -636,15 +634,22 @@ impl Config {
     }
 
     fn status_folder_has_book_record(path: &Path, book_id: &str) -> bool {
-        let status = path.join("status.json");
-        if status.exists() {
-            if let Ok(raw) = fs::read_to_string(&status)
-                && let Ok(value) = serde_json::from_str::<serde_json::Value>(&raw)
-                && let Some(id) = value.get("book_id").and_then(|v| v.as_str())
-            {
-                return id == book_id;
+        // status.json 里带着已下载章节正文，只为比对 book_id 不必建出整棵 Value：
+        // 按字节读入、只反序列化 book_id 字段，其余内容由 serde 跳过。
+        #[derive(Deserialize)]
+        struct StatusBookId {
+            book_id: Option<String>,
+        }
+
+        match fs::read(path.join("status.json")) {
+            Ok(raw) => {
+                return serde_json::from_slice::<StatusBookId>(&raw)
+                    .ok()
+                    .and_then(|status| status.book_id)
+                    .is_none_or(|id| id == book_id);
             }
-            return true;
+            Err(err) if err.kind() != io::ErrorKind::NotFound => return true,
+            Err(_) => {}
         }
 
         path.join(format!("chapter_status_{}.json", book_id))
@@ -867,17 +872,8 @@ fn merge_conflicting_file(src: &Path, dst: &Path) -> io::Result<()> {
 }
 
 fn status_downloaded_count(path: &Path) -> usize {
-    let Ok(raw) = fs::read_to_string(path) else {
-        return 0;
-    };
-    let Ok(value) = serde_json::from_str::<serde_json::Value>(&raw) else {
-        return 0;
-    };
-    value
-        .get("downloaded")
-        .and_then(|v| v.as_object())
-        .map(|m| m.len())
-        .unwrap_or(0)
+    // 只需要条目数：边解析边计数，不把每章正文读进 Value 树。
+    crate::base_system::novel_updates::status_file_downloaded_total(path).unwrap_or(0)
 }
 
 #[cfg(test)]
@@ -935,6 +931,24 @@ mod tests {
         assert!(!old_folder.exists());
     }
 
+    #[test]
+    fn status_folder_record_check_reads_only_book_id() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let folder = temp_dir.path().join("123_书名");
+        std::fs::create_dir_all(&folder).unwrap();
+
+        std::fs::write(
+            folder.join("status.json"),
+            r#"{"downloaded":{"1":["第一章","内容"]},"book_id":"456"}"#,
+        )
+        .unwrap();
+        assert!(!Config::status_folder_has_book_record(&folder, "123"));
+        assert!(Config::status_folder_has_book_record(&folder, "456"));
+
+        std::fs::write(folder.join("status.json"), "not json").unwrap();
+        assert!(Config::status_folder_has_book_record(&folder, "123"));
+    }
+
     #[test]
     fn bulk_output_mode_is_mapped_to_txt_plus_bulk_flag() {
         let mut config = Config::default();
@@ -1064,6 +1078,8 @@ fn default_true() -> bool {
     true
 }
 
+/// 默认单线程：官方接口与多数第三方端点对并发很敏感，过高并发容易触发冷却/风控。
+/// 配置项本身不设上限，实际启动的下载线程数还会受章节分组数约束。
 fn default_max_workers() -> usize {
     1
 }
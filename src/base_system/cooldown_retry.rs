@@ -3,11 +3,38 @@
 use anyhow::{Result, anyhow};
 use serde_json::Value;
 #[cfg(feature = "official-api")]
-use std::time::Duration;
+use std::sync::Mutex;
+#[cfg(feature = "official-api")]
+use std::time::{Duration, Instant};
 
 #[cfg(feature = "official-api")]
 use tomato_novel_official_api::FanqieClient;
 
+/// 官方接口的共享冷却截止时间。冷却是接口级别的限制而不是单个请求的：
+/// 任一 worker 收到 Cooldown 后在这里登记，其余 worker 发请求前先等到该时刻，
+/// 不必各自再撞一次冷却才开始退避。
+#[cfg(feature = "official-api")]
+static COOLDOWN_UNTIL: Mutex<Option<Instant>> = Mutex::new(None);
+
+/// 发请求前调用：若共享冷却尚未结束则睡到截止时刻，否则立即返回。
+#[cfg(feature = "official-api")]
+pub(crate) fn wait_cooldown_gate() {
+    let until = *COOLDOWN_UNTIL.lock().unwrap_or_else(|e| e.into_inner());
+    if let Some(wait) = until.and_then(|t| t.checked_duration_since(Instant::now())) {
+        std::thread::sleep(wait);
+    }
+}
+
+/// 收到 Cooldown 时调用：把共享冷却延长到 `delay` 之后（只延长，不缩短）。
+#[cfg(feature = "official-api")]
+pub(crate) fn note_cooldown(delay: Duration) {
+    let until = Instant::now() + delay;
+    let mut guard = COOLDOWN_UNTIL.lock().unwrap_or_else(|e| e.into_inner());
+    if guard.is_none_or(|cur| cur < until) {
+        *guard = Some(until);
+    }
+}
+
 #[allow(dead_code)]
 pub fn fetch_with_cooldown_retry(
     #[cfg(feature = "official-api")] client: &FanqieClient,
@@ -27,13 +54,14 @@ pub fn fetch_with_cooldown_retry(
     let mut delay = Duration::from_millis(1100);
     #[cfg(feature = "official-api")]
     for attempt in 0..6 {
+        wait_cooldown_gate();
         #[cfg(feature = "official-api")]
         match client.get_contents(ids, epub_mode, book_id) {
             Ok(v) => return Ok(v),
             Err(e) => {
                 let msg = e.to_string();
                 if msg.contains("Cooldown") || msg.contains("CooldownNotReached") {
-                    std::thread::sleep(delay);
+                    note_cooldown(delay);
                     delay = std::cmp::min(delay * 2, Duration::from_secs(8));
                     continue;
                 }
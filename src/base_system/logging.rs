@@ -3,8 +3,9 @@
 use std::fs::{self, File};
 use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::{Arc, Mutex, OnceLock};
-use std::{io, panic, thread, time::Duration};
+use std::sync::{Arc, Condvar, Mutex, OnceLock};
+use std::time::Duration;
+use std::{io, panic, thread};
 
 use crossterm::event::DisableMouseCapture;
 use crossterm::execute;
@@ -27,6 +28,7 @@ use zip::write::FileOptions;
 
 const MAX_LOG_BYTES: u64 = 10 * 1024 * 1024; // 10MB
 const ARCHIVE_WAIT_MS: u64 = 1000; // allow file handles to settle on Windows
+const INTERRUPT_DRAIN_MS: u64 = 3000; // Ctrl+C 后等待下载阶段落盘的最长时间
 
 #[derive(Debug, thiserror::Error)]
 pub enum LogError {
@@ -73,6 +75,60 @@ pub fn current_logs_dir() -> Option<PathBuf> {
     LOGS_DIR.get().cloned()
 }
 
+/// 当前所有进行中下载登记的取消标志（Web 模式下可能有多个任务并发）。
+static INTERRUPT_FLAGS: Mutex<Vec<Arc<AtomicBool>>> = Mutex::new(Vec::new());
+/// 作用域注销时通知：Ctrl+C 处理线程在此等待下载收尾，而不是定时轮询登记槽位。
+static INTERRUPT_RELEASED: Condvar = Condvar::new();
+
+/// Ctrl+C 中断作用域：存活期间 Ctrl+C 会先置位取消标志并等待下载线程收尾，
+/// 析构时只注销本作用域自己的标志，与其他任务的结束顺序无关。
+pub struct InterruptScope {
+    flag: Arc<AtomicBool>,
+}
+
+/// 在下载阶段登记取消标志，返回的作用域对象析构时自动注销。
+pub fn scoped_interrupt(flag: &Arc<AtomicBool>) -> InterruptScope {
+    if let Ok(mut flags) = INTERRUPT_FLAGS.lock() {
+        flags.push(Arc::clone(flag));
+    }
+    InterruptScope {
+        flag: Arc::clone(flag),
+    }
+}
+
+impl Drop for InterruptScope {
+    fn drop(&mut self) {
+        if let Ok(mut flags) = INTERRUPT_FLAGS.lock()
+            && let Some(pos) = flags.iter().position(|f| Arc::ptr_eq(f, &self.flag))
+        {
+            flags.swap_remove(pos);
+            INTERRUPT_RELEASED.notify_all();
+        }
+    }
+}
+
+/// 若有下载正在进行：置位全部取消标志，并在限定时间内等待登记集合清空（状态落盘）。
+fn drain_active_download() {
+    let Ok(flags) = INTERRUPT_FLAGS.lock() else {
+        return;
+    };
+    if flags.is_empty() {
+        return;
+    }
+    // 作用域析构时会 notify；每次醒来都重新置位（覆盖等待期间新登记的任务），
+    // 直到集合为空或超时后直接进入退出流程。
+    let _ = INTERRUPT_RELEASED.wait_timeout_while(
+        flags,
+        Duration::from_millis(INTERRUPT_DRAIN_MS),
+        |flags| {
+            for flag in flags.iter() {
+                flag.store(true, Ordering::SeqCst);
+            }
+            !flags.is_empty()
+        },
+    );
+}
+
 #[derive(Clone)]
 struct ChannelWriter {
     tx: crossbeam_channel::Sender<String>,
@@ -241,6 +297,9 @@ impl LogRuntime {
     fn install_signal_handler(self: &Arc<Self>) {
         let runtime = Arc::clone(self);
         let _ = ctrlc::set_handler(move || {
+            // 下载中：先让工作线程停下并写入 status.json，避免丢失未落盘的进度。
+            drain_active_download();
+
             // Best-effort console restore: if the app is in TUI raw mode / alt screen,
             // leaving it as-is will make subsequent PowerShell input appear "stuck".
             let _ = disable_raw_mode();
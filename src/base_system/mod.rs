@@ -9,7 +9,6 @@ pub mod config;
 pub mod context;
 pub mod cooldown_retry;
 pub mod download_history;
-pub mod file_cleaner;
 pub mod json_extract;
 pub mod logging;
 pub mod novel_updates;
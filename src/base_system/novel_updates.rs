@@ -3,14 +3,17 @@
 use std::collections::{HashMap, HashSet, VecDeque};
 use std::fs;
 use std::path::{Path, PathBuf};
-use std::sync::{Arc, Mutex, mpsc};
+use std::sync::{Arc, Mutex, OnceLock, mpsc};
 use std::thread;
 use std::time::{SystemTime, UNIX_EPOCH};
 
-use anyhow::{Context, Result};
+use anyhow::{Context, Result, anyhow};
+use serde::de::IgnoredAny;
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 
+use crate::base_system::book_paths;
+
 #[cfg(feature = "official-api")]
 use tomato_novel_official_api::DirectoryClient;
 
@@ -68,6 +71,8 @@ struct CachedRemoteTotal {
 const UPDATE_CACHE_FILE: &str = ".tnd_update_cache.json";
 const UPDATE_CACHE_TTL_MS: u64 = 10 * 60 * 1000;
 const UPDATE_SCAN_WORKERS: usize = 4;
+/// 本地状态文件并行读取的线程上限（纯磁盘/CPU 工作，不受远端限频约束）。
+const STATUS_READ_WORKERS: usize = 8;
 
 /// 扫描保存目录下的书籍缓存文件夹（新版为 `<book_id>`，兼容旧版 `<book_id>_<book_name>`），并对比远端目录。
 ///
@@ -99,10 +104,10 @@ where
     let mut emitted = HashSet::new();
     let mut scanned = 0usize;
 
-    let by_id: HashMap<String, LocalBookStatus> = local_books
+    // 远端结果按 book_id 回查本地记录：借用 local_books，不为每本书复制一份。
+    let by_id: HashMap<&str, &LocalBookStatus> = local_books
         .iter()
-        .cloned()
-        .map(|book| (book.book_id.clone(), book))
+        .map(|book| (book.book_id.as_str(), book))
         .collect();
 
     for book in &local_books {
@@ -135,7 +140,7 @@ where
                 },
             );
 
-            if let Some(book) = by_id.get(&book_id) {
+            if let Some(&book) = by_id.get(book_id.as_str()) {
                 record_update_row(
                     book,
                     remote_total,
@@ -151,7 +156,7 @@ where
 
         // 如果本轮刷新失败但有旧缓存，先用旧缓存顶上，避免“无结果”导致 UI 看起来像书消失。
         for book in &local_books {
-            if emitted.contains(&book.book_id) || fetched.contains_key(&book.book_id) {
+            if emitted.contains(book.book_id.as_str()) || fetched.contains_key(&book.book_id) {
                 continue;
             }
             if let Some(cached) = cache.entries.get(&book.book_id)
@@ -182,19 +187,19 @@ where
 }
 
 #[allow(clippy::too_many_arguments)]
-fn record_update_row<F>(
-    book: &LocalBookStatus,
+fn record_update_row<'a, F>(
+    book: &'a LocalBookStatus,
     remote_total: usize,
     total: usize,
     scanned: &mut usize,
-    emitted: &mut HashSet<String>,
+    emitted: &mut HashSet<&'a str>,
     updates: &mut Vec<NovelUpdateRow>,
     no_updates: &mut Vec<NovelUpdateRow>,
     on_progress: &mut F,
 ) where
     F: FnMut(NovelUpdateProgress),
 {
-    if remote_total == 0 || !emitted.insert(book.book_id.clone()) {
+    if remote_total == 0 || !emitted.insert(book.book_id.as_str()) {
         return;
     }
 
@@ -231,64 +236,94 @@ fn row_from_book(book: &LocalBookStatus, remote_total: usize) -> NovelUpdateRow
 }
 
 fn collect_local_book_statuses(save_dir: &Path) -> Result<Vec<LocalBookStatus>> {
-    if !save_dir.exists() {
-        return Ok(Vec::new());
-    }
-
-    let dir_reader =
-        fs::read_dir(save_dir).with_context(|| format!("read dir {}", save_dir.display()))?;
+    let dir_reader = match fs::read_dir(save_dir) {
+        Ok(rd) => rd,
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => return Ok(Vec::new()),
+        Err(e) => {
+            return Err(e).with_context(|| format!("read dir {}", save_dir.display()));
+        }
+    };
 
-    let mut books = Vec::new();
+    let mut candidates = Vec::new();
     for entry in dir_reader.flatten() {
-        let path = entry.path();
-        if !path.is_dir() {
+        // 先按目录名过滤，再用目录项自带的文件类型判断，省去每个条目一次 stat。
+        let file_name = entry.file_name();
+        let Some(name) = file_name.to_str() else {
             continue;
-        }
-        let name = match path.file_name().and_then(|n| n.to_str()) {
-            Some(n) => n,
-            None => continue,
         };
-        let (book_id, legacy_name) = match parse_book_folder_name(name) {
-            Some(v) => v,
-            _ => continue,
-        };
-
-        // 只扫描真正有状态文件的目录；预览阶段仅有 cover.* 的缓存目录不能被误报为“已下载小说”。
-        let Some(status_value) = read_status_json(&path, &book_id) else {
+        let Some((book_id, legacy_name)) = parse_book_folder_name(name) else {
             continue;
         };
-        let counts = counts_from_status(&status_value);
-        let is_ignored = status_value
-            .get("ignore_updates")
-            .and_then(|v| v.as_bool())
-            .unwrap_or(false);
-        let book_name = status_value
-            .get("book_name")
-            .and_then(|v| v.as_str())
-            .filter(|s| !s.trim().is_empty())
-            .map(|s| s.to_string())
-            .unwrap_or(legacy_name);
-        let (local_total, _local_ok, local_failed) = counts.unwrap_or((0, 0, 0));
-
-        books.push(LocalBookStatus {
-            book_id,
-            book_name,
-            folder: path,
-            local_total,
-            local_failed,
-            is_ignored,
-        });
+        if !book_paths::dir_entry_is_dir(&entry) {
+            continue;
+        }
+        candidates.push((book_id, legacy_name, entry.path()));
+    }
+
+    // 状态文件里含全部章节正文，逐本串行读取+解析是扫描的主要耗时：按核心数分块并行，
+    // 分块内保持目录顺序，拼接后与串行结果一致。
+    let workers = thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .clamp(1, STATUS_READ_WORKERS)
+        .min(candidates.len());
+    if workers <= 1 {
+        return Ok(candidates
+            .iter()
+            .filter_map(load_local_book_status)
+            .collect());
     }
+    let chunk_size = candidates.len().div_ceil(workers);
+    thread::scope(|s| -> Result<Vec<LocalBookStatus>> {
+        let handles: Vec<_> = candidates
+            .chunks(chunk_size)
+            .map(|chunk| {
+                s.spawn(move || {
+                    chunk
+                        .iter()
+                        .filter_map(load_local_book_status)
+                        .collect::<Vec<_>>()
+                })
+            })
+            .collect();
+        // 某个分块的线程 panic 时整体报错：静默丢掉该块会让更新列表悄悄少掉一批书。
+        let mut books = Vec::with_capacity(candidates.len());
+        for h in handles {
+            let chunk = h
+                .join()
+                .map_err(|_| anyhow!("读取本地书籍状态的线程 panic，无法得到完整的书籍列表"))?;
+            books.extend(chunk);
+        }
+        Ok(books)
+    })
+}
 
-    Ok(books)
+fn load_local_book_status(
+    (book_id, legacy_name, path): &(String, String, PathBuf),
+) -> Option<LocalBookStatus> {
+    // 只扫描真正有状态文件的目录；预览阶段仅有 cover.* 的缓存目录不能被误报为“已下载小说”。
+    let summary = read_status_summary(path, book_id)?;
+    let book_name = summary.book_name.unwrap_or_else(|| legacy_name.clone());
+    let is_ignored = summary.ignore_updates;
+    let counts = summary.counts;
+    let (local_total, _local_ok, local_failed) = counts.unwrap_or((0, 0, 0));
+
+    Some(LocalBookStatus {
+        book_id: book_id.clone(),
+        book_name,
+        folder: path.clone(),
+        local_total,
+        local_failed,
+        is_ignored,
+    })
 }
 
 fn load_update_cache(save_dir: &Path) -> UpdateCacheFile {
     let path = save_dir.join(UPDATE_CACHE_FILE);
-    let Ok(raw) = fs::read_to_string(path) else {
+    // 直接按字节解析：serde_json 解析时已校验字符串的 UTF-8，不必先整文件转 String。
+    let Ok(raw) = fs::read(path) else {
         return UpdateCacheFile::default();
     };
-    serde_json::from_str(&raw).unwrap_or_default()
+    serde_json::from_slice(&raw).unwrap_or_default()
 }
 
 fn save_update_cache(save_dir: &Path, cache: &UpdateCacheFile) {
@@ -371,8 +406,9 @@ fn fetch_remote_totals_worker(
         return;
     };
     while let Some(book_id) = queue.lock().ok().and_then(|mut q| q.pop_front()) {
+        // 更新扫描要的就是远端最新章节数：绕过目录新鲜缓存。
         let total = client
-            .fetch_chapter_list(&book_id)
+            .fetch_chapter_list(&book_id, false)
             .map(|list| list.len())
             .filter(|n| *n > 0);
         if let Some(total) = total {
@@ -381,16 +417,15 @@ fn fetch_remote_totals_worker(
     }
 }
 
+/// 解析 `<数字ID>` 或 `<数字ID>_<书名>` 形式的目录名。
+///
+/// 一次字节扫描即可：数字前缀之后要么到达结尾（纯 ID），要么紧跟 `_`，否则不是书籍目录。
 fn parse_book_folder_name(name: &str) -> Option<(String, String)> {
-    if name.chars().all(|c| c.is_ascii_digit()) {
-        return Some((name.to_string(), name.to_string()));
-    }
-
-    let (id, title) = name.split_once('_')?;
-    if id.chars().all(|c| c.is_ascii_digit()) {
-        Some((id.to_string(), title.to_string()))
-    } else {
-        None
+    let digits = name.bytes().take_while(u8::is_ascii_digit).count();
+    match name.as_bytes().get(digits) {
+        None => Some((name.to_string(), name.to_string())),
+        Some(b'_') => Some((name[..digits].to_string(), name[digits + 1..].to_string())),
+        Some(_) => None,
     }
 }
 
@@ -399,8 +434,14 @@ fn parse_book_folder_name(name: &str) -> Option<(String, String)> {
 /// - ok: 成功下载的条目数（content/text 非空）
 /// - failed: total - ok
 pub fn read_downloaded_counts(folder: &Path, book_id: &str) -> Option<(usize, usize, usize)> {
-    let value = read_status_json(folder, book_id)?;
-    counts_from_status(&value)
+    read_status_summary(folder, book_id)?.counts
+}
+
+/// 统计指定状态文件中 "downloaded" 的条目数（流式计数，不构建 Value 树）。
+pub fn status_file_downloaded_total(path: &Path) -> Option<usize> {
+    let data = fs::read(path).ok()?;
+    let view: StatusFileView = serde_json::from_slice(&data).ok()?;
+    view.downloaded.and_then(|c| c.0).map(|(total, _ok)| total)
 }
 
 /// 仅统计成功下载的章节数（content/text 非空）。
@@ -412,9 +453,7 @@ pub fn read_downloaded_ok_count(folder: &Path, book_id: &str) -> Option<usize> {
 /// 读取书籍的ignore_updates标志
 #[allow(dead_code)]
 pub fn read_ignore_updates_flag(folder: &Path, book_id: &str) -> bool {
-    read_status_json(folder, book_id)
-        .and_then(|v| v.get("ignore_updates")?.as_bool())
-        .unwrap_or(false)
+    read_status_summary(folder, book_id).is_some_and(|s| s.ignore_updates)
 }
 
 /// 一次性读取下载计数和忽略标志，避免重复读取同一文件。
@@ -423,59 +462,369 @@ pub fn read_status_counts_and_ignore(
     folder: &Path,
     book_id: &str,
 ) -> (Option<(usize, usize, usize)>, bool) {
-    match read_status_json(folder, book_id) {
-        Some(value) => {
-            let counts = counts_from_status(&value);
-            let ignored = value
-                .get("ignore_updates")
-                .and_then(|v| v.as_bool())
-                .unwrap_or(false);
-            (counts, ignored)
-        }
+    match read_status_summary(folder, book_id) {
+        Some(summary) => (summary.counts, summary.ignore_updates),
         None => (None, false),
     }
 }
 
-/// 读取并解析 status.json（或旧格式 chapter_status_<id>.json）。
-fn read_status_json(folder: &Path, book_id: &str) -> Option<Value> {
-    let status_new = folder.join("status.json");
-    let status_old = folder.join(format!("chapter_status_{}.json", book_id));
-    let path = if status_new.exists() {
-        status_new
-    } else if status_old.exists() {
-        status_old
-    } else {
-        return None;
+/// 状态文件中扫描/更新逻辑关心的字段摘要。
+#[derive(Debug, Clone)]
+struct StatusSummary {
+    counts: Option<(usize, usize, usize)>,
+    ignore_updates: bool,
+    book_name: Option<String>,
+}
+
+type StatusSummaryCache = HashMap<PathBuf, (SystemTime, u64, StatusSummary)>;
+
+/// 摘要缓存条目上限：远大于常见书库规模，只防止书籍反复增删时进程级缓存无限增长。
+const STATUS_SUMMARY_CACHE_CAP: usize = 4096;
+
+fn status_summary_cache() -> &'static Mutex<StatusSummaryCache> {
+    static CACHE: OnceLock<Mutex<StatusSummaryCache>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+/// 读取 status.json（或旧格式 chapter_status_<id>.json）的摘要。
+///
+/// 状态文件包含全部章节正文，而更新菜单每次打开/返回都会重新扫描；这里按
+/// （路径, 修改时间, 大小）缓存解析结果，文件未变时只需一次 stat。
+fn read_status_summary(folder: &Path, book_id: &str) -> Option<StatusSummary> {
+    // 绝大多数目录都有 status.json：旧格式文件名只在它缺失时才拼接。
+    let status = folder.join("status.json");
+    let (path, meta) = match fs::metadata(&status) {
+        Ok(meta) => (status, meta),
+        Err(_) => {
+            let legacy = folder.join(format!("chapter_status_{}.json", book_id));
+            let meta = fs::metadata(&legacy).ok()?;
+            (legacy, meta)
+        }
     };
-    let data = fs::read_to_string(&path).ok()?;
-    serde_json::from_str(&data).ok()
-}
-
-/// 从已解析的 status JSON 中提取下载计数。
-fn counts_from_status(value: &Value) -> Option<(usize, usize, usize)> {
-    let downloaded = value.get("downloaded")?.as_object()?;
-    let total = downloaded.len();
-    let mut ok = 0usize;
-    for (_cid, pair) in downloaded {
-        match pair {
-            Value::Array(arr) => {
-                if arr.get(1).and_then(|v| v.as_str()).is_some() {
-                    ok += 1;
-                }
+    let stamp = meta.modified().ok().map(|t| (t, meta.len()));
+
+    if let Some((mtime, len)) = stamp
+        && let Ok(cache) = status_summary_cache().lock()
+        && let Some((cached_mtime, cached_len, summary)) = cache.get(&path)
+        && *cached_mtime == mtime
+        && *cached_len == len
+    {
+        return Some(summary.clone());
+    }
+
+    // 直接从字节反序列化为只含所需字段的视图：章节正文只判断“是否为字符串”，
+    // 不会为每章内容分配 String / 构建整棵 Value 树。
+    let data = fs::read(&path).ok()?;
+    let view: StatusFileView = serde_json::from_slice(&data).ok()?;
+    let summary = StatusSummary {
+        counts: view
+            .downloaded
+            .and_then(|c| c.0)
+            .map(|(total, ok)| (total, ok, total - ok)),
+        ignore_updates: view
+            .ignore_updates
+            .and_then(|v| v.as_bool())
+            .unwrap_or(false),
+        book_name: view
+            .book_name
+            .as_ref()
+            .and_then(|v| v.as_str())
+            .filter(|s| !s.trim().is_empty())
+            .map(str::to_string),
+    };
+
+    if let Some((mtime, len)) = stamp
+        && let Ok(mut cache) = status_summary_cache().lock()
+    {
+        if cache.len() >= STATUS_SUMMARY_CACHE_CAP && !cache.contains_key(&path) {
+            // 先淘汰已删除书籍的条目；仍然满则整体清空，之后按需重新填充。
+            cache.retain(|p, _| p.exists());
+            if cache.len() >= STATUS_SUMMARY_CACHE_CAP {
+                cache.clear();
             }
-            Value::Object(obj) => {
-                if obj
-                    .get("content")
-                    .or_else(|| obj.get("text"))
-                    .and_then(|v| v.as_str())
-                    .is_some()
+        }
+        cache.insert(path, (mtime, len, summary.clone()));
+    }
+    Some(summary)
+}
+
+/// status 文件的精简视图：只保留扫描需要的字段，其余字段（含章节正文）直接跳过。
+#[derive(Deserialize)]
+struct StatusFileView {
+    #[serde(default)]
+    downloaded: Option<DownloadedCounts>,
+    #[serde(default)]
+    ignore_updates: Option<Value>,
+    #[serde(default)]
+    book_name: Option<Value>,
+}
+
+/// "downloaded" 映射的统计：(条目总数, 内容为字符串的条目数)；非对象时为 None。
+struct DownloadedCounts(Option<(usize, usize)>);
+
+impl<'de> Deserialize<'de> for DownloadedCounts {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct CountsVisitor;
+
+        impl<'de> serde::de::Visitor<'de> for CountsVisitor {
+            type Value = DownloadedCounts;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("downloaded map")
+            }
+
+            fn visit_map<A: serde::de::MapAccess<'de>>(
+                self,
+                mut map: A,
+            ) -> Result<Self::Value, A::Error> {
+                let (mut total, mut ok) = (0usize, 0usize);
+                while let Some((IgnoredAny, entry)) =
+                    map.next_entry::<IgnoredAny, ChapterEntryOk>()?
                 {
-                    ok += 1;
+                    total += 1;
+                    ok += usize::from(entry.0);
+                }
+                Ok(DownloadedCounts(Some((total, ok))))
+            }
+
+            fn visit_seq<A: serde::de::SeqAccess<'de>>(
+                self,
+                mut seq: A,
+            ) -> Result<Self::Value, A::Error> {
+                while seq.next_element::<IgnoredAny>()?.is_some() {}
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_bool<E>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_i64<E>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_u64<E>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_f64<E>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_str<E>(self, _: &str) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+            fn visit_unit<E>(self) -> Result<Self::Value, E> {
+                Ok(DownloadedCounts(None))
+            }
+        }
+
+        deserializer.deserialize_any(CountsVisitor)
+    }
+}
+
+/// 单个章节条目是否有正文：兼容 `[title, content]` 与 `{content|text: ...}` 两种格式。
+struct ChapterEntryOk(bool);
+
+impl<'de> Deserialize<'de> for ChapterEntryOk {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct EntryVisitor;
+
+        impl<'de> serde::de::Visitor<'de> for EntryVisitor {
+            type Value = ChapterEntryOk;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("chapter entry")
+            }
+
+            fn visit_seq<A: serde::de::SeqAccess<'de>>(
+                self,
+                mut seq: A,
+            ) -> Result<Self::Value, A::Error> {
+                let _title = seq.next_element::<IgnoredAny>()?;
+                let content = seq.next_element::<IsString>()?;
+                while seq.next_element::<IgnoredAny>()?.is_some() {}
+                Ok(ChapterEntryOk(content.is_some_and(|c| c.0)))
+            }
+
+            fn visit_map<A: serde::de::MapAccess<'de>>(
+                self,
+                mut map: A,
+            ) -> Result<Self::Value, A::Error> {
+                // 与旧逻辑一致：存在 content 键时只看 content，否则再看 text。
+                let mut content = None;
+                let mut text = None;
+                while let Some(key) = map.next_key::<EntryKey>()? {
+                    match key {
+                        EntryKey::Content => content = Some(map.next_value::<IsString>()?.0),
+                        EntryKey::Text => text = Some(map.next_value::<IsString>()?.0),
+                        EntryKey::Other => {
+                            map.next_value::<IgnoredAny>()?;
+                        }
+                    }
                 }
+                Ok(ChapterEntryOk(content.or(text).unwrap_or(false)))
+            }
+
+            fn visit_bool<E>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
+            }
+            fn visit_i64<E>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
+            }
+            fn visit_u64<E>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
+            }
+            fn visit_f64<E>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
+            }
+            fn visit_str<E>(self, _: &str) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
+            }
+            fn visit_unit<E>(self) -> Result<Self::Value, E> {
+                Ok(ChapterEntryOk(false))
             }
-            _ => {}
         }
+
+        deserializer.deserialize_any(EntryVisitor)
+    }
+}
+
+enum EntryKey {
+    Content,
+    Text,
+    Other,
+}
+
+impl<'de> Deserialize<'de> for EntryKey {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct KeyVisitor;
+
+        impl serde::de::Visitor<'_> for KeyVisitor {
+            type Value = EntryKey;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("entry key")
+            }
+
+            fn visit_str<E>(self, v: &str) -> Result<Self::Value, E> {
+                Ok(match v {
+                    "content" => EntryKey::Content,
+                    "text" => EntryKey::Text,
+                    _ => EntryKey::Other,
+                })
+            }
+        }
+
+        deserializer.deserialize_identifier(KeyVisitor)
+    }
+}
+
+/// 只判断 JSON 值是否为字符串；字符串内容本身不落地。
+struct IsString(bool);
+
+impl<'de> Deserialize<'de> for IsString {
+    fn deserialize<D: serde::Deserializer<'de>>(deserializer: D) -> Result<Self, D::Error> {
+        struct IsStringVisitor;
+
+        impl<'de> serde::de::Visitor<'de> for IsStringVisitor {
+            type Value = IsString;
+
+            fn expecting(&self, f: &mut std::fmt::Formatter) -> std::fmt::Result {
+                f.write_str("any JSON value")
+            }
+
+            fn visit_str<E>(self, _: &str) -> Result<Self::Value, E> {
+                Ok(IsString(true))
+            }
+            fn visit_bool<E>(self, _: bool) -> Result<Self::Value, E> {
+                Ok(IsString(false))
+            }
+            fn visit_i64<E>(self, _: i64) -> Result<Self::Value, E> {
+                Ok(IsString(false))
+            }
+            fn visit_u64<E>(self, _: u64) -> Result<Self::Value, E> {
+                Ok(IsString(false))
+            }
+            fn visit_f64<E>(self, _: f64) -> Result<Self::Value, E> {
+                Ok(IsString(false))
+            }
+            fn visit_unit<E>(self) -> Result<Self::Value, E> {
+                Ok(IsString(false))
+            }
+            fn visit_seq<A: serde::de::SeqAccess<'de>>(
+                self,
+                mut seq: A,
+            ) -> Result<Self::Value, A::Error> {
+                while seq.next_element::<IgnoredAny>()?.is_some() {}
+                Ok(IsString(false))
+            }
+            fn visit_map<A: serde::de::MapAccess<'de>>(
+                self,
+                mut map: A,
+            ) -> Result<Self::Value, A::Error> {
+                while map.next_entry::<IgnoredAny, IgnoredAny>()?.is_some() {}
+                Ok(IsString(false))
+            }
+        }
+
+        deserializer.deserialize_any(IsStringVisitor)
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{parse_book_folder_name, read_status_counts_and_ignore};
+
+    #[test]
+    fn status_summary_is_reparsed_when_the_file_changes() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let folder = temp_dir.path();
+        let status = folder.join("status.json");
+
+        std::fs::write(&status, r#"{"downloaded":{"1":["t","c"],"2":["t",null]}}"#).unwrap();
+        assert_eq!(
+            read_status_counts_and_ignore(folder, "123"),
+            (Some((2, 1, 1)), false)
+        );
+        // 未变化时命中缓存，结果一致。
+        assert_eq!(
+            read_status_counts_and_ignore(folder, "123"),
+            (Some((2, 1, 1)), false)
+        );
+
+        std::fs::write(
+            &status,
+            r#"{"downloaded":{"1":["t","c"],"2":["t","c"],"3":["t","c"]},"ignore_updates":true}"#,
+        )
+        .unwrap();
+        assert_eq!(
+            read_status_counts_and_ignore(folder, "123"),
+            (Some((3, 3, 0)), true)
+        );
+    }
+
+    #[test]
+    fn status_counts_accept_object_entries() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let folder = temp_dir.path();
+        std::fs::write(
+            folder.join("status.json"),
+            r#"{"book_name":"书","downloaded":{"1":{"title":"t","content":"c"},"2":{"text":"c"},"3":{"content":null,"text":"c"},"4":0}}"#,
+        )
+        .unwrap();
+        assert_eq!(
+            read_status_counts_and_ignore(folder, "123"),
+            (Some((4, 2, 2)), false)
+        );
+    }
+
+    #[test]
+    fn book_folder_names_need_a_numeric_id_prefix() {
+        assert_eq!(
+            parse_book_folder_name("123_书名_卷一"),
+            Some(("123".to_string(), "书名_卷一".to_string()))
+        );
+        assert_eq!(
+            parse_book_folder_name("456"),
+            Some(("456".to_string(), "456".to_string()))
+        );
+        assert_eq!(parse_book_folder_name("12a_书名"), None);
+        assert_eq!(parse_book_folder_name("书名_123"), None);
     }
-    let failed = total.saturating_sub(ok);
-    Some((total, ok, failed))
 }
@@ -13,7 +13,8 @@ use std::io::{Read, Write};
 use std::panic::{self, AssertUnwindSafe};
 use std::path::{Path, PathBuf};
 use std::process::Command;
-use std::time::Duration;
+use std::sync::OnceLock;
+use std::time::{Duration, UNIX_EPOCH};
 
 use anyhow::{Context, Result, anyhow};
 use indicatif::{ProgressBar, ProgressStyle};
@@ -99,7 +100,7 @@ fn check_hotfix_and_apply_impl(current_version: &str) -> Result<SelfUpdateOutcom
     }
 
     if let Some(expected) = matched.sha256.as_deref() {
-        let self_hash = compute_file_sha256(&current_executable_path()?)?;
+        let self_hash = executable_sha256(&current_executable_path()?)?;
         if !eq_hash(&self_hash, expected) {
             info!(target: "self_update", "检测到热补丁（SHA256 不同），开始更新…");
             start_update(&matched)?;
@@ -171,8 +172,9 @@ fn check_for_updates_impl(current_version: &str, auto_yes: bool) -> Result<SelfU
                 warn!(target: "self_update", "无法读取用户输入，跳过升级");
                 return Ok(SelfUpdateOutcome::Skipped);
             }
-            let ans = input.trim().to_ascii_lowercase();
-            if !(ans.is_empty() || ans == "y" || ans == "yes") {
+            let ans = input.trim();
+            if !(ans.is_empty() || ans.eq_ignore_ascii_case("y") || ans.eq_ignore_ascii_case("yes"))
+            {
                 warn!(target: "self_update", "用户取消升级");
                 return Ok(SelfUpdateOutcome::Skipped);
             }
@@ -185,7 +187,7 @@ fn check_for_updates_impl(current_version: &str, auto_yes: bool) -> Result<SelfU
     info!(target: "self_update", "本地版本与最新相同，检查热补丁…");
 
     if let Some(expected) = matched.sha256.as_deref() {
-        let self_hash = compute_file_sha256(&current_executable_path()?)?;
+        let self_hash = executable_sha256(&current_executable_path()?)?;
         if !eq_hash(&self_hash, expected) {
             info!(target: "self_update", "检测到热补丁（SHA256 不同），开始更新…");
             start_update(&matched)?;
@@ -222,11 +224,18 @@ fn github_latest_release_url() -> String {
     format!("https://api.github.com/repos/{OWNER}/{REPO}/releases/latest")
 }
 
-fn build_http_client() -> Result<Client> {
-    Client::builder()
+/// 自更新流程共用的 HTTP Client：查询 release 与下载安装包复用同一连接池和 TLS 配置，
+/// 不必每一步都重新构建（下载请求单独覆盖超时）。
+fn shared_http_client() -> Result<Client> {
+    static CLIENT: OnceLock<Client> = OnceLock::new();
+    if let Some(client) = CLIENT.get() {
+        return Ok(client.clone());
+    }
+    let client = Client::builder()
         .timeout(Duration::from_secs(15))
         .build()
-        .context("init http client")
+        .context("init http client")?;
+    Ok(CLIENT.get_or_init(|| client).clone())
 }
 
 fn fetch_latest_release(client: &Client) -> Result<ReleaseInfo> {
@@ -280,7 +289,7 @@ fn detect_platform_keyword() -> Result<String> {
 }
 
 fn get_latest_release_asset() -> Result<MatchedReleaseAsset> {
-    let client = build_http_client()?;
+    let client = shared_http_client()?;
     let latest = fetch_latest_release(&client)?;
 
     let platform_key = detect_platform_keyword()?;
@@ -482,7 +491,7 @@ fn staged_path_next_to_target(target_exe: &Path) -> Result<PathBuf> {
 }
 
 fn download_and_verify(tmp_dir: &Path, matched: &MatchedReleaseAsset) -> Result<PathBuf> {
-    let client = build_http_client()?;
+    let client = shared_http_client()?;
     let url = &matched.download_url;
 
     let resp = client
@@ -560,10 +569,60 @@ fn download_and_verify(tmp_dir: &Path, matched: &MatchedReleaseAsset) -> Result<
     Ok(out_path)
 }
 
+/// 可执行文件哈希缓存，与 `.tnd_state.json` 同目录。
+const EXE_SHA256_CACHE_FILE: &str = ".tnd_exe_sha256";
+
 fn current_executable_path() -> Result<PathBuf> {
     std::env::current_exe().context("current_exe")
 }
 
+/// 当前可执行文件的 SHA256，带本地缓存。
+///
+/// 启动时的热更新检查在版本号相同时要对比哈希，而程序文件有几十 MB，每次启动都整读一遍
+/// 会拖慢冷启动。缓存按（路径, 大小, 修改时间）命中；热补丁替换文件后三者必有变化，会重新计算。
+/// 缓存与 config.yml / `.tnd_state.json` 同目录（用户自己的配置目录），不放在多用户共享的
+/// 临时目录，避免他人预置缓存条目骗过热补丁校验；Unix 下仅本用户可读写。
+fn executable_sha256(path: &Path) -> Result<String> {
+    let meta = fs::metadata(path).with_context(|| format!("stat {}", path.display()))?;
+    let mtime_ns = meta
+        .modified()
+        .ok()
+        .and_then(|t| t.duration_since(UNIX_EPOCH).ok())
+        .map_or(0, |d| d.as_nanos());
+    let key = format!("{}|{}|{}", path.display(), meta.len(), mtime_ns);
+    let cache_path = PathBuf::from(EXE_SHA256_CACHE_FILE);
+
+    if let Ok(text) = fs::read_to_string(&cache_path)
+        && let Some((cached_key, hash)) = text.split_once('\n')
+        && cached_key == key
+    {
+        return Ok(hash.trim().to_string());
+    }
+
+    let hash = compute_file_sha256(path)?;
+    let _ = write_private_file(&cache_path, format!("{key}\n{hash}").as_bytes());
+    Ok(hash)
+}
+
+/// 写入仅当前用户可读写的文件（Unix 0600；其他平台沿用用户目录的默认 ACL）。
+fn write_private_file(path: &Path, data: &[u8]) -> std::io::Result<()> {
+    let mut opts = fs::OpenOptions::new();
+    opts.write(true).create(true).truncate(true);
+    #[cfg(unix)]
+    {
+        use std::os::unix::fs::{OpenOptionsExt, PermissionsExt};
+        opts.mode(0o600);
+        let mut file = opts.open(path)?;
+        // 已存在的文件不受 mode() 影响，显式收紧权限。
+        file.set_permissions(fs::Permissions::from_mode(0o600))?;
+        file.write_all(data)
+    }
+    #[cfg(not(unix))]
+    {
+        opts.open(path)?.write_all(data)
+    }
+}
+
 fn compute_file_sha256(path: &Path) -> Result<String> {
     let mut file = fs::File::open(path).with_context(|| format!("open {}", path.display()))?;
     let mut hasher = Sha256::new();
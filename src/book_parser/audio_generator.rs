@@ -620,11 +620,7 @@ pub fn generate_audiobook(
                 .or_else(|| v.as_u64().map(|n| n.to_string()))
         });
         let Some(cid) = cid else { continue };
-        let stored = manager
-            .downloaded
-            .get(&cid)
-            .or_else(|| manager.downloaded.get(&cid.to_string()));
-        let Some((stored_title, stored_content)) = stored else {
+        let Some((stored_title, stored_content)) = manager.downloaded.get(&cid) else {
             continue;
         };
         let content = match stored_content.as_deref() {
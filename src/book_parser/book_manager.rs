@@ -5,6 +5,7 @@ use std::fs;
 use std::fs::OpenOptions;
 use std::io::{BufRead, BufReader, Write};
 use std::path::{Path, PathBuf};
+use std::time::{Duration, Instant};
 
 use serde_json::Value;
 use tracing::{debug, info};
@@ -43,17 +44,66 @@ pub struct BookManager {
     status_folder: PathBuf,
     status_file: PathBuf,
     status_folder_preexisting: bool,
+    /// 自上次写 status.json 以来的章节状态变更数（批量落盘用）。
+    unsaved_changes: usize,
+    last_status_save: Instant,
 }
 
 const RESUME_JOURNAL_FILE: &str = "downloaded_chapters.jsonl";
 
-#[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
+/// status.json 每次都是整份重写（含全部章节正文），代价随章节数增长；
+/// 下载过程中累计这么多次变更才落盘一次（正文已由追加日志实时保存，不怕中途退出）。
+const STATUS_SAVE_EVERY: usize = 50;
+/// 慢速下载时也至少按该间隔落盘，保证外部看到的进度不过于滞后。
+const STATUS_SAVE_INTERVAL: Duration = Duration::from_secs(2);
+
+#[derive(Debug, Clone, serde::Deserialize)]
 struct ResumeJournalRecord {
     id: String,
     title: String,
     content: String,
 }
 
+/// 续传日志的写出视图：借用章节字段直接序列化，不再为每章复制一份正文。
+#[derive(serde::Serialize)]
+struct ResumeJournalLine<'a> {
+    id: &'a str,
+    title: &'a str,
+    content: &'a str,
+}
+
+/// status.json 的写出视图：全部借用 `BookManager` 的字段直接序列化，
+/// 不再先把整份章节正文复制进一棵 `serde_json::Value`。
+/// 字段按字母序声明、章节按 ID 排序，输出与原先经由 `json!`（BTreeMap）时的顺序一致。
+#[derive(serde::Serialize)]
+struct StatusFileOut<'a> {
+    author: &'a str,
+    book_id: &'a str,
+    book_name: &'a str,
+    category: &'a Option<String>,
+    chapter_count: Option<usize>,
+    description: &'a str,
+    downloaded: SortedDownloaded<'a>,
+    end: bool,
+    finished: Option<bool>,
+    ignore_updates: bool,
+    read_count_text: &'a Option<String>,
+    score: Option<f32>,
+    tags: &'a str,
+    word_count: Option<usize>,
+}
+
+struct SortedDownloaded<'a>(&'a DownloadedMap);
+
+impl serde::Serialize for SortedDownloaded<'_> {
+    fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
+        let mut entries: Vec<_> = self.0.iter().collect();
+        entries.sort_unstable_by(|a, b| a.0.cmp(b.0));
+        // (title, content) 元组序列化为 [title, content]，content 缺失时为 null。
+        serializer.collect_map(entries)
+    }
+}
+
 impl BookManager {
     pub fn new(mut config: Config, book_id: &str, book_name: &str) -> std::io::Result<Self> {
         let target = match config.status_folder_path(book_name, book_id, None) {
@@ -94,6 +144,8 @@ impl BookManager {
             status_folder: target,
             status_file,
             status_folder_preexisting,
+            unsaved_changes: 0,
+            last_status_save: Instant::now(),
         })
     }
 
@@ -259,6 +311,7 @@ impl BookManager {
             (title.to_string(), Some(content.to_string())),
         );
         self.has_download_activity = true;
+        self.unsaved_changes += 1;
     }
 
     /// 追加式持久化单章内容（JSONL）。用于断点续传：即使进程突然退出，也能恢复已下载章节内容。
@@ -267,37 +320,47 @@ impl BookManager {
             return;
         }
 
-        let record = ResumeJournalRecord {
-            id: chapter_id.to_string(),
-            title: title.to_string(),
-            content: content.to_string(),
+        // 整行（含换行）先序列化进一个缓冲区，落盘只需一次 write。
+        let mut line = match serde_json::to_vec(&ResumeJournalLine {
+            id: chapter_id,
+            title,
+            content,
+        }) {
+            Ok(v) => v,
+            Err(e) => {
+                debug!(target: "book_manager", error = ?e, "serialize resume journal failed");
+                return;
+            }
         };
+        line.push(b'\n');
 
-        if let Err(e) = fs::create_dir_all(&self.status_folder) {
-            debug!(target: "book_manager", error = ?e, "create status folder failed (resume journal)");
-            return;
-        }
-
+        // 状态目录在下载期间几乎总是已存在：先直接打开，只有目录缺失时才创建后重试，
+        // 省掉每章一次 create_dir_all。
         let path = self.resume_journal_path();
-        let mut file = match OpenOptions::new().create(true).append(true).open(&path) {
+        let open = || OpenOptions::new().create(true).append(true).open(&path);
+        let mut file = match open() {
             Ok(f) => f,
-            Err(e) => {
-                debug!(target: "book_manager", error = ?e, "open resume journal failed");
-                return;
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+                if let Err(e) = fs::create_dir_all(&self.status_folder) {
+                    debug!(target: "book_manager", error = ?e, "create status folder failed (resume journal)");
+                    return;
+                }
+                match open() {
+                    Ok(f) => f,
+                    Err(e) => {
+                        debug!(target: "book_manager", error = ?e, "open resume journal failed");
+                        return;
+                    }
+                }
             }
-        };
-        let line = match serde_json::to_string(&record) {
-            Ok(s) => s,
             Err(e) => {
-                debug!(target: "book_manager", error = ?e, "serialize resume journal failed");
+                debug!(target: "book_manager", error = ?e, "open resume journal failed");
                 return;
             }
         };
-        if let Err(e) = writeln!(file, "{line}") {
+        if let Err(e) = file.write_all(&line) {
             debug!(target: "book_manager", error = ?e, "write resume journal failed");
-            return;
         }
-        let _ = file.flush();
     }
 
     pub fn save_error_chapter(&mut self, chapter_id: &str, title: &str) {
@@ -305,25 +368,43 @@ impl BookManager {
         self.downloaded
             .insert(chapter_id.to_string(), (title.to_string(), None));
         self.has_download_activity = true;
+        self.unsaved_changes += 1;
+    }
+
+    /// 一次遍历统计给定章节中已成功/已失败的数量（未尝试的章节两边都不计）。
+    pub fn count_chapter_states<'a>(
+        &self,
+        chapter_ids: impl IntoIterator<Item = &'a str>,
+    ) -> (usize, usize) {
+        let mut ok = 0usize;
+        let mut failed = 0usize;
+        for id in chapter_ids {
+            match self.downloaded.get(id) {
+                Some((_, Some(_))) => ok += 1,
+                Some((_, None)) => failed += 1,
+                None => {}
+            }
+        }
+        (ok, failed)
     }
 
     pub fn save_download_status(&self) {
-        let data = serde_json::json!({
-            "book_id": self.book_id,
-            "book_name": self.book_name,
-            "author": self.author,
-            "tags": self.tags,
-            "description": self.description,
-            "finished": self.finished,
-            "end": self.end,
-            "chapter_count": self.chapter_count,
-            "word_count": self.word_count,
-            "score": self.score,
-            "read_count_text": self.read_count_text,
-            "category": self.category,
-            "ignore_updates": self.ignore_updates,
-            "downloaded": self.downloaded_as_json(),
-        });
+        let data = StatusFileOut {
+            author: &self.author,
+            book_id: &self.book_id,
+            book_name: &self.book_name,
+            category: &self.category,
+            chapter_count: self.chapter_count,
+            description: &self.description,
+            downloaded: SortedDownloaded(&self.downloaded),
+            end: self.end,
+            finished: self.finished,
+            ignore_updates: self.ignore_updates,
+            read_count_text: &self.read_count_text,
+            score: self.score,
+            tags: &self.tags,
+            word_count: self.word_count,
+        };
 
         if let Err(e) = fs::create_dir_all(&self.status_folder) {
             debug!(error = ?e, "create status folder failed");
@@ -331,13 +412,30 @@ impl BookManager {
         }
         match fs::write(
             &self.status_file,
-            serde_json::to_string_pretty(&data).unwrap_or_default(),
+            serde_json::to_vec_pretty(&data).unwrap_or_default(),
         ) {
             Ok(_) => {}
             Err(e) => debug!(target: "book_manager", error = ?e, "write status.json failed"),
         }
     }
 
+    /// 下载过程中使用的批量落盘：变更累计到 [`STATUS_SAVE_EVERY`] 条或距上次写入超过
+    /// [`STATUS_SAVE_INTERVAL`] 时才真正写 status.json。下载阶段结束时需再调用一次
+    /// [`Self::save_download_status`] 确保最终状态落盘。
+    pub fn save_download_status_batched(&mut self) {
+        if self.unsaved_changes == 0 {
+            return;
+        }
+        if self.unsaved_changes < STATUS_SAVE_EVERY
+            && self.last_status_save.elapsed() < STATUS_SAVE_INTERVAL
+        {
+            return;
+        }
+        self.save_download_status();
+        self.unsaved_changes = 0;
+        self.last_status_save = Instant::now();
+    }
+
     /// 切换忽略更新状态并保存
     pub fn toggle_ignore_updates(&mut self) -> bool {
         self.ignore_updates = !self.ignore_updates;
@@ -425,23 +523,9 @@ impl BookManager {
         Ok(())
     }
 
-    fn downloaded_as_json(&self) -> serde_json::Map<String, Value> {
-        self.downloaded
-            .iter()
-            .map(|(k, (title, content))| {
-                let arr = if let Some(c) = content {
-                    serde_json::json!([title, c])
-                } else {
-                    serde_json::json!([title, Value::Null])
-                };
-                (k.clone(), arr)
-            })
-            .collect()
-    }
-
     fn read_json_file(&self, path: &Path) -> Option<Value> {
-        let content = fs::read_to_string(path).ok()?;
-        serde_json::from_str(&content).ok()
+        let content = fs::read(path).ok()?;
+        serde_json::from_slice(&content).ok()
     }
 
     fn read_legacy_file(&self, book_id: &str) -> Option<Value> {
@@ -971,7 +971,7 @@ fn extract_volume_to_chapter_ids(
         title: &str,
         chapter_id: &str,
         known_chapter_ids: &HashSet<String>,
-        idx_by_title: &mut HashMap<String, usize>,
+        idx_by_title: &mut HashMap<String, (usize, HashSet<String>)>,
         out: &mut Vec<(String, Vec<String>)>,
     ) {
         let t = title.trim();
@@ -981,20 +981,21 @@ fn extract_volume_to_chapter_ids(
         if !known_chapter_ids.contains(chapter_id) {
             return;
         }
-        let i = if let Some(i) = idx_by_title.get(t) {
-            *i
-        } else {
-            let i = out.len();
+        if !idx_by_title.contains_key(t) {
             out.push((t.to_string(), Vec::new()));
-            idx_by_title.insert(t.to_string(), i);
-            i
+            idx_by_title.insert(t.to_string(), (out.len() - 1, HashSet::new()));
+        }
+        let Some((i, seen)) = idx_by_title.get_mut(t) else {
+            return;
         };
 
-        let ids = &mut out[i].1;
+        let ids = &mut out[*i].1;
         if ids.last().is_some_and(|last| last == chapter_id) {
             return;
         }
-        if !ids.contains(&chapter_id.to_string()) {
+        // 同一章节会在目录的多个位置重复出现：用集合判重，不再逐章线性扫描整卷。
+        if !seen.contains(chapter_id) {
+            seen.insert(chapter_id.to_string());
             ids.push(chapter_id.to_string());
         }
     }
@@ -1003,7 +1004,7 @@ fn extract_volume_to_chapter_ids(
         v: &Value,
         current_volume: Option<&str>,
         known_chapter_ids: &HashSet<String>,
-        idx_by_title: &mut HashMap<String, usize>,
+        idx_by_title: &mut HashMap<String, (usize, HashSet<String>)>,
         out: &mut Vec<(String, Vec<String>)>,
     ) {
         match v {
@@ -1074,7 +1075,8 @@ fn extract_volume_to_chapter_ids(
     }
 
     let mut out: Vec<(String, Vec<String>)> = Vec::new();
-    let mut idx_by_title: HashMap<String, usize> = HashMap::new();
+    // 卷名 -> (在 out 中的下标, 该卷已收录的章节 ID)，卷内去重走集合查询。
+    let mut idx_by_title: HashMap<String, (usize, HashSet<String>)> = HashMap::new();
 
     if let Some(items) = directory_raw
         .get("item_data_list")
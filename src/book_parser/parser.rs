@@ -2,6 +2,7 @@
 
 use regex::Regex;
 use serde_json::Value;
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::sync::OnceLock;
 
@@ -60,6 +61,16 @@ fn re_br_normalize() -> &'static Regex {
     R.get_or_init(|| Regex::new(r"(?i)<br\s*/?>").unwrap())
 }
 
+fn re_decimal_entity() -> &'static Regex {
+    static R: OnceLock<Regex> = OnceLock::new();
+    R.get_or_init(|| Regex::new(r"&#(\d+);").unwrap())
+}
+
+fn re_hex_entity() -> &'static Regex {
+    static R: OnceLock<Regex> = OnceLock::new();
+    R.get_or_init(|| Regex::new(r"&#[xX]([0-9a-fA-F]+);").unwrap())
+}
+
 pub struct ContentParser;
 
 impl ContentParser {
@@ -283,18 +294,12 @@ impl ContentParser {
             return s.to_string();
         }
 
-        use std::sync::OnceLock;
-        static RE_DECIMAL: OnceLock<Regex> = OnceLock::new();
-        static RE_HEX: OnceLock<Regex> = OnceLock::new();
-
-        let re_decimal = RE_DECIMAL.get_or_init(|| Regex::new(r"&#(\d+);").unwrap());
-        let re_hex = RE_HEX.get_or_init(|| Regex::new(r"&#[xX]([0-9a-fA-F]+);").unwrap());
-
         let mut result = s.to_string();
 
         // Decode decimal numeric entities (&#NNN;)
-        result = re_decimal
-            .replace_all(&result, |caps: &regex::Captures| {
+        // replace_all 无匹配时返回借用，只有真正替换过才接管新字符串，省掉一次整章拷贝。
+        if let Cow::Owned(decoded) =
+            re_decimal_entity().replace_all(&result, |caps: &regex::Captures| {
                 if let Some(num_str) = caps.get(1)
                     && let Ok(code_point) = num_str.as_str().parse::<u32>()
                 {
@@ -307,11 +312,13 @@ impl ContentParser {
                 }
                 caps[0].to_string() // Return original if parsing fails
             })
-            .to_string();
+        {
+            result = decoded;
+        }
 
         // Decode hexadecimal numeric entities (&#xHH; or &#XHH;)
-        result = re_hex
-            .replace_all(&result, |caps: &regex::Captures| {
+        if let Cow::Owned(decoded) =
+            re_hex_entity().replace_all(&result, |caps: &regex::Captures| {
                 if let Some(hex_str) = caps.get(1)
                     && let Ok(code_point) = u32::from_str_radix(hex_str.as_str(), 16)
                 {
@@ -324,7 +331,9 @@ impl ContentParser {
                 }
                 caps[0].to_string() // Return original if parsing fails
             })
-            .to_string();
+        {
+            result = decoded;
+        }
 
         // Then decode named entities
         result
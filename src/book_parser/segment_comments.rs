@@ -3,7 +3,9 @@
 //! 包含段落评论的缓存加载、评论媒体（头像/图片）预取、评论页 XHTML 渲染。
 
 #[cfg(feature = "official-api")]
-use std::collections::HashSet;
+use std::collections::{HashMap, HashSet};
+#[cfg(feature = "official-api")]
+use std::fmt::Write as _;
 #[cfg(feature = "official-api")]
 use std::fs;
 #[cfg(feature = "official-api")]
@@ -45,6 +47,14 @@ pub(crate) fn load_segment_comments_cache(
 
 // ── 评论媒体预取 ────────────────────────────────────────────────
 
+/// 与 render_one_para 的跳过条件一致：正文为空的评论不会渲染，其头像/图片也无需下载或入书。
+#[cfg(feature = "official-api")]
+fn has_rendered_text(text: &str) -> bool {
+    !segment_utils::convert_bracket_emojis(text)
+        .trim()
+        .is_empty()
+}
+
 #[cfg(feature = "official-api")]
 pub(crate) fn prefetch_comment_media(
     cfg: &crate::base_system::context::Config,
@@ -60,6 +70,9 @@ pub(crate) fn prefetch_comment_media(
 
     for (_para_idx, resp) in per_para {
         for item in &resp.reviews {
+            if !has_rendered_text(&item.text) {
+                continue;
+            }
             if cfg.download_comment_avatars
                 && let Some(url) = item.user.avatar.as_deref()
             {
@@ -121,168 +134,305 @@ pub(crate) fn prefetch_comment_media(
 
 // ── 段评页面渲染 ────────────────────────────────────────────────
 
+/// 段落数超过该阈值时才启用多线程渲染，小章节直接串行以免线程创建开销。
 #[cfg(feature = "official-api")]
-#[allow(clippy::too_many_arguments)]
-pub(crate) fn render_segment_comment_page(
-    chapter_title: &str,
-    chapter_file: &str,
-    chapter_html: &str,
-    per_para: &[(i32, tomato_novel_official_api::ReviewResponse)],
+const PARALLEL_RENDER_THRESHOLD: usize = 32;
+
+#[cfg(feature = "official-api")]
+const MAX_RENDER_WORKERS: usize = 8;
+
+/// 单个段落评论块的预估字节数，用于预分配渲染缓冲区。
+#[cfg(feature = "official-api")]
+const PARA_HTML_CAPACITY_HINT: usize = 2048;
+
+/// 渲染单个段落所需的只读上下文。
+#[cfg(feature = "official-api")]
+struct ParaRenderCtx<'a> {
+    chapter_file: &'a str,
+    chapter_html: &'a str,
+    cfg: &'a crate::base_system::context::Config,
+    /// 媒体 URL -> EPUB 内资源路径（仅包含已成功加入 EPUB 的资源）。
+    media: &'a HashMap<String, String>,
+}
+
+/// 将评论媒体写入 EPUB 资源，返回资源路径；失败时返回 None。
+#[cfg(feature = "official-api")]
+fn add_media_resource(
     cfg: &crate::base_system::context::Config,
+    url: &str,
+    kind: &str,
     resources_added: &mut HashSet<String>,
     images_dir: &Path,
     epub: &mut EpubGenerator,
-) -> anyhow::Result<String> {
-    let mut avatar_used = 0usize;
-    let mut image_used = 0usize;
-
-    let mut html = String::new();
-    html.push_str(&format!("<h2>{} - 段评</h2>", escape_html(chapter_title)));
+) -> Option<String> {
+    let Ok(Some((path, mime, ext))) = ensure_cached_image(cfg, url, images_dir) else {
+        debug!(target: "segment", url = %url, kind, "ensure_cached_image failed/empty");
+        return None;
+    };
+    let hash = sha1_hex(url);
+    let resource_path = format!("images/{}{}", hash, ext);
+    if !resources_added.contains(&resource_path)
+        && let Ok(bytes) = fs::read(&path)
+        && epub.add_resource_bytes(&resource_path, bytes, mime).is_ok()
+    {
+        resources_added.insert(resource_path.clone());
+    }
+    if resources_added.contains(&resource_path) {
+        Some(resource_path)
+    } else {
+        debug!(target: "segment", url = %url, kind, "media not added to epub resources (read/add_resource failed)");
+        None
+    }
+}
 
-    for (para_idx, resp) in per_para {
-        let idx_usize = (*para_idx).max(0) as usize;
-        let snippet = resp
-            .meta
-            .para_content
-            .as_deref()
-            .map(|s| s.trim().to_string())
-            .filter(|s| !s.is_empty())
-            .unwrap_or_else(|| segment_utils::extract_para_snippet(chapter_html, idx_usize));
-        let snippet = segment_utils::convert_bracket_emojis(&snippet);
+/// 预先（串行）解析所有头像/图片到 EPUB 资源路径，使后续段落渲染不再需要可变状态。
+#[cfg(feature = "official-api")]
+fn resolve_comment_media(
+    per_para: &[(i32, tomato_novel_official_api::ReviewResponse)],
+    cfg: &crate::base_system::context::Config,
+    resources_added: &mut HashSet<String>,
+    images_dir: &Path,
+    epub: &mut EpubGenerator,
+) -> HashMap<String, String> {
+    let mut media = HashMap::new();
+    if !(cfg.download_comment_avatars || cfg.download_comment_images) {
+        return media;
+    }
 
-        let disp_idx = idx_usize + 1;
-        let cjk_idx = segment_utils::to_cjk_numeral(disp_idx as i32);
-        let title_html = if !snippet.trim().is_empty() {
-            format!(
-                "<span class=\"para-title\"><span class=\"para-index\">{}、</span> <span class=\"para-src\">&quot;{}&quot;</span></span>",
-                escape_html(&cjk_idx),
-                escape_html(snippet.trim())
-            )
-        } else {
-            format!(
-                "<span class=\"para-title\">第 {} 段</span>",
-                escape_html(&disp_idx.to_string())
-            )
-        };
-        html.push_str(&format!(
-            "<h3 id=\"para-{}\">{}</h3>",
-            idx_usize, title_html
-        ));
-        html.push_str(&format!(
-            "<div class=\"back-to-chapter\"><a href=\"{}#p-{}\">↩ 回到正文</a></div>",
-            escape_html(chapter_file),
-            idx_usize
-        ));
-
-        html.push_str("<ol>");
+    let mut tried: HashSet<&str> = HashSet::new();
+    for (_para_idx, resp) in per_para {
         for item in &resp.reviews {
-            let user = item
-                .user
-                .name
-                .as_deref()
-                .filter(|s| !s.trim().is_empty())
-                .unwrap_or("匿名");
-            let text = segment_utils::convert_bracket_emojis(&item.text);
-            if text.trim().is_empty() {
+            if !has_rendered_text(&item.text) {
                 continue;
             }
-            let text = escape_html(text.trim());
-
-            let mut avatar_html = String::new();
             if cfg.download_comment_avatars
                 && let Some(url) = item.user.avatar.as_deref()
+                && tried.insert(url)
+                && let Some(res) =
+                    add_media_resource(cfg, url, "avatar", resources_added, images_dir, epub)
             {
-                if let Ok(Some((path, mime, ext))) = ensure_cached_image(cfg, url, images_dir) {
-                    let hash = sha1_hex(url);
-                    let resource_path = format!("images/{}{}", hash, ext);
-                    if !resources_added.contains(&resource_path)
-                        && let Ok(bytes) = fs::read(&path)
-                        && epub.add_resource_bytes(&resource_path, bytes, mime).is_ok()
-                    {
-                        resources_added.insert(resource_path.clone());
-                    }
-                    if resources_added.contains(&resource_path) {
-                        avatar_html = format!(
-                            "<img class=\"avatar\" alt=\"\" src=\"{}\"/>",
-                            escape_html(&resource_path)
-                        );
-                        avatar_used += 1;
-                    } else {
-                        debug!(target: "segment", url = %url, "avatar not added to epub resources (read/add_resource failed)");
-                    }
-                } else {
-                    debug!(target: "segment", url = %url, "avatar ensure_cached_image failed/empty");
-                }
+                media.insert(url.to_string(), res);
             }
-
-            let mut images_html = String::new();
             if cfg.download_comment_images {
-                let mut imgs = Vec::new();
                 for img in &item.images {
                     let url = img.url.trim();
-                    if url.is_empty() {
+                    if url.is_empty() || !tried.insert(url) {
                         continue;
                     }
-                    if let Ok(Some((path, mime, ext))) = ensure_cached_image(cfg, url, images_dir) {
-                        let hash = sha1_hex(url);
-                        let resource_path = format!("images/{}{}", hash, ext);
-                        if !resources_added.contains(&resource_path)
-                            && let Ok(bytes) = fs::read(&path)
-                            && epub.add_resource_bytes(&resource_path, bytes, mime).is_ok()
-                        {
-                            resources_added.insert(resource_path.clone());
-                        }
-                        if resources_added.contains(&resource_path) {
-                            imgs.push(format!(
-                                "<img alt=\"\" src=\"{}\"/>",
-                                escape_html(&resource_path)
-                            ));
-                            image_used += 1;
-                        } else {
-                            debug!(target: "segment", url = %url, "comment image not added to epub resources (read/add_resource failed)");
-                        }
-                    } else {
-                        debug!(target: "segment", url = %url, "comment image ensure_cached_image failed/empty");
+                    if let Some(res) =
+                        add_media_resource(cfg, url, "image", resources_added, images_dir, epub)
+                    {
+                        media.insert(url.to_string(), res);
                     }
                 }
-                if !imgs.is_empty() {
-                    images_html = format!("<div class=\"seg-images\">{}</div>", imgs.join(""));
-                }
             }
+        }
+    }
+    media
+}
 
-            let mut meta_line = String::new();
-            meta_line.push_str("<small class=\"seg-meta\">");
-            meta_line.push_str(&avatar_html);
-            meta_line.push_str(&format!("作者：{}", escape_html(user)));
+/// 将单个段落的评论块直接写入 `out`（纯函数），返回 (头像数, 图片数)。
+#[cfg(feature = "official-api")]
+fn render_one_para(
+    para_idx: i32,
+    resp: &tomato_novel_official_api::ReviewResponse,
+    ctx: &ParaRenderCtx<'_>,
+    out: &mut String,
+) -> (usize, usize) {
+    let cfg = ctx.cfg;
+    let mut avatar_used = 0usize;
+    let mut image_used = 0usize;
+
+    let idx_usize = para_idx.max(0) as usize;
+    let snippet = resp
+        .meta
+        .para_content
+        .as_deref()
+        .map(|s| s.trim().to_string())
+        .filter(|s| !s.is_empty())
+        .unwrap_or_else(|| segment_utils::extract_para_snippet(ctx.chapter_html, idx_usize));
+    let snippet = segment_utils::convert_bracket_emojis(&snippet);
 
-            if let Some(ts) = item.created_ts {
-                let mut t = ts;
-                if t > 1_000_000_000_000 {
-                    t /= 1000;
+    let disp_idx = idx_usize + 1;
+    let _ = write!(out, "<h3 id=\"para-{}\">", idx_usize);
+    if !snippet.trim().is_empty() {
+        let cjk_idx = segment_utils::to_cjk_numeral(disp_idx as i32);
+        let _ = write!(
+            out,
+            "<span class=\"para-title\"><span class=\"para-index\">{}、</span> <span class=\"para-src\">&quot;{}&quot;</span></span>",
+            escape_html(&cjk_idx),
+            escape_html(snippet.trim())
+        );
+    } else {
+        let _ = write!(out, "<span class=\"para-title\">第 {} 段</span>", disp_idx);
+    }
+    let _ = write!(
+        out,
+        "</h3><div class=\"back-to-chapter\"><a href=\"{}#p-{}\">↩ 回到正文</a></div>",
+        escape_html(ctx.chapter_file),
+        idx_usize
+    );
+
+    out.push_str("<ol>");
+    for item in &resp.reviews {
+        let user = item
+            .user
+            .name
+            .as_deref()
+            .filter(|s| !s.trim().is_empty())
+            .unwrap_or("匿名");
+        let text = segment_utils::convert_bracket_emojis(&item.text);
+        if text.trim().is_empty() {
+            continue;
+        }
+
+        let _ = write!(
+            out,
+            "<li class=\"seg-item\"><p>{}</p>",
+            escape_html(text.trim())
+        );
+
+        if cfg.download_comment_images {
+            let mut opened = false;
+            for img in &item.images {
+                let url = img.url.trim();
+                if url.is_empty() {
+                    continue;
                 }
-                if t > 0 {
-                    meta_line.push_str(&format!(" | 时间：{}", escape_html(&t.to_string())));
+                if let Some(resource_path) = ctx.media.get(url) {
+                    if !opened {
+                        out.push_str("<div class=\"seg-images\">");
+                        opened = true;
+                    }
+                    let _ = write!(
+                        out,
+                        "<img alt=\"\" src=\"{}\"/>",
+                        escape_html(resource_path)
+                    );
+                    image_used += 1;
                 }
             }
-            meta_line.push_str(&format!(" | 赞：{}", item.digg_count));
-            meta_line.push_str("</small>");
+            if opened {
+                out.push_str("</div>");
+            }
+        }
 
-            html.push_str("<li class=\"seg-item\">");
-            html.push_str(&format!("<p>{}</p>", text));
-            if !images_html.is_empty() {
-                html.push_str(&images_html);
+        out.push_str("<p><small class=\"seg-meta\">");
+        if cfg.download_comment_avatars
+            && let Some(url) = item.user.avatar.as_deref()
+            && let Some(resource_path) = ctx.media.get(url)
+        {
+            let _ = write!(
+                out,
+                "<img class=\"avatar\" alt=\"\" src=\"{}\"/>",
+                escape_html(resource_path)
+            );
+            avatar_used += 1;
+        }
+        let _ = write!(out, "作者：{}", escape_html(user));
+
+        if let Some(ts) = item.created_ts {
+            let mut t = ts;
+            if t > 1_000_000_000_000 {
+                t /= 1000;
+            }
+            if t > 0 {
+                let _ = write!(out, " | 时间：{}", t);
             }
-            html.push_str(&format!("<p>{}</p>", meta_line));
-            html.push_str("</li>");
         }
-        html.push_str("</ol>");
+        let _ = write!(out, " | 赞：{}</small></p></li>", item.digg_count);
+    }
+    out.push_str("</ol>");
+
+    (avatar_used, image_used)
+}
+
+/// 将一段连续的段落渲染进同一个缓冲区，返回 (html, 头像数, 图片数)。
+#[cfg(feature = "official-api")]
+fn render_para_chunk(
+    chunk: &[(i32, tomato_novel_official_api::ReviewResponse)],
+    ctx: &ParaRenderCtx<'_>,
+) -> (String, usize, usize) {
+    let mut html = String::with_capacity(chunk.len() * PARA_HTML_CAPACITY_HINT);
+    let mut avatar_used = 0usize;
+    let mut image_used = 0usize;
+    for (para_idx, resp) in chunk {
+        let (avatars, images) = render_one_para(*para_idx, resp, ctx, &mut html);
+        avatar_used += avatars;
+        image_used += images;
+    }
+    (html, avatar_used, image_used)
+}
+
+/// 按原顺序渲染所有段落；段落较多时分块交给多个线程并行渲染。
+#[cfg(feature = "official-api")]
+fn render_all_paras(
+    per_para: &[(i32, tomato_novel_official_api::ReviewResponse)],
+    ctx: &ParaRenderCtx<'_>,
+) -> Vec<(String, usize, usize)> {
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(MAX_RENDER_WORKERS);
+    if per_para.len() <= PARALLEL_RENDER_THRESHOLD || workers <= 1 {
+        return vec![render_para_chunk(per_para, ctx)];
+    }
+
+    let chunk_size = per_para.len().div_ceil(workers);
+    std::thread::scope(|s| {
+        let handles: Vec<_> = per_para
+            .chunks(chunk_size)
+            .map(|chunk| s.spawn(move || render_para_chunk(chunk, ctx)))
+            .collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().unwrap_or_else(|e| std::panic::resume_unwind(e)))
+            .collect()
+    })
+}
+
+#[cfg(feature = "official-api")]
+#[allow(clippy::too_many_arguments)]
+pub(crate) fn render_segment_comment_page(
+    chapter_title: &str,
+    chapter_file: &str,
+    chapter_html: &str,
+    per_para: &[(i32, tomato_novel_official_api::ReviewResponse)],
+    cfg: &crate::base_system::context::Config,
+    resources_added: &mut HashSet<String>,
+    images_dir: &Path,
+    epub: &mut EpubGenerator,
+) -> anyhow::Result<String> {
+    // 媒体资源需要写入 EPUB（可变状态），先串行处理；之后各段落渲染互不依赖。
+    let media = resolve_comment_media(per_para, cfg, resources_added, images_dir, epub);
+    let ctx = ParaRenderCtx {
+        chapter_file,
+        chapter_html,
+        cfg,
+        media: &media,
+    };
+
+    let parts = render_all_paras(per_para, &ctx);
+    let body_len: usize = parts.iter().map(|(part, _, _)| part.len()).sum();
+
+    // Rust 字符串本身即 UTF-8，直接在一个预分配的缓冲区里拼接，避免逐段 format! 产生临时字符串。
+    let mut html = String::with_capacity(body_len + chapter_title.len() + 256);
+    let _ = write!(html, "<h2>{} - 段评</h2>", escape_html(chapter_title));
+
+    let mut avatar_used = 0usize;
+    let mut image_used = 0usize;
+    for (part, avatars, images) in parts {
+        html.push_str(&part);
+        avatar_used += avatars;
+        image_used += images;
     }
 
     let top_n_cfg = cfg.segment_comments_top_n.max(1);
-    html.push_str(&format!(
+    let _ = write!(
+        html,
         "<p><small>仅展示每段前 {} 条评论（若有），实际总数以接口为准。</small></p>",
         top_n_cfg
-    ));
+    );
 
     info!(
         target: "segment",
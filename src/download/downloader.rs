@@ -3,6 +3,8 @@
 //! 负责章节批量下载、保存与断点续传、finalize 等核心编排链路。
 //! 具体子模块职责参见 `mod.rs`。
 
+#[cfg(feature = "official-api")]
+use std::collections::HashMap;
 use std::collections::HashSet;
 use std::path::Path;
 use std::sync::Arc;
@@ -20,17 +22,25 @@ use tracing::{debug, error, info, warn};
 use crate::base_system::book_paths;
 use crate::base_system::context::Config;
 #[cfg(feature = "official-api")]
-use crate::base_system::cooldown_retry::fetch_with_cooldown_retry;
+use crate::base_system::cooldown_retry::{
+    fetch_with_cooldown_retry, note_cooldown, wait_cooldown_gate,
+};
 use crate::base_system::download_history::{DownloadHistoryRecord, append_download_history};
+use crate::base_system::logging;
 use crate::book_parser::book_manager::BookManager;
 use crate::book_parser::finalize_utils;
+#[cfg(feature = "official-api")]
 use crate::book_parser::parser::ContentParser;
 
+#[cfg(feature = "official-api")]
+use super::models::join_chapter_ids;
 use super::progress::{make_reporter, segment_enabled};
 use super::segment_pool::{
-    SegmentCommentPool, count_segment_comment_cache_files, extract_item_version_map,
+    SegmentCommentPool, cached_segment_comment_ids, extract_item_version_map,
+};
+use super::third_party::{
+    ParsedContents, build_endpoint_pool, fetch_group_third_party, validate_endpoints,
 };
-use super::third_party::{fetch_group_third_party, validate_endpoints};
 
 #[cfg(feature = "official-api")]
 use tomato_novel_official_api::{ContentFetchReport, FanqieClient};
@@ -44,7 +54,7 @@ pub use super::models::{
     SavePhase,
 };
 pub(crate) use super::plan::apply_range;
-pub use super::plan::prepare_download_plan;
+pub use super::plan::{prepare_download_plan, prepare_download_plan_uncached};
 pub(crate) use super::progress::ProgressReporter;
 
 // ── ChapterDownloader（官方 API 批量下载）──────────────────────
@@ -81,6 +91,17 @@ struct GroupFetchOutcome {
     deferred: Vec<DeferredChapter>,
 }
 
+#[cfg(feature = "official-api")]
+impl GroupFetchOutcome {
+    /// 按章节 ID 索引延后章节，保存循环内 O(1) 查询，替代逐章线性 find。
+    fn deferred_by_id(&self) -> HashMap<&str, &DeferredChapter> {
+        self.deferred
+            .iter()
+            .map(|item| (item.chapter.id.as_str(), item))
+            .collect()
+    }
+}
+
 #[cfg(feature = "official-api")]
 #[derive(Debug)]
 struct ResolvedDeferredChapter {
@@ -189,12 +210,9 @@ impl ChapterDownloader {
                 };
 
                 let parsed = ContentParser::extract_api_content(&outcome.value, &self.config);
+                let deferred_by_id = outcome.deferred_by_id();
                 for ch in &outcome.group {
-                    if let Some(deferred) = outcome
-                        .deferred
-                        .iter()
-                        .find(|item| item.chapter.id == ch.id)
-                    {
+                    if let Some(&deferred) = deferred_by_id.get(ch.id.as_str()) {
                         deferred_retry.push(deferred.clone());
                         continue;
                     }
@@ -252,7 +270,7 @@ impl ChapterDownloader {
                 }
                 progress.inc_group();
 
-                manager.save_download_status();
+                manager.save_download_status_batched();
                 let done_groups = (group_idx + 1) as u64;
                 let remaining_groups = total_groups.saturating_sub(done_groups);
                 info!(target: "download", done = done_groups, remaining = remaining_groups, "下载完成 {} 组 剩 {} 组", done_groups, remaining_groups);
@@ -267,7 +285,9 @@ impl ChapterDownloader {
             }
             drop(tx_jobs);
 
-            for _ in 0..worker_count {
+            // 并发上限取 max_workers 与组数的较小值：组数更少时多出的线程只会空等，
+            // 却仍要各自初始化一个 FanqieClient。
+            for _ in 0..worker_count.min(groups.len()) {
                 let rx = rx_jobs.clone();
                 let tx = tx_res.clone();
                 let cfg = self.config.clone();
@@ -281,6 +301,7 @@ impl ChapterDownloader {
                             return;
                         }
                     };
+                    let epub_mode = cfg.novel_format == "epub";
                     for group in rx.iter() {
                         if cancel
                             .as_ref()
@@ -290,7 +311,6 @@ impl ChapterDownloader {
                             let _ = tx.send(Err(anyhow!("用户停止下载")));
                             return;
                         }
-                        let epub_mode = cfg.novel_format == "epub";
                         let value = fetch_group_best_effort(
                             &client,
                             &group,
@@ -316,50 +336,61 @@ impl ChapterDownloader {
             drop(tx_res);
 
             let mut done_groups: u64 = 0;
-            for res in rx_res.iter() {
+            for first in rx_res.iter() {
                 if cancel.map(|c| c.load(Ordering::Relaxed)).unwrap_or(false) {
                     return Err(anyhow!("用户停止下载"));
                 }
 
-                let outcome = res?;
+                // 阻塞等到一组后顺带取走其余已就绪的组，整批只上报进度/落盘一次。
+                let mut batch_groups = 0usize;
+                let mut batch_saved = 0usize;
+                // 出错时先把本批已落盘的组计入进度/状态，再向上返回错误。
+                let mut batch_err = None;
+                for res in std::iter::once(first).chain(rx_res.try_iter()) {
+                    let outcome = match res {
+                        Ok(outcome) => outcome,
+                        Err(e) => {
+                            batch_err = Some(e);
+                            break;
+                        }
+                    };
 
-                let parsed = ContentParser::extract_api_content(&outcome.value, &self.config);
-                for ch in &outcome.group {
-                    if let Some(deferred) = outcome
-                        .deferred
-                        .iter()
-                        .find(|item| item.chapter.id == ch.id)
-                    {
-                        deferred_retry.push(deferred.clone());
-                        continue;
-                    }
+                    let parsed = ContentParser::extract_api_content(&outcome.value, &self.config);
+                    let deferred_by_id = outcome.deferred_by_id();
+                    for ch in &outcome.group {
+                        if let Some(&deferred) = deferred_by_id.get(ch.id.as_str()) {
+                            deferred_retry.push(deferred.clone());
+                            continue;
+                        }
 
-                    match parsed.get(&ch.id) {
-                        Some((content, title)) if !content.is_empty() => {
-                            // 缓存统一保存为 XHTML 格式
-                            let cleaned = extract_body_fragment(content);
-                            manager.save_chapter(&ch.id, title, &cleaned);
-                            manager.append_downloaded_chapter(&ch.id, title, &cleaned);
-                            result.success += 1;
-                            if let Some(pool) = seg_pool.as_mut() {
-                                pool.submit(&ch.id);
+                        match parsed.get(&ch.id) {
+                            Some((content, title)) if !content.is_empty() => {
+                                // 缓存统一保存为 XHTML 格式
+                                let cleaned = extract_body_fragment(content);
+                                manager.save_chapter(&ch.id, title, &cleaned);
+                                manager.append_downloaded_chapter(&ch.id, title, &cleaned);
+                                result.success += 1;
+                                if let Some(pool) = seg_pool.as_mut() {
+                                    pool.submit(&ch.id);
+                                }
+                                batch_saved += 1;
+                            }
+                            _ => {
+                                deferred_retry
+                                    .push(DeferredChapter::new(ch.clone(), "章节内容缺失或为空"));
                             }
-                            progress.inc_saved();
-                            saved_in_job += 1;
-                        }
-                        _ => {
-                            deferred_retry
-                                .push(DeferredChapter::new(ch.clone(), "章节内容缺失或为空"));
                         }
                     }
+                    batch_groups += 1;
                 }
 
+                progress.add_batch(batch_groups, batch_saved);
+                saved_in_job += batch_saved as u64;
                 if let Some(pool) = seg_pool.as_ref() {
                     pool.drain_progress(progress);
                 }
 
-                progress.inc_group();
-                done_groups += 1;
+                done_groups += batch_groups as u64;
                 let remaining_groups = total_groups.saturating_sub(done_groups);
                 let remaining_chapters = total_chapters.saturating_sub(saved_in_job);
                 info!(
@@ -373,7 +404,10 @@ impl ChapterDownloader {
                     remaining_chapters
                 );
 
-                manager.save_download_status();
+                manager.save_download_status_batched();
+                if let Some(e) = batch_err {
+                    return Err(e);
+                }
             }
         }
 
@@ -544,11 +578,11 @@ pub fn download_with_plan_flow(
     }
 
     let mut pending = match mode {
-        DownloadMode::FailedOnly => pending_failed(&manager, &chosen_chapters),
-        _ => pending_resume(&manager, &chosen_chapters),
+        DownloadMode::FailedOnly => pending_failed(&manager, chosen_chapters),
+        _ => pending_resume(&manager, chosen_chapters),
     };
 
-    let mut reporter = make_reporter(config, &chosen_chapters, &pending, progress);
+    let mut reporter = make_reporter(config, chosen_chapters, &pending, progress);
 
     loop {
         let book_name = manager.book_name.clone();
@@ -557,7 +591,7 @@ pub fn download_with_plan_flow(
             &plan.book_id,
             &book_name,
             &mut manager,
-            &chosen_chapters,
+            chosen_chapters,
             &pending,
             Some(&plan._raw),
             &mut reporter,
@@ -565,7 +599,7 @@ pub fn download_with_plan_flow(
         ) {
             Ok(v) => v,
             Err(e) => {
-                let success = count_success_for_chosen(&manager, &chosen_chapters);
+                let success = count_success_for_chosen(&manager, chosen_chapters);
                 let failed = chosen_chapters.len().saturating_sub(success);
                 append_download_history(&DownloadHistoryRecord::new(
                     manager.book_id.clone(),
@@ -584,7 +618,7 @@ pub fn download_with_plan_flow(
             cb(result);
         }
 
-        pending = pending_failed(&manager, &chosen_chapters);
+        pending = pending_failed(&manager, chosen_chapters);
         if pending.is_empty() {
             break;
         }
@@ -603,7 +637,7 @@ pub fn download_with_plan_flow(
 
     let finalize_result = finalize_from_manager(
         &mut manager,
-        &chosen_chapters,
+        chosen_chapters,
         Some(&plan._raw),
         Some(&mut reporter),
         cancel_flag.as_ref(),
@@ -611,7 +645,7 @@ pub fn download_with_plan_flow(
         &mut format_asker,
     );
 
-    let success = count_success_for_chosen(&manager, &chosen_chapters);
+    let success = count_success_for_chosen(&manager, chosen_chapters);
     let failed = chosen_chapters.len().saturating_sub(success);
     let status = if finalize_result.is_ok() && failed == 0 {
         "success"
@@ -713,10 +747,9 @@ pub(crate) fn pending_failed(manager: &BookManager, chapters: &[ChapterRef]) ->
 }
 
 fn count_success_for_chosen(manager: &BookManager, chapters: &[ChapterRef]) -> usize {
-    chapters
-        .iter()
-        .filter(|ch| matches!(manager.downloaded.get(&ch.id), Some((_, Some(_)))))
-        .count()
+    manager
+        .count_chapter_states(chapters.iter().map(|ch| ch.id.as_str()))
+        .0
 }
 
 // ── 核心下载编排 ──────────────────────────────────────────────
@@ -733,11 +766,30 @@ pub(crate) fn download_chapters_into_manager(
     reporter: &mut ProgressReporter,
     cancel: Option<&Arc<AtomicBool>>,
 ) -> Result<DownloadResult> {
+    // 下载期间 Ctrl+C 走取消标志：工作线程停下后仍会统一写入状态。
+    let local_cancel;
+    let cancel = match cancel {
+        Some(c) => c,
+        None => {
+            local_cancel = Arc::new(AtomicBool::new(false));
+            &local_cancel
+        }
+    };
+    let _interrupt = logging::scoped_interrupt(cancel);
+    let cancel = Some(cancel);
+
+    // 已缓存段评的章节 ID：扫描一次目录，统计与提交过滤共用。
+    let seg_dir = manager.book_folder().join("segment_comments");
+    let cached_comments = if segment_enabled(config) {
+        cached_segment_comment_ids(&seg_dir)
+    } else {
+        HashSet::new()
+    };
+
     // 初始化段评进度：以磁盘缓存为准，避免断点续传时"假满"。
     if segment_enabled(config) && reporter.snapshot.comment_total > 0 {
-        let seg_dir = manager.book_folder().join("segment_comments");
         let _ = std::fs::create_dir_all(&seg_dir);
-        let cached = count_segment_comment_cache_files(&seg_dir);
+        let cached = cached_comments.len();
         reporter.snapshot.comment_fetch = cached.min(reporter.snapshot.comment_total);
         reporter.snapshot.comment_saved = reporter.snapshot.comment_fetch;
         reporter.emit();
@@ -763,12 +815,11 @@ pub(crate) fn download_chapters_into_manager(
 
     // 段评与正文同时开始：先为缺失缓存的章节提交段评抓取任务。
     if let Some(pool) = seg_pool.as_ref() {
-        let seg_dir = manager.book_folder().join("segment_comments");
-        for ch in chosen_chapters {
-            let out_path = seg_dir.join(format!("{}.json", ch.id));
-            if !out_path.exists() {
-                pool.submit(&ch.id);
-            }
+        for ch in chosen_chapters
+            .iter()
+            .filter(|ch| !cached_comments.contains(&ch.id))
+        {
+            pool.submit(&ch.id);
         }
     }
 
@@ -821,6 +872,9 @@ pub(crate) fn download_chapters_into_manager(
         pool.shutdown(reporter);
     }
 
+    // 下载阶段按批落盘，这里（含出错/用户停止）统一写入最终状态。
+    manager.save_download_status();
+
     result
 }
 
@@ -846,14 +900,18 @@ fn download_third_party_flow(
         return Err(anyhow!("章节列表为空，无法预热第三方 API"));
     }
 
-    let mut valid = validate_endpoints(config, probe_chapter_id);
+    let configured: Vec<String> = config
+        .api_endpoints
+        .iter()
+        .map(|s| s.trim().to_string())
+        .filter(|s| !s.is_empty())
+        .collect();
+    // 整本书（含预热探测）复用同一批客户端，避免每次请求都重新建连/握手。
+    let pool = build_endpoint_pool(config, &configured);
+
+    let mut valid = validate_endpoints(config, &pool, probe_chapter_id);
     if valid.is_empty() {
-        valid = config
-            .api_endpoints
-            .iter()
-            .map(|s| s.trim().to_string())
-            .filter(|s| !s.is_empty())
-            .collect();
+        valid = pool;
     }
     if valid.is_empty() {
         return Err(anyhow!("第三方 API 地址池为空"));
@@ -867,14 +925,16 @@ fn download_third_party_flow(
     let epub_mode = config.novel_format.eq_ignore_ascii_case("epub");
 
     let (tx_jobs, rx_jobs) = channel::unbounded::<Vec<ChapterRef>>();
-    let (tx_res, rx_res) = channel::unbounded::<Result<(Vec<ChapterRef>, Value)>>();
+    let (tx_res, rx_res) = channel::unbounded::<Result<(Vec<ChapterRef>, ParsedContents)>>();
 
-    for group in build_dynamic_chapter_groups(pending_chapters) {
+    let groups = build_dynamic_chapter_groups(pending_chapters);
+    for group in &groups {
         tx_jobs.send(group.to_vec()).ok();
     }
     drop(tx_jobs);
 
-    for _ in 0..worker_count {
+    // 同官方模式：工作线程不多于待下载的组数。
+    for _ in 0..worker_count.min(groups.len()) {
         let rx = rx_jobs.clone();
         let tx = tx_res.clone();
         let cfg = config.clone();
@@ -899,40 +959,56 @@ fn download_third_party_flow(
     drop(tx_res);
 
     let mut result = DownloadResult::default();
-    for res in rx_res.iter() {
+    for first in rx_res.iter() {
         if cancel.map(|c| c.load(Ordering::Relaxed)).unwrap_or(false) {
             return Err(anyhow!("用户停止下载"));
         }
 
-        let (group, value) = res?;
-
-        let parsed = ContentParser::extract_api_content(&value, config);
-        for ch in &group {
-            match parsed.get(&ch.id) {
-                Some((content, title)) if !content.is_empty() => {
-                    // 缓存统一保存为 XHTML 格式
-                    let cleaned = extract_body_fragment(content);
-                    manager.save_chapter(&ch.id, title, &cleaned);
-                    manager.append_downloaded_chapter(&ch.id, title, &cleaned);
-                    result.success += 1;
-                    if let Some(pool) = seg_pool {
-                        pool.submit(&ch.id);
-                    }
+        // 阻塞等到一组后顺带取走其余已就绪的组，整批只上报进度/落盘一次。
+        let mut batch_groups = 0usize;
+        let mut batch_saved = 0usize;
+        // 出错时先把本批已落盘的组计入进度/状态，再向上返回错误。
+        let mut batch_err = None;
+        for res in std::iter::once(first).chain(rx_res.try_iter()) {
+            let (group, parsed) = match res {
+                Ok(v) => v,
+                Err(e) => {
+                    batch_err = Some(e);
+                    break;
                 }
-                _ => {
-                    log_failed_chapter(ch, "章节内容缺失或为空");
-                    manager.save_error_chapter(&ch.id, &ch.title);
-                    result.failed += 1;
+            };
+
+            for ch in &group {
+                match parsed.get(&ch.id) {
+                    Some((content, title)) if !content.is_empty() => {
+                        // 缓存统一保存为 XHTML 格式
+                        let cleaned = extract_body_fragment(content);
+                        manager.save_chapter(&ch.id, title, &cleaned);
+                        manager.append_downloaded_chapter(&ch.id, title, &cleaned);
+                        result.success += 1;
+                        if let Some(pool) = seg_pool {
+                            pool.submit(&ch.id);
+                        }
+                    }
+                    _ => {
+                        log_failed_chapter(ch, "章节内容缺失或为空");
+                        manager.save_error_chapter(&ch.id, &ch.title);
+                        result.failed += 1;
+                    }
                 }
             }
-            reporter.inc_saved();
+            batch_saved += group.len();
+            batch_groups += 1;
         }
-        reporter.inc_group();
+        reporter.add_batch(batch_groups, batch_saved);
         if let Some(pool) = seg_pool {
             pool.drain_progress(reporter);
         }
 
-        manager.save_download_status();
+        manager.save_download_status_batched();
+        if let Some(e) = batch_err {
+            return Err(e);
+        }
     }
 
     info!(
@@ -1151,25 +1227,12 @@ pub(crate) const MIN_DYNAMIC_GROUP_SIZE: usize = 15;
 pub(crate) const MAX_DYNAMIC_GROUP_SIZE: usize = 25;
 
 pub(crate) fn build_dynamic_chapter_groups(chapters: &[ChapterRef]) -> Vec<&[ChapterRef]> {
-    if chapters.is_empty() {
-        return Vec::new();
-    }
-
     let len = chapters.len();
-    if len <= MAX_DYNAMIC_GROUP_SIZE {
-        return vec![chapters];
+    let group_count = dynamic_group_count(len);
+    if group_count <= 1 {
+        return if len == 0 { Vec::new() } else { vec![chapters] };
     }
 
-    let min_groups = len.div_ceil(MAX_DYNAMIC_GROUP_SIZE);
-    let max_groups = len / MIN_DYNAMIC_GROUP_SIZE;
-
-    let group_count = if min_groups <= max_groups {
-        max_groups
-    } else {
-        min_groups
-    }
-    .max(1);
-
     let base_size = len / group_count;
     let remainder = len % group_count;
 
@@ -1186,15 +1249,25 @@ pub(crate) fn build_dynamic_chapter_groups(chapters: &[ChapterRef]) -> Vec<&[Cha
     groups
 }
 
+/// 按章节数直接算出分组数，与 [`build_dynamic_chapter_groups`] 的切分保持一致；
+/// 进度条只需要组数，不必为此构造整份章节列表。
 pub(crate) fn dynamic_group_count(total: usize) -> usize {
-    build_dynamic_chapter_groups(&vec![
-        ChapterRef {
-            id: String::new(),
-            title: String::new(),
-        };
-        total
-    ])
-    .len()
+    if total == 0 {
+        return 0;
+    }
+    if total <= MAX_DYNAMIC_GROUP_SIZE {
+        return 1;
+    }
+
+    let min_groups = total.div_ceil(MAX_DYNAMIC_GROUP_SIZE);
+    let max_groups = total / MIN_DYNAMIC_GROUP_SIZE;
+
+    if min_groups <= max_groups {
+        max_groups
+    } else {
+        min_groups
+    }
+    .max(1)
 }
 
 #[cfg(feature = "official-api")]
@@ -1228,16 +1301,13 @@ fn attempt_deferred_batch(
     };
 
     let parsed = ContentParser::extract_api_content(&outcome.value, config);
+    let still_deferred = outcome.deferred_by_id();
     let mut resolved = Vec::new();
     let mut pending = Vec::new();
 
     for chapter in &outcome.group {
-        if let Some(failed) = outcome
-            .deferred
-            .iter()
-            .find(|item| item.chapter.id == chapter.id)
-        {
-            pending.push(failed.clone());
+        if let Some(failed) = still_deferred.get(chapter.id.as_str()) {
+            pending.push((*failed).clone());
             continue;
         }
 
@@ -1406,11 +1476,7 @@ fn fetch_group_best_effort(
     epub_mode: bool,
     book_id: Option<&str>,
 ) -> Result<GroupFetchOutcome> {
-    let ids = group
-        .iter()
-        .map(|c| c.id.as_str())
-        .collect::<Vec<_>>()
-        .join(",");
+    let ids = join_chapter_ids(group);
 
     let report = fetch_best_effort_with_cooldown_retry(client, &ids, epub_mode, book_id)?;
 
@@ -1463,12 +1529,13 @@ fn fetch_best_effort_with_cooldown_retry(
 ) -> Result<ContentFetchReport> {
     let mut delay = std::time::Duration::from_millis(1100);
     for attempt in 0..6 {
+        wait_cooldown_gate();
         match client.get_contents_best_effort(ids, epub_mode, book_id) {
             Ok(v) => return Ok(v),
             Err(err) => {
                 let msg = err.to_string();
                 if msg.contains("Cooldown") || msg.contains("CooldownNotReached") {
-                    std::thread::sleep(delay);
+                    note_cooldown(delay);
                     delay = std::cmp::min(delay * 2, std::time::Duration::from_secs(8));
                     continue;
                 }
@@ -1494,10 +1561,15 @@ fn map_report_to_deferred(
     report: &ContentFetchReport,
 ) -> Vec<DeferredChapter> {
     let reason = report.error.as_deref().unwrap_or("章节内容缺失或为空");
+    if report.missing_ids.is_empty() {
+        return Vec::new();
+    }
+    // 缺失 ID 先收进集合，整组过滤只需一次哈希查询，而不是每章扫描整张缺失列表。
+    let missing: HashSet<&str> = report.missing_ids.iter().map(String::as_str).collect();
 
     group
         .iter()
-        .filter(|ch| report.missing_ids.iter().any(|id| id == &ch.id))
+        .filter(|ch| missing.contains(ch.id.as_str()))
         .cloned()
         .map(|ch| DeferredChapter::new(ch, reason))
         .collect()
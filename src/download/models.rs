@@ -6,6 +6,7 @@ use serde::Serialize;
 use serde_json::Value;
 #[cfg(feature = "official-api")]
 use std::collections::HashSet;
+use std::sync::Arc;
 
 #[cfg(feature = "official-api")]
 pub use tomato_novel_official_api::ChapterRef;
@@ -113,12 +114,30 @@ impl From<DirectoryMeta> for BookMeta {
     }
 }
 
-#[derive(Debug, Clone)]
+#[derive(Clone)]
 pub struct DownloadPlan {
     pub book_id: String,
     pub meta: BookMeta,
     pub chapters: Vec<ChapterRef>,
     pub _raw: Value,
+    /// 本次准备计划时刚下载的封面原始字节（封面已存在或下载失败时为 None）。
+    pub cover_image: Option<Arc<[u8]>>,
+}
+
+impl std::fmt::Debug for DownloadPlan {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        // 封面字节只打印长度，避免日志里逐字节输出几百 KB 的图片。
+        f.debug_struct("DownloadPlan")
+            .field("book_id", &self.book_id)
+            .field("meta", &self.meta)
+            .field("chapters", &self.chapters)
+            .field("_raw", &self._raw)
+            .field(
+                "cover_image_len",
+                &self.cover_image.as_ref().map(|b| b.len()),
+            )
+            .finish()
+    }
 }
 
 #[derive(Debug, Clone, Copy)]
@@ -152,6 +171,19 @@ pub enum SavePhase {
     Audiobook,
 }
 
+/// 把一组章节 ID 拼成接口要求的逗号分隔串：按总长预留容量后逐段追加，
+/// 不再先收集一个中间 `Vec<&str>` 再 `join`。
+pub(crate) fn join_chapter_ids(group: &[ChapterRef]) -> String {
+    let mut ids = String::with_capacity(group.iter().map(|ch| ch.id.len() + 1).sum());
+    for ch in group {
+        if !ids.is_empty() {
+            ids.push(',');
+        }
+        ids.push_str(&ch.id);
+    }
+    ids
+}
+
 // ── 元数据合并工具函数 ──────────────────────────────────────────────────
 
 #[cfg(feature = "official-api")]
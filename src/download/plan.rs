@@ -4,6 +4,7 @@
 
 #[cfg(feature = "official-api")]
 use std::collections::{HashMap, HashSet};
+use std::sync::Arc;
 use std::time::Duration;
 
 use anyhow::{Context, Result, anyhow};
@@ -29,11 +30,30 @@ use tomato_novel_official_api::{DirectoryClient, SearchClient};
 // ── 下载计划准备（官方 API 版本）──────────────────────────────────
 
 /// 预先拉取目录与元数据，便于 UI 展示预览/范围选择。
-#[cfg(feature = "official-api")]
 pub fn prepare_download_plan(
     config: &Config,
     book_id: &str,
     meta_hint: BookMeta,
+) -> Result<DownloadPlan> {
+    prepare_plan(config, book_id, meta_hint, true)
+}
+
+/// 同 [`prepare_download_plan`]，但跳过 Web 章节目录的新鲜缓存：“重新下载”时使用，
+/// 避免沿用最多 10 分钟前的目录而漏掉新章节。
+pub fn prepare_download_plan_uncached(
+    config: &Config,
+    book_id: &str,
+    meta_hint: BookMeta,
+) -> Result<DownloadPlan> {
+    prepare_plan(config, book_id, meta_hint, false)
+}
+
+#[cfg(feature = "official-api")]
+fn prepare_plan(
+    config: &Config,
+    book_id: &str,
+    meta_hint: BookMeta,
+    use_fresh_cache: bool,
 ) -> Result<DownloadPlan> {
     info!(target: "download", book_id, "准备下载计划");
     let directory = DirectoryClient::new().context("init DirectoryClient")?;
@@ -41,7 +61,8 @@ pub fn prepare_download_plan(
     let api_url = dir_url.as_deref();
 
     // 并行回退：预先尝试 Web 目录/简介（失败不影响主流程）
-    let web_plan = prepare_download_plan_web(config, book_id, meta_hint.clone()).ok();
+    let web_plan =
+        prepare_download_plan_web(config, book_id, meta_hint.clone(), use_fresh_cache).ok();
 
     // 首次获取目录和元数据。
     let mut dir = match directory.fetch_directory_with_cover(book_id, api_url, None) {
@@ -98,22 +119,24 @@ pub fn prepare_download_plan(
         completed_meta.book_name = Some(preferred_name);
     }
 
-    // 封面下载：仅使用 web 页面抓取的封面（稳定），不再依赖 API 提供的 cover_url。
-    {
-        let cover_dir =
-            book_paths::book_folder_path(config, book_id, completed_meta.book_name.as_deref());
-        download_web_cover(config, book_id, &completed_meta, &cover_dir);
-    }
-
     if let Some(web_plan) = web_plan.as_ref() {
-        dir.chapters = merge_chapters_with_web(dir.chapters, &web_plan.chapters);
+        dir.chapters =
+            merge_chapters_with_web(std::mem::take(&mut dir.chapters), &web_plan.chapters);
     }
 
+    // 封面下载：仅使用 web 页面抓取的封面（稳定），不再依赖 API 提供的 cover_url。
+    let cover_dir =
+        book_paths::book_folder_path(config, book_id, completed_meta.book_name.as_deref());
+    let cover_image = download_web_cover(config, book_id, &completed_meta, &cover_dir, None);
+    // web 回退计划可能已经下载过同一张封面（此时上面会因文件已存在而跳过）。
+    let cover_image = cover_image.or_else(|| web_plan.and_then(|p| p.cover_image));
+
     Ok(DownloadPlan {
         book_id: dir.book_id.clone(),
         meta: completed_meta,
         chapters: dir.chapters,
         _raw: dir.raw,
+        cover_image,
     })
 }
 
@@ -121,13 +144,14 @@ pub fn prepare_download_plan(
 
 /// no-official-api：使用 FanqieWebNetwork 拉目录 + 拉书本信息。
 #[cfg(not(feature = "official-api"))]
-pub fn prepare_download_plan(
+fn prepare_plan(
     config: &Config,
     book_id: &str,
     meta_hint: BookMeta,
+    use_fresh_cache: bool,
 ) -> Result<DownloadPlan> {
     info!(target: "download", book_id, "准备下载计划（no-official）");
-    prepare_download_plan_web(config, book_id, meta_hint)
+    prepare_download_plan_web(config, book_id, meta_hint, use_fresh_cache)
 }
 
 // ── Web 端回退 ──────────────────────────────────────────────────
@@ -171,6 +195,7 @@ fn prepare_download_plan_web(
     config: &Config,
     book_id: &str,
     meta_hint: BookMeta,
+    use_fresh_cache: bool,
 ) -> Result<DownloadPlan> {
     info!(target: "download", book_id, "准备下载计划（web fallback）");
 
@@ -181,9 +206,17 @@ fn prepare_download_plan_web(
     };
     let web = FanqieWebNetwork::new(web_cfg).context("init FanqieWebNetwork")?;
 
-    let chapter_values = web
-        .fetch_chapter_list(book_id)
-        .ok_or_else(|| anyhow!("获取章节列表失败"))?;
+    // 书本信息页与目录接口互不依赖：并发请求，省去一次串行往返。
+    let (chapter_values, book_info) = std::thread::scope(|s| {
+        let info_handle = s.spawn(|| web.get_book_info(book_id));
+        let chapters = web.fetch_chapter_list(book_id, use_fresh_cache);
+        let info = info_handle.join().unwrap_or_else(|_| {
+            warn!(target: "download", book_id, "获取书本信息的线程 panic，按空信息继续");
+            Default::default()
+        });
+        (chapters, info)
+    });
+    let chapter_values = chapter_values.ok_or_else(|| anyhow!("获取章节列表失败"))?;
     if chapter_values.is_empty() {
         return Err(anyhow!("目录为空"));
     }
@@ -204,10 +237,10 @@ fn prepare_download_plan_web(
         tags_opt,
         cover_url,
         detail_cover_url,
-        _html_img_cover_url,
+        html_img_cover_url,
         chapter_count,
         finished,
-    ) = web.get_book_info(book_id);
+    ) = book_info;
     let web_meta = BookMeta {
         book_name,
         author,
@@ -226,12 +259,17 @@ fn prepare_download_plan_web(
         completed_meta.book_name = Some(preferred_name);
     }
 
-    // 封面下载：使用 web 页面抓取的封面
-    {
-        let cover_dir =
-            book_paths::book_folder_path(config, book_id, completed_meta.book_name.as_deref());
-        download_web_cover(config, book_id, &completed_meta, &cover_dir);
-    }
+    // 封面下载：使用 web 页面抓取的封面，放在章节解析成功之后（失败时不建书目录）。
+    // 书本信息已在手，直接复用其中的封面 URL（缺失时 download_web_cover 会再取一次）。
+    let cover_dir =
+        book_paths::book_folder_path(config, book_id, completed_meta.book_name.as_deref());
+    let cover_image = download_web_cover(
+        config,
+        book_id,
+        &completed_meta,
+        &cover_dir,
+        html_img_cover_url.as_deref(),
+    );
 
     let raw = serde_json::json!({
         "book_id": book_id,
@@ -245,6 +283,7 @@ fn prepare_download_plan_web(
         meta: completed_meta,
         chapters: std::mem::take(&mut chapters),
         _raw: raw,
+        cover_image,
     })
 }
 
@@ -373,25 +412,21 @@ fn search_metadata(book_id: &str) -> Option<BookMeta> {
 }
 // ── 范围过滤 ──────────────────────────────────────────────────
 
-pub(crate) fn apply_range(chapters: &[ChapterRef], range: Option<ChapterRange>) -> Vec<ChapterRef> {
+/// 按 1 起始的闭区间截取章节；区间连续，直接返回原目录的切片，不逐章克隆。
+pub(crate) fn apply_range(chapters: &[ChapterRef], range: Option<ChapterRange>) -> &[ChapterRef] {
     let total = chapters.len();
     match range {
-        None => chapters.to_vec(),
+        None => chapters,
         Some(r) => {
             if r.start == 0 || r.start > r.end {
-                return Vec::new();
+                return &[];
             }
             let start_idx = r.start.saturating_sub(1);
             let end_idx = r.end.min(total).saturating_sub(1);
             if start_idx >= chapters.len() {
-                return Vec::new();
+                return &[];
             }
-            chapters
-                .iter()
-                .skip(start_idx)
-                .take(end_idx.saturating_sub(start_idx) + 1)
-                .cloned()
-                .collect()
+            &chapters[start_idx..=end_idx]
         }
     }
 }
@@ -400,41 +435,49 @@ pub(crate) fn apply_range(chapters: &[ChapterRef], range: Option<ChapterRange>)
 
 /// 从番茄小说 web 页面抓取封面图片并保存到目标目录。
 /// 不再使用 API 提供的 cover_url（该路径不稳定，容易间歇性丢失）。
+/// 返回本次新下载的封面字节，供调用方直接预览，免去再从磁盘读回。
 fn download_web_cover(
     config: &Config,
     book_id: &str,
     meta: &BookMeta,
     cover_dir: &std::path::Path,
-) {
+    known_img_url: Option<&str>,
+) -> Option<Arc<[u8]>> {
     let book_name = meta.book_name.as_deref();
 
     // 检查并迁移旧版“书名.*”封面；新版统一保存为 cover.*。
     if let Some(existing) = book_paths::migrate_legacy_cover_file(cover_dir, book_name) {
         info!(target: "download", book_id, path = %existing.display(), "封面文件已存在，跳过下载");
-        return;
+        return None;
     }
 
     let _ = std::fs::create_dir_all(cover_dir);
 
-    // 从 web 页面获取 html_img_cover_url
-    let web_cfg = FanqieWebConfig {
-        request_timeout: Duration::from_secs(config.request_timeout.max(1)),
-        max_retries: 2,
-        ..Default::default()
-    };
-    let web = match FanqieWebNetwork::new(web_cfg) {
-        Ok(w) => w,
-        Err(e) => {
-            warn!(target: "download", book_id, error = %e, "初始化 FanqieWebNetwork 失败，跳过封面下载");
-            return;
+    // 调用方已拿到书本信息时直接复用其中的封面 URL；否则从 web 页面获取 html_img_cover_url
+    let html_img_cover_url = match known_img_url {
+        Some(u) => Some(u.to_string()),
+        None => {
+            let web_cfg = FanqieWebConfig {
+                request_timeout: Duration::from_secs(config.request_timeout.max(1)),
+                max_retries: 2,
+                ..Default::default()
+            };
+            let web = match FanqieWebNetwork::new(web_cfg) {
+                Ok(w) => w,
+                Err(e) => {
+                    warn!(target: "download", book_id, error = %e, "初始化 FanqieWebNetwork 失败，跳过封面下载");
+                    return None;
+                }
+            };
+            let (_, _, _, _, _, _, html_img_cover_url, _, _) = web.get_book_info(book_id);
+            html_img_cover_url
         }
     };
-    let (_, _, _, _, _, _, html_img_cover_url, _, _) = web.get_book_info(book_id);
     let img_url = match html_img_cover_url {
         Some(ref u) if !u.trim().is_empty() => u.as_str(),
         _ => {
             warn!(target: "download", book_id, "web 页面未提取到封面 URL，跳过封面下载");
-            return;
+            return None;
         }
     };
 
@@ -468,7 +511,7 @@ fn download_web_cover(
             && matches!(&bytes[8..12], b"heic" | b"heix" | b"mif1" | b"msf1")
         {
             warn!(target: "download", book_id, "web 封面为 HEIC 格式，EPUB 不支持，跳过");
-            return;
+            return None;
         }
 
         // 根据 magic bytes 嗅探格式
@@ -483,9 +526,10 @@ fn download_web_cover(
         let path = book_paths::canonical_cover_path(cover_dir, ext);
         if std::fs::write(&path, &bytes).is_ok() {
             info!(target: "download", book_id, path = %path.display(), "web 封面下载成功");
-            return;
+            return Some(bytes.into());
         }
     }
 
     warn!(target: "download", book_id, "web 封面下载失败（已重试 {} 次）", max_retries);
+    None
 }
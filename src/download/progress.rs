@@ -9,6 +9,9 @@ use super::models::ChapterRef;
 use super::models::{ProgressSnapshot, SavePhase};
 use crate::base_system::context::Config;
 
+/// CLI 进度条最大重绘频率。
+const CLI_BAR_REFRESH_HZ: u8 = 10;
+
 struct CliBars {
     _mp: MultiProgress,
     download_bar: ProgressBar,
@@ -38,6 +41,16 @@ impl ProgressReporter {
         self.emit();
     }
 
+    /// 批量推进组/章节计数：一批就绪结果只触发一次回调。
+    pub(crate) fn add_batch(&mut self, groups: usize, saved: usize) {
+        if groups == 0 && saved == 0 {
+            return;
+        }
+        self.snapshot.group_done += groups;
+        self.snapshot.saved_chapters += saved;
+        self.emit();
+    }
+
     pub(crate) fn set_save_phase(&mut self, phase: SavePhase) {
         self.snapshot.save_phase = phase;
         self.emit();
@@ -86,6 +99,17 @@ impl ProgressReporter {
         self.emit();
     }
 
+    /// 批量推进段评抓取/保存计数：一批已落盘的章节只触发一次回调。
+    pub(crate) fn add_comment_batch(&mut self, saved: usize) {
+        let total = self.snapshot.comment_total;
+        if saved == 0 || total == 0 {
+            return;
+        }
+        self.snapshot.comment_fetch = (self.snapshot.comment_fetch + saved).min(total);
+        self.snapshot.comment_saved = (self.snapshot.comment_saved + saved).min(total);
+        self.emit();
+    }
+
     pub(crate) fn reset_for_retry(&mut self, total: usize, pending_len: usize) {
         self.snapshot.group_done = 0;
         self.snapshot.group_total = dynamic_group_count(pending_len);
@@ -154,7 +178,9 @@ pub(crate) fn make_reporter(
         && !pending.is_empty();
 
     let cli = if use_cli_bars {
-        let mp = MultiProgress::with_draw_target(ProgressDrawTarget::stderr());
+        // 进度条只是给人看的，10Hz 足够；默认 20Hz 会在章节快速完成时频繁加锁重绘 stderr。
+        let mp =
+            MultiProgress::with_draw_target(ProgressDrawTarget::stderr_with_hz(CLI_BAR_REFRESH_HZ));
         let style = ProgressStyle::with_template(
             "{prefix} [{elapsed_precise}] {wide_bar} {pos}/{len} ({eta})",
         )
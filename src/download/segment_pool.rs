@@ -2,7 +2,7 @@
 //!
 //! 负责在下载章节正文的同时，并行抓取段落评论（segment comments）并缓存到磁盘。
 
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 use std::path::{Path, PathBuf};
 #[cfg(feature = "official-api")]
 use std::sync::atomic::Ordering;
@@ -37,20 +37,30 @@ enum SegmentEvent {
     Saved,
 }
 
-pub(crate) fn count_segment_comment_cache_files(seg_dir: &Path) -> usize {
+/// 一次 `read_dir` 收集已缓存段评的章节 ID（`<id>.json`）。
+///
+/// 供断点续传统计与提交过滤共用，替代逐章 `exists()` 的一次次 stat。
+pub(crate) fn cached_segment_comment_ids(seg_dir: &Path) -> HashSet<String> {
     let Ok(rd) = std::fs::read_dir(seg_dir) else {
-        return 0;
+        return HashSet::new();
     };
     rd.filter_map(|e| e.ok())
         .filter(|e| e.file_type().map(|t| t.is_file()).unwrap_or(false))
-        .filter(|e| {
-            e.path()
+        .filter_map(|e| {
+            let path = e.path();
+            let is_json = path
                 .extension()
                 .and_then(|s| s.to_str())
                 .map(|s| s.eq_ignore_ascii_case("json"))
-                .unwrap_or(false)
+                .unwrap_or(false);
+            if !is_json {
+                return None;
+            }
+            path.file_stem()
+                .and_then(|s| s.to_str())
+                .map(str::to_string)
         })
-        .count()
+        .collect()
 }
 
 // ── 单章段评拉取 ──────────────────────────────────────────────────
@@ -213,7 +223,9 @@ impl SegmentCommentPool {
                 // Fetch directory (item_version map) lazily if missing.
                 let dir_cache: OnceLock<HashMap<String, String>> = OnceLock::new();
 
-                loop {
+                // 阻塞等待下一章，不再每 200ms 醒来轮询一次：发送端在 shutdown 或池被
+                // 丢弃时关闭，recv 随即返回 Err 让线程退出；取消标志在取到任务后检查。
+                while let Ok(chapter_id) = rx.recv() {
                     if cancel
                         .as_ref()
                         .map(|c| c.load(Ordering::Relaxed))
@@ -222,12 +234,6 @@ impl SegmentCommentPool {
                         return;
                     }
 
-                    let chapter_id = match rx.recv_timeout(Duration::from_millis(200)) {
-                        Ok(id) => id,
-                        Err(channel::RecvTimeoutError::Timeout) => continue,
-                        Err(channel::RecvTimeoutError::Disconnected) => return,
-                    };
-
                     let out_path = seg_dir.join(format!("{}.json", chapter_id));
                     if out_path.exists() {
                         let _ = tx_evt.send(SegmentEvent::Saved);
@@ -299,14 +305,13 @@ impl SegmentCommentPool {
     }
 
     pub(crate) fn drain_progress(&self, progress: &mut ProgressReporter) {
-        for evt in self.rx_evt.try_iter() {
-            match evt {
-                SegmentEvent::Saved => {
-                    progress.inc_comment_fetch();
-                    progress.inc_comment_saved();
-                }
-            }
-        }
+        // 先数清本轮已就绪的事件，再一次性推进计数，避免每章各触发两次进度回调。
+        let saved = self
+            .rx_evt
+            .try_iter()
+            .filter(|evt| matches!(evt, SegmentEvent::Saved))
+            .count();
+        progress.add_comment_batch(saved);
     }
 
     pub(crate) fn shutdown(&mut self, progress: &mut ProgressReporter) {
@@ -1,14 +1,17 @@
 //! 第三方 API 地址解析、请求、重试逻辑。
 
+use std::collections::HashMap;
 use std::sync::Arc;
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::time::Duration;
 
 use anyhow::{Result, anyhow};
+use tracing::{debug, warn};
 
-use super::models::ChapterRef;
+use super::models::{ChapterRef, join_chapter_ids};
 use crate::base_system::context::Config;
 use crate::book_parser::parser::ContentParser;
+use crate::network_parser::network::jitter_unit;
 use crate::third_party::content_client::ThirdPartyContentClient;
 
 #[cfg(feature = "official-api")]
@@ -84,15 +87,40 @@ pub(crate) fn third_party_client_for_endpoint(
 ) -> Result<ThirdPartyContentClient> {
     let timeout_ms = Some(cfg.request_timeout.saturating_mul(1000).max(100));
     let connect_timeout_ms = ms_from_connect_timeout_secs(cfg.min_connect_timeout);
-    ThirdPartyContentClient::new(endpoint, timeout_ms, connect_timeout_ms)
+    // 每个 worker 可能同时持有一条连接，再留一倍余量给重试，避免空闲连接被提前回收。
+    let max_idle_per_host = Some(cfg.max_workers.max(1).saturating_mul(2));
+    ThirdPartyContentClient::new(endpoint, timeout_ms, connect_timeout_ms, max_idle_per_host)
 }
 
-pub(crate) fn has_any_content_for_group(
-    value: &serde_json::Value,
-    group: &[ChapterRef],
-    cfg: &Config,
-) -> bool {
-    let parsed = ContentParser::extract_api_content(value, cfg);
+/// 地址池中的端点：地址与整本书复用的客户端绑定在一起，选取端点时只需按下标取用，
+/// 不必再查表或重建 Client。两个字段都放在 Arc 里，克隆只增加引用计数，
+/// 不会复制客户端内的 URL/查询串 String。
+#[derive(Clone)]
+pub(crate) struct PooledEndpoint {
+    pub(crate) url: Arc<str>,
+    pub(crate) client: Arc<ThirdPartyContentClient>,
+}
+
+pub(crate) fn build_endpoint_pool(cfg: &Config, endpoints: &[String]) -> Vec<PooledEndpoint> {
+    let mut pool = Vec::with_capacity(endpoints.len());
+    for ep in endpoints {
+        match third_party_client_for_endpoint(cfg, ep) {
+            Ok(client) => pool.push(PooledEndpoint {
+                url: Arc::from(ep.as_str()),
+                client: Arc::new(client),
+            }),
+            Err(err) => {
+                warn!(target: "download", endpoint = %ep, error = %err, "第三方 API 客户端创建失败");
+            }
+        }
+    }
+    pool
+}
+
+/// 正文解析结果：chapter_id -> (内容, 标题)。
+pub(crate) type ParsedContents = HashMap<String, (String, String)>;
+
+pub(crate) fn has_any_content_for_group(parsed: &ParsedContents, group: &[ChapterRef]) -> bool {
     group.iter().any(|ch| {
         parsed
             .get(&ch.id)
@@ -101,88 +129,111 @@ pub(crate) fn has_any_content_for_group(
     })
 }
 
-pub(crate) fn validate_endpoints(cfg: &Config, probe_chapter_id: &str) -> Vec<String> {
-    let mut ok = Vec::new();
-    for ep in &cfg.api_endpoints {
-        let ep = ep.trim();
-        if ep.is_empty() {
-            continue;
-        }
-        let client = match third_party_client_for_endpoint(cfg, ep) {
-            Ok(c) => c,
-            Err(_) => continue,
-        };
-        let value = match client.get_contents_unthrottled(probe_chapter_id, false) {
-            Ok(v) => v,
-            Err(_) => continue,
-        };
+/// 并发探测端点可用性（总耗时取决于最慢的一个，而不是全部超时之和）；
+/// 探测使用与正式下载相同的客户端，预热出的连接可直接复用。结果保持配置顺序。
+pub(crate) fn validate_endpoints(
+    cfg: &Config,
+    pool: &[PooledEndpoint],
+    probe_chapter_id: &str,
+) -> Vec<PooledEndpoint> {
+    // probe 请求只含 1 个 chapter_id，用 group 校验最简单
+    let probe_group = [ChapterRef {
+        id: probe_chapter_id.to_string(),
+        title: String::new(),
+    }];
+    let probe = |ep: &PooledEndpoint| {
+        ep.client
+            .get_contents_unthrottled(probe_chapter_id, false)
+            .map(|value| {
+                let parsed = ContentParser::extract_api_content(&value, cfg);
+                has_any_content_for_group(&parsed, &probe_group)
+            })
+            .unwrap_or(false)
+    };
 
-        // probe 请求只含 1 个 chapter_id，用 group 校验最简单
-        let probe_group = [ChapterRef {
-            id: probe_chapter_id.to_string(),
-            title: String::new(),
-        }];
-        if has_any_content_for_group(&value, &probe_group, cfg) {
-            ok.push(ep.to_string());
-        }
+    if pool.len() <= 1 {
+        return pool.iter().filter(|ep| probe(ep)).cloned().collect();
     }
-    ok
+
+    let alive: Vec<bool> = std::thread::scope(|s| {
+        let handles: Vec<_> = pool.iter().map(|ep| s.spawn(|| probe(ep))).collect();
+        handles
+            .into_iter()
+            .map(|h| h.join().unwrap_or(false))
+            .collect()
+    });
+    pool.iter()
+        .zip(alive)
+        .filter_map(|(ep, ok)| ok.then(|| ep.clone()))
+        .collect()
 }
 
+/// 指数退避并叠加 ±50% 抖动，避免多个 worker 同时醒来一起打到同一端点。
 pub(crate) fn sleep_backoff(cfg: &Config, attempt: u32) {
     let min_ms = cfg.min_wait_time.max(1);
     let max_ms = cfg.max_wait_time.max(min_ms);
     let shift = attempt.min(10);
     let factor = 1u64.checked_shl(shift).unwrap_or(u64::MAX);
-    let mut wait = min_ms.saturating_mul(factor);
-    if wait > max_ms {
-        wait = max_ms;
-    }
-    std::thread::sleep(Duration::from_millis(wait));
+    let base = min_ms.saturating_mul(factor).min(max_ms);
+    let wait = ((base as f64) * (0.5 + jitter_unit())) as u64;
+    std::thread::sleep(Duration::from_millis(wait.min(max_ms)));
 }
 
 pub(crate) fn fetch_group_third_party(
     cfg: &Config,
-    endpoints: &Arc<std::sync::Mutex<Vec<String>>>,
+    endpoints: &Arc<std::sync::Mutex<Vec<PooledEndpoint>>>,
     pick: &Arc<AtomicUsize>,
     group: &[ChapterRef],
     epub_mode: bool,
-) -> Result<serde_json::Value> {
+) -> Result<ParsedContents> {
     let tries = cfg.max_retries.max(1);
-    let ids = group
-        .iter()
-        .map(|c| c.id.as_str())
-        .collect::<Vec<_>>()
-        .join(",");
+    let ids = join_chapter_ids(group);
+    let mut last_err: Option<anyhow::Error> = None;
+    // 退避按“轮”计：一个端点失败后立即换下一个，整轮端点都失败才睡一次。
+    let mut round = 0u32;
+    let mut failed_in_round = 0usize;
 
     for attempt in 0..tries {
-        let ep = {
+        // 轮询取下标：O(1)，锁内只做一次取模与引用计数克隆。
+        let (PooledEndpoint { url: ep, client }, pool_len) = {
             let guard = endpoints.lock().unwrap_or_else(|e| e.into_inner());
             if guard.is_empty() {
                 return Err(anyhow!("第三方 API 地址池已为空（全部判定无效）"));
             }
             let idx = pick.fetch_add(1, Ordering::Relaxed) % guard.len();
-            guard[idx].clone()
+            (guard[idx].clone(), guard.len())
         };
 
-        let client = third_party_client_for_endpoint(cfg, &ep)?;
         match client.get_contents_unthrottled(&ids, epub_mode) {
             Ok(v) => {
-                if !has_any_content_for_group(&v, group, cfg) {
+                // 在 worker 线程里解析一次，结果直接交给保存端，避免校验与保存各解析一遍。
+                let parsed = ContentParser::extract_api_content(&v, cfg);
+                if !has_any_content_for_group(&parsed, group) {
                     let mut guard = endpoints.lock().unwrap_or_else(|e| e.into_inner());
-                    guard.retain(|x| x != &ep);
+                    guard.retain(|x| x.url != ep);
                     drop(guard);
-                    sleep_backoff(cfg, attempt);
+                    // 无效端点已剔除，直接换下一个，无需等待。
                     continue;
                 }
-                return Ok(v);
+                return Ok(parsed);
             }
-            Err(_) => {
-                sleep_backoff(cfg, attempt);
+            Err(err) => {
+                // 只保留错误对象本身，字符串化推迟到真正需要输出时（日志级别开启或最终失败）。
+                debug!(target: "download", endpoint = %ep, attempt, error = %err, "第三方 API 请求失败");
+                last_err = Some(err);
+                failed_in_round += 1;
+                if failed_in_round >= pool_len {
+                    sleep_backoff(cfg, round);
+                    round += 1;
+                    failed_in_round = 0;
+                }
                 continue;
             }
         }
     }
 
-    Err(anyhow!("第三方 API 请求重试耗尽"))
+    match last_err {
+        Some(err) => Err(err.context("第三方 API 请求重试耗尽")),
+        None => Err(anyhow!("第三方 API 请求重试耗尽")),
+    }
 }
@@ -5,9 +5,10 @@ use reqwest::header::{
     ACCEPT, ACCEPT_ENCODING, CONNECTION, CONTENT_TYPE, HeaderMap, HeaderValue, REFERER, USER_AGENT,
 };
 use serde_json::Value;
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
-use std::sync::{Mutex, OnceLock};
+use std::sync::{Arc, Mutex, OnceLock};
 use std::time::{Duration, Instant, SystemTime, UNIX_EPOCH};
 use tracing::{debug, error, warn};
 
@@ -52,7 +53,7 @@ fn re_ld_json() -> &'static regex::Regex {
     })
 }
 
-#[derive(Debug, Clone, Default)]
+#[derive(Debug, Clone, Default, serde::Serialize, serde::Deserialize)]
 pub(crate) struct BookInfo {
     pub book_name: Option<String>,
     pub author: Option<String>,
@@ -66,6 +67,43 @@ pub(crate) struct BookInfo {
     pub finished: Option<bool>,
 }
 
+impl BookInfo {
+    fn into_parts(self) -> BookInfoParts {
+        (
+            self.book_name,
+            self.author,
+            self.description,
+            self.tags,
+            self.cover_url,
+            self.detail_cover_url,
+            self.html_img_cover_url,
+            self.chapter_count,
+            self.finished,
+        )
+    }
+}
+
+/// 书本信息页解析结果的磁盘缓存有效期：覆盖预览 → 准备计划 → 封面 → 重试这一轮会话，
+/// 又不至于让章节数/连载状态长时间过期。
+const BOOK_INFO_CACHE_TTL_MS: u64 = 10 * 60 * 1000;
+
+/// 章节目录缓存在此时间内直接命中、跳过请求；更旧的缓存只在请求失败时作为回退。
+/// 与书本信息同一时长：同一轮预览/下载反复准备计划时不再重复拉目录。
+const DIR_CACHE_FRESH_TTL: Duration = Duration::from_millis(BOOK_INFO_CACHE_TTL_MS);
+
+#[derive(serde::Serialize, serde::Deserialize)]
+struct CachedBookInfo {
+    fetched_ms: u64,
+    info: BookInfo,
+}
+
+fn now_ms() -> u64 {
+    SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .map(|d| d.as_millis() as u64)
+        .unwrap_or(0)
+}
+
 #[derive(Debug, Clone)]
 pub(crate) struct FanqieWebConfig {
     pub request_timeout: Duration,
@@ -87,9 +125,83 @@ impl Default for FanqieWebConfig {
     }
 }
 
+/// 进程内共享的 web 端 HTTP Client。
+///
+/// 书本页、目录、封面信息会多次构造 `FanqieWebNetwork`，共用同一连接池才能保持
+/// 到 fanqienovel.com 的 keep-alive 连接与 TLS 会话；超时按请求单独设置。
+fn shared_web_client(insecure_tls: bool) -> anyhow::Result<Client> {
+    static SECURE: OnceLock<Client> = OnceLock::new();
+    static INSECURE: OnceLock<Client> = OnceLock::new();
+    let slot = if insecure_tls { &INSECURE } else { &SECURE };
+    if let Some(client) = slot.get() {
+        return Ok(client.clone());
+    }
+
+    let mut default_headers = HeaderMap::new();
+    default_headers.insert(ACCEPT_ENCODING, HeaderValue::from_static("identity"));
+    default_headers.insert(CONNECTION, HeaderValue::from_static("keep-alive"));
+
+    let client = Client::builder()
+        .default_headers(default_headers)
+        .danger_accept_invalid_certs(insecure_tls)
+        .build()?;
+    Ok(slot.get_or_init(|| client).clone())
+}
+
+/// 按 User-Agent 生成的请求头模板（页面请求 / 目录 JSON 请求）。
+struct WebHeaderTemplates {
+    user_agent: String,
+    page: HeaderMap,
+    /// 目录 API 的公共请求头（Referer 随 book_id 变化，请求时再补）。
+    json: HeaderMap,
+}
+
+impl WebHeaderTemplates {
+    fn build(user_agent: &str) -> Self {
+        let ua =
+            HeaderValue::from_str(user_agent).unwrap_or(HeaderValue::from_static("Mozilla/5.0"));
+
+        let mut page = HeaderMap::new();
+        page.insert(
+            ACCEPT,
+            HeaderValue::from_static(
+                "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            ),
+        );
+        page.insert(USER_AGENT, ua.clone());
+
+        let mut json = HeaderMap::new();
+        json.insert(
+            ACCEPT,
+            HeaderValue::from_static("application/json, text/plain, */*"),
+        );
+        json.insert(CONTENT_TYPE, HeaderValue::from_static("application/json"));
+        json.insert(USER_AGENT, ua);
+
+        Self {
+            user_agent: user_agent.to_string(),
+            page,
+            json,
+        }
+    }
+}
+
+/// 请求头模板只依赖 User-Agent：进程内按首次使用的 UA 生成一次，之后每个
+/// `FanqieWebNetwork` 共享同一份；极少数自定义 UA 的实例才单独构造。
+fn web_header_templates(user_agent: &str) -> Arc<WebHeaderTemplates> {
+    static SHARED: OnceLock<Arc<WebHeaderTemplates>> = OnceLock::new();
+    let shared = SHARED.get_or_init(|| Arc::new(WebHeaderTemplates::build(user_agent)));
+    if shared.user_agent == user_agent {
+        shared.clone()
+    } else {
+        Arc::new(WebHeaderTemplates::build(user_agent))
+    }
+}
+
 pub(crate) struct FanqieWebNetwork {
     client: Client,
     config: FanqieWebConfig,
+    headers: Arc<WebHeaderTemplates>,
     last_dir_fetch: Mutex<Instant>,
 }
 
@@ -107,59 +219,35 @@ pub(crate) type BookInfoParts = (
 
 impl FanqieWebNetwork {
     pub(crate) fn new(config: FanqieWebConfig) -> anyhow::Result<Self> {
-        let mut default_headers = HeaderMap::new();
-        default_headers.insert(ACCEPT_ENCODING, HeaderValue::from_static("identity"));
-        default_headers.insert(CONNECTION, HeaderValue::from_static("keep-alive"));
-
-        let client = Client::builder()
-            .default_headers(default_headers)
-            .danger_accept_invalid_certs(config.insecure_tls)
-            .timeout(config.request_timeout)
-            .build()?;
-
+        let client = shared_web_client(config.insecure_tls)?;
+        let headers = web_header_templates(&config.user_agent);
         Ok(Self {
             client,
             config,
+            headers,
             last_dir_fetch: Mutex::new(Instant::now() - Duration::from_secs(60)),
         })
     }
 
     fn get_headers(&self) -> HeaderMap {
-        let mut headers = HeaderMap::new();
-        headers.insert(
-            ACCEPT,
-            HeaderValue::from_static(
-                "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            ),
-        );
-        headers.insert(
-            USER_AGENT,
-            HeaderValue::from_str(&self.config.user_agent)
-                .unwrap_or(HeaderValue::from_static("Mozilla/5.0")),
-        );
-        headers
+        self.headers.page.clone()
     }
 
     fn get_json_headers(&self, book_id: &str) -> HeaderMap {
-        let mut headers = HeaderMap::new();
-        headers.insert(
-            ACCEPT,
-            HeaderValue::from_static("application/json, text/plain, */*"),
-        );
-        headers.insert(CONTENT_TYPE, HeaderValue::from_static("application/json"));
-        headers.insert(
-            USER_AGENT,
-            HeaderValue::from_str(&self.config.user_agent)
-                .unwrap_or(HeaderValue::from_static("Mozilla/5.0")),
-        );
-        let referer = format!("https://fanqienovel.com/page/{book_id}");
-        if let Ok(v) = HeaderValue::from_str(&referer) {
+        let mut headers = self.headers.json.clone();
+        // 直接移交格式化好的 String，省去 from_str 的再次拷贝。
+        if let Ok(v) = HeaderValue::try_from(format!("https://fanqienovel.com/page/{book_id}")) {
             headers.insert(REFERER, v);
         }
         headers
     }
 
     pub(crate) fn get_book_info(&self, book_id: &str) -> BookInfoParts {
+        if let Some(info) = self.load_book_info_cache(book_id) {
+            debug!("命中书籍信息缓存: {}", book_id);
+            return info.into_parts();
+        }
+
         let book_info_url = format!("https://fanqienovel.com/page/{book_id}");
 
         // 发送请求
@@ -167,6 +255,7 @@ impl FanqieWebNetwork {
             .client
             .get(&book_info_url)
             .headers(self.get_headers())
+            .timeout(self.config.request_timeout)
             .send()
         {
             Ok(resp) => {
@@ -185,17 +274,10 @@ impl FanqieWebNetwork {
                 match resp.text() {
                     Ok(text) => {
                         let info = ContentParser::parse_book_info(&text, book_id);
-                        (
-                            info.book_name,
-                            info.author,
-                            info.description,
-                            info.tags,
-                            info.cover_url,
-                            info.detail_cover_url,
-                            info.html_img_cover_url,
-                            info.chapter_count,
-                            info.finished,
-                        )
+                        if let Err(e) = self.save_book_info_cache(book_id, &info) {
+                            debug!("保存书籍信息缓存失败(忽略): {}", e);
+                        }
+                        info.into_parts()
                     }
                     Err(e) => {
                         error!("获取书籍信息失败: {}", e);
@@ -211,13 +293,29 @@ impl FanqieWebNetwork {
     }
 
     /// 从 web API 获取章节列表（节流 + 403 预热 + 退避重试 + 本地缓存回退）。
-    pub(crate) fn fetch_chapter_list(&self, book_id: &str) -> Option<Vec<Value>> {
+    ///
+    /// `use_fresh_cache` 为 true 时，DIR_CACHE_FRESH_TTL 内的目录缓存直接命中、不发请求；
+    /// 更新扫描与“重新下载”需要最新章节数，应传 false（缓存仍会作为失败回退）。
+    pub(crate) fn fetch_chapter_list(
+        &self,
+        book_id: &str,
+        use_fresh_cache: bool,
+    ) -> Option<Vec<Value>> {
         // 无效 book_id 直接返回 None，避免无意义请求
         if book_id.trim().is_empty() || !book_id.chars().all(|c| c.is_ascii_digit()) {
             warn!("fetch_chapter_list 跳过无效 book_id: '{}'", book_id);
             return None;
         }
 
+        if use_fresh_cache
+            && let Some(list) = self
+                .load_fresh_dir_cache(book_id)
+                .and_then(Self::parse_chapter_data)
+        {
+            debug!("命中章节目录缓存: {}", book_id);
+            return Some(list);
+        }
+
         let api_url =
             format!("https://fanqienovel.com/api/reader/directory/detail?bookId={book_id}");
 
@@ -227,26 +325,29 @@ impl FanqieWebNetwork {
         let retries = self.config.max_retries.max(1);
         let mut backoff = 0.6f64;
         let mut last_error: Option<String> = None;
+        let headers = self.get_json_headers(book_id);
 
         for attempt in 1..=retries {
             debug!("开始获取章节列表，URL: {}", api_url);
-            let headers = self.get_json_headers(book_id);
 
             if attempt == 1 {
-                // 屏蔽 Cookie（如果未来启用 cookies feature，这里也不会泄露）
-                let masked: Vec<(String, String)> = headers
-                    .iter()
-                    .map(|(k, v)| {
-                        let key = k.as_str().to_string();
-                        let val = if key.eq_ignore_ascii_case("cookie") {
-                            "***".to_string()
-                        } else {
-                            v.to_str().unwrap_or("").to_string()
-                        };
-                        (key, val)
-                    })
-                    .collect();
-                debug!("目录请求Header(精简): {:?}", masked);
+                // 仅在 DEBUG 级别启用时才构建脱敏 Header 列表，避免默认级别下白白分配。
+                if tracing::enabled!(tracing::Level::DEBUG) {
+                    // 屏蔽 Cookie（如果未来启用 cookies feature，这里也不会泄露）
+                    let masked: Vec<(String, String)> = headers
+                        .iter()
+                        .map(|(k, v)| {
+                            let key = k.as_str().to_string();
+                            let val = if key.eq_ignore_ascii_case("cookie") {
+                                "***".to_string()
+                            } else {
+                                v.to_str().unwrap_or("").to_string()
+                            };
+                            (key, val)
+                        })
+                        .collect();
+                    debug!("目录请求Header(精简): {:?}", masked);
+                }
             } else {
                 debug!(
                     "重试第 {} 次获取目录（可能被限频/风控），URL: {}",
@@ -254,7 +355,12 @@ impl FanqieWebNetwork {
                 );
             }
 
-            let resp = self.client.get(&api_url).headers(headers).send();
+            let resp = self
+                .client
+                .get(&api_url)
+                .headers(headers.clone())
+                .timeout(self.config.request_timeout)
+                .send();
 
             let resp = match resp {
                 Ok(r) => r,
@@ -266,7 +372,13 @@ impl FanqieWebNetwork {
                 }
             };
 
-            debug!("章节列表响应状态: {}", resp.status().as_u16());
+            // 响应体大小取自 Content-Length 头，不为日志额外读取/拷贝正文。
+            debug!(
+                "章节列表响应状态: {}，Content-Length: {}",
+                resp.status().as_u16(),
+                resp.content_length()
+                    .map_or_else(|| "?".to_string(), |n| n.to_string())
+            );
 
             // 显式处理 403：可能为风控或限频
             if resp.status().as_u16() == 403 {
@@ -279,6 +391,7 @@ impl FanqieWebNetwork {
                         .client
                         .get(&warm_url)
                         .headers(self.get_headers())
+                        .timeout(self.config.request_timeout)
                         .send()
                     {
                         Ok(_) => {
@@ -304,7 +417,17 @@ impl FanqieWebNetwork {
                 }
             };
 
-            let data: Value = match resp.json() {
+            // 先取原始字节：解析一次得到 Value，缓存直接落原始字节，不再把整棵目录树重新序列化。
+            let body = match resp.bytes() {
+                Ok(b) => b,
+                Err(e) => {
+                    last_error = Some(e.to_string());
+                    error!("获取章节列表失败: {}", e);
+                    self.sleep_backoff(attempt, retries, &mut backoff, 0.3);
+                    continue;
+                }
+            };
+            let data: Value = match serde_json::from_slice(&body) {
                 Ok(v) => v,
                 Err(e) => {
                     last_error = Some(e.to_string());
@@ -315,11 +438,11 @@ impl FanqieWebNetwork {
             };
 
             // 成功则缓存原始 JSON，便于下次回退
-            if let Err(e) = self.save_dir_cache(book_id, &data) {
+            if let Err(e) = self.save_dir_cache(book_id, &body) {
                 debug!("保存目录缓存失败(忽略): {}", e);
             }
 
-            if let Some(list) = Self::parse_chapter_data(&data) {
+            if let Some(list) = Self::parse_chapter_data(data) {
                 return Some(list);
             }
 
@@ -335,7 +458,7 @@ impl FanqieWebNetwork {
         match self.load_dir_cache(book_id) {
             Ok(Some(cached)) => {
                 debug!("使用本地缓存的章节目录回退: book_id={}", book_id);
-                Self::parse_chapter_data(&cached)
+                Self::parse_chapter_data(cached)
             }
             _ => None,
         }
@@ -365,16 +488,60 @@ impl FanqieWebNetwork {
         self.config.cache_dir.join(format!("{book_id}.json"))
     }
 
-    fn save_dir_cache(&self, book_id: &str, data: &Value) -> anyhow::Result<()> {
+    fn book_info_cache_path(&self, book_id: &str) -> Option<PathBuf> {
+        // 仅缓存纯数字 ID，避免异常输入拼出意外路径
+        if book_id.is_empty() || !book_id.chars().all(|c| c.is_ascii_digit()) {
+            return None;
+        }
+        Some(self.config.cache_dir.join(format!("{book_id}.info.json")))
+    }
+
+    fn load_book_info_cache(&self, book_id: &str) -> Option<BookInfo> {
+        let bytes = fs::read(self.book_info_cache_path(book_id)?).ok()?;
+        let cached: CachedBookInfo = serde_json::from_slice(&bytes).ok()?;
+        let fresh = now_ms().saturating_sub(cached.fetched_ms) <= BOOK_INFO_CACHE_TTL_MS;
+        fresh.then_some(cached.info)
+    }
+
+    /// 只缓存解析出书名的结果，风控页/空页面不落盘。
+    fn save_book_info_cache(&self, book_id: &str, info: &BookInfo) -> anyhow::Result<()> {
+        let Some(path) = self.book_info_cache_path(book_id) else {
+            return Ok(());
+        };
+        if info.book_name.is_none() {
+            return Ok(());
+        }
+        if let Some(parent) = path.parent() {
+            fs::create_dir_all(parent)?;
+        }
+        let cached = CachedBookInfo {
+            fetched_ms: now_ms(),
+            info: info.clone(),
+        };
+        fs::write(path, serde_json::to_vec(&cached)?)?;
+        Ok(())
+    }
+
+    /// 缓存目录接口的原始响应体（调用方已确认是合法 JSON）。
+    fn save_dir_cache(&self, book_id: &str, body: &[u8]) -> anyhow::Result<()> {
         let path = self.cache_path(book_id);
         if let Some(parent) = path.parent() {
             fs::create_dir_all(parent)?;
         }
-        let bytes = serde_json::to_vec(data)?;
-        fs::write(path, bytes)?;
+        fs::write(path, body)?;
         Ok(())
     }
 
+    /// 缓存文件足够新（按 mtime）时才返回，供请求前直接命中。
+    fn load_fresh_dir_cache(&self, book_id: &str) -> Option<Value> {
+        let path = self.cache_path(book_id);
+        let age = fs::metadata(&path).ok()?.modified().ok()?.elapsed().ok()?;
+        if age > DIR_CACHE_FRESH_TTL {
+            return None;
+        }
+        serde_json::from_slice(&fs::read(path).ok()?).ok()
+    }
+
     fn load_dir_cache(&self, book_id: &str) -> anyhow::Result<Option<Value>> {
         let path = self.cache_path(book_id);
         if !path.exists() {
@@ -385,9 +552,13 @@ impl FanqieWebNetwork {
         Ok(Some(value))
     }
 
-    fn parse_chapter_data(data: &Value) -> Option<Vec<Value>> {
+    fn parse_chapter_data(data: Value) -> Option<Vec<Value>> {
         // 兼容多种返回形态：尽量提取出“章节数组”。
-        let root = data.get("data").unwrap_or(data);
+        // 按值接收并把数组直接移出，避免对上千个章节对象逐个深拷贝。
+        let mut root = match data {
+            Value::Object(mut map) if map.contains_key("data") => map.remove("data")?,
+            other => other,
+        };
 
         for key in [
             "chapterList",
@@ -397,16 +568,16 @@ impl FanqieWebNetwork {
             "items",
             "list",
         ] {
-            if let Some(arr) = root.get(key).and_then(Value::as_array) {
-                return Some(arr.clone());
+            if let Some(Value::Array(arr)) = root.get_mut(key) {
+                return Some(std::mem::take(arr));
             }
         }
         // chapterListWithVolume：按卷分组的章节列表（数组的数组），需要展平
-        if let Some(volumes) = root.get("chapterListWithVolume").and_then(Value::as_array) {
+        if let Some(Value::Array(volumes)) = root.get_mut("chapterListWithVolume") {
             let mut all_chapters: Vec<Value> = Vec::new();
-            for vol in volumes {
-                if let Some(ch_list) = vol.as_array() {
-                    all_chapters.extend(ch_list.iter().cloned());
+            for vol in volumes.iter_mut() {
+                if let Value::Array(ch_list) = vol {
+                    all_chapters.append(ch_list);
                 }
             }
             if !all_chapters.is_empty() {
@@ -414,7 +585,7 @@ impl FanqieWebNetwork {
             }
         }
         // 有些接口会是 data.data.list / data.data.chapterList / data.data.items
-        if let Some(inner) = root.get("data") {
+        if let Some(inner) = root.get_mut("data") {
             for key in [
                 "list",
                 "chapterList",
@@ -423,14 +594,14 @@ impl FanqieWebNetwork {
                 "item_list",
                 "chapters",
             ] {
-                if let Some(arr) = inner.get(key).and_then(Value::as_array) {
-                    return Some(arr.clone());
+                if let Some(Value::Array(arr)) = inner.get_mut(key) {
+                    return Some(std::mem::take(arr));
                 }
             }
         }
 
         // 最后兜底：递归扫描 JSON，找到“像章节数组”的最大数组
-        find_chapter_array(root)
+        find_chapter_array(&root)
     }
 }
 
@@ -876,9 +1047,31 @@ fn find_first_string_array_for_key(value: &Value, target: &str) -> Option<Vec<St
     }
 }
 
+/// 按字段名缓存编译好的正则：字段名都是固定字面量，编译一次即可反复使用。
+fn cached_field_regex(
+    cache: &'static OnceLock<Mutex<HashMap<String, regex::Regex>>>,
+    field: &str,
+    pattern: impl FnOnce(&str) -> String,
+) -> Option<regex::Regex> {
+    let mut map = cache
+        .get_or_init(|| Mutex::new(HashMap::new()))
+        .lock()
+        .unwrap_or_else(|e| e.into_inner());
+    if let Some(re) = map.get(field) {
+        return Some(re.clone());
+    }
+    let re = regex::Regex::new(&pattern(&regex::escape(field))).ok()?;
+    map.insert(field.to_string(), re.clone());
+    Some(re)
+}
+
 fn regex_json_string_field(html: &str, field: &str) -> Option<String> {
-    let pattern = format!(r#"\"{}\"\s*:\s*\"(.*?)\""#, regex::escape(field));
-    let re = regex::Regex::new(&pattern).ok()?;
+    // 快速路径：页面里根本没有该字段名时无需进入正则引擎
+    if !html.contains(field) {
+        return None;
+    }
+    static CACHE: OnceLock<Mutex<HashMap<String, regex::Regex>>> = OnceLock::new();
+    let re = cached_field_regex(&CACHE, field, |f| format!(r#"\"{}\"\s*:\s*\"(.*?)\""#, f))?;
     let caps = re.captures(html)?;
     let raw = caps.get(1)?.as_str();
 
@@ -890,8 +1083,11 @@ fn regex_json_string_field(html: &str, field: &str) -> Option<String> {
 }
 
 fn regex_json_usize_field(html: &str, field: &str) -> Option<usize> {
-    let pattern = format!(r#"\"{}\"\s*:\s*(\d+)"#, regex::escape(field));
-    let re = regex::Regex::new(&pattern).ok()?;
+    if !html.contains(field) {
+        return None;
+    }
+    static CACHE: OnceLock<Mutex<HashMap<String, regex::Regex>>> = OnceLock::new();
+    let re = cached_field_regex(&CACHE, field, |f| format!(r#"\"{}\"\s*:\s*(\d+)"#, f))?;
     let caps = re.captures(html)?;
     caps.get(1)?.as_str().parse::<usize>().ok()
 }
@@ -924,13 +1120,36 @@ fn jitter_seconds(max: f64) -> f64 {
     if max <= 0.0 {
         return 0.0;
     }
-    // 用时间戳制造一个轻量抖动（避免引入 rand 依赖）
+    jitter_unit() * max
+}
+
+/// 线程内的轻量随机数：只在首次使用时读一次时钟做种子，之后每次抽样只是几次位运算
+/// （xorshift64），避免每次重试都读时钟，也避免多个线程同一时刻醒来得到相同抖动。
+pub(crate) fn jitter_unit() -> f64 {
+    use std::cell::Cell;
+
+    thread_local! {
+        static STATE: Cell<u64> = Cell::new(jitter_seed());
+    }
+    STATE.with(|state| {
+        let mut x = state.get();
+        x ^= x << 13;
+        x ^= x >> 7;
+        x ^= x << 17;
+        state.set(x);
+        (x >> 11) as f64 / (1u64 << 53) as f64 // [0,1)
+    })
+}
+
+fn jitter_seed() -> u64 {
+    use std::hash::{BuildHasher, RandomState};
+
+    // RandomState 每次创建都带有随机键；再混入时间戳，保证不同线程种子不同且非零
     let nanos = SystemTime::now()
         .duration_since(UNIX_EPOCH)
-        .map(|d| d.subsec_nanos() as u64)
+        .map(|d| d.as_nanos() as u64)
         .unwrap_or(0);
-    let bucket = (nanos % 10_000) as f64 / 10_000.0; // [0,1)
-    bucket * max
+    RandomState::new().hash_one(nanos) | 1
 }
 
 fn _ensure_parent_dir(path: &Path) -> std::io::Result<()> {
@@ -975,4 +1194,55 @@ mod tests {
         let info_serializing = ContentParser::parse_book_info(html_serializing, "dummy");
         assert_eq!(info_serializing.finished, Some(false));
     }
+
+    #[test]
+    fn jitter_stays_within_bounds() {
+        for _ in 0..1000 {
+            let j = super::jitter_seconds(0.3);
+            assert!((0.0..0.3).contains(&j));
+        }
+        assert_eq!(super::jitter_seconds(0.0), 0.0);
+    }
+
+    #[test]
+    fn book_info_cache_roundtrip_skips_nameless_results() {
+        let dir = tempfile::tempdir().unwrap();
+        let web = super::FanqieWebNetwork::new(super::FanqieWebConfig {
+            cache_dir: dir.path().to_path_buf(),
+            ..Default::default()
+        })
+        .unwrap();
+
+        let empty = super::BookInfo::default();
+        web.save_book_info_cache("123", &empty).unwrap();
+        assert!(web.load_book_info_cache("123").is_none());
+
+        let info = super::BookInfo {
+            book_name: Some("书名".to_string()),
+            chapter_count: Some(42),
+            ..Default::default()
+        };
+        web.save_book_info_cache("123", &info).unwrap();
+        let cached = web.load_book_info_cache("123").unwrap();
+        assert_eq!(cached.book_name.as_deref(), Some("书名"));
+        assert_eq!(cached.chapter_count, Some(42));
+
+        assert!(web.book_info_cache_path("../x").is_none());
+    }
+
+    #[test]
+    fn fresh_dir_cache_is_served_without_request() {
+        let dir = tempfile::tempdir().unwrap();
+        let web = super::FanqieWebNetwork::new(super::FanqieWebConfig {
+            cache_dir: dir.path().to_path_buf(),
+            ..Default::default()
+        })
+        .unwrap();
+
+        assert!(web.load_fresh_dir_cache("123").is_none());
+        web.save_dir_cache("123", br#"{"data":{"chapterList":[{"itemId":"1"}]}}"#)
+            .unwrap();
+        let list = web.fetch_chapter_list("123", true).unwrap();
+        assert_eq!(list.len(), 1);
+    }
 }
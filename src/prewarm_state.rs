@@ -2,11 +2,13 @@
 //!
 //! 用于在启动时异步预热 IID，并让 UI 能显示“预热中/完成”。
 
-use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
 use std::sync::{Mutex, OnceLock};
 
 static PREWARMING: AtomicBool = AtomicBool::new(false);
 static PREWARM_ERROR: OnceLock<Mutex<Option<String>>> = OnceLock::new();
+/// 错误信息每变动一次加一：UI 主循环先比对版本号，未变化时无需加锁复制错误文本。
+static PREWARM_ERROR_VERSION: AtomicU64 = AtomicU64::new(0);
 
 #[allow(dead_code)]
 const IID_BLOCK_HINT: &str = "IID 注册需要访问 https://log.snssdk.com/service/2/device_register/。番茄把该域名用于设备注册/广告分发，因此它经常会被公司/校园网、DNS 过滤、代理规则或 AdGuard/uBlock 等反广告插件拦截。请把 log.snssdk.com 加入放行列表，或临时关闭相关拦截后重试。";
@@ -30,6 +32,10 @@ pub fn is_prewarm_in_progress() -> bool {
     PREWARMING.load(Ordering::SeqCst)
 }
 
+pub fn prewarm_error_version() -> u64 {
+    PREWARM_ERROR_VERSION.load(Ordering::Acquire)
+}
+
 pub fn prewarm_error() -> Option<String> {
     PREWARM_ERROR
         .get_or_init(|| Mutex::new(None))
@@ -52,4 +58,5 @@ fn set_prewarm_error(err: Option<String>) {
         .get_or_init(|| Mutex::new(None))
         .lock()
         .unwrap_or_else(|e| e.into_inner()) = err;
+    PREWARM_ERROR_VERSION.fetch_add(1, Ordering::Release);
 }
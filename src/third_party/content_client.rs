@@ -2,10 +2,14 @@ use anyhow::{Result, anyhow};
 use reqwest::blocking::Client;
 use reqwest::header::{ACCEPT, ACCEPT_ENCODING, CONNECTION, HeaderMap, HeaderValue, USER_AGENT};
 use serde_json::Value;
+use std::io::Read;
 use std::time::Duration;
 
 const AID: &str = "1967";
 
+/// 单次正文批量响应的最大字节数（一组 25 章正文远小于此值）。
+const MAX_RESPONSE_BYTES: u64 = 32 * 1024 * 1024;
+
 fn normalize_base(base: &str) -> String {
     base.trim().trim_end_matches('/').to_string()
 }
@@ -32,7 +36,7 @@ fn derive_batch_full_base(endpoint: &str) -> String {
     ensure_trailing_query_base(&format!("{}/reading/reader/batch_full/v", base))
 }
 
-fn join_params(params: &[(String, String)]) -> String {
+fn join_params(params: &[(&str, &str)]) -> String {
     // IMPORTANT: Keep commas unescaped (item_ids is comma-separated).
     let mut out = String::new();
     for (i, (k, v)) in params.iter().enumerate() {
@@ -46,6 +50,27 @@ fn join_params(params: &[(String, String)]) -> String {
     out
 }
 
+/// 预先拼好 item_ids 之后的固定查询参数（epub / 非 epub 两套），请求时只需拼接章节 ID。
+fn static_query_tail(epub: bool) -> String {
+    // Best-effort compatibility with Official API style params.
+    // Many third-party services ignore extra params.
+    let update_version_code = "0";
+    let mut params: Vec<(&str, &str)> = vec![
+        ("update_version_code", update_version_code),
+        ("aid", AID),
+        ("key_register_ts", "0"),
+        ("device_platform", "android"),
+        ("iid", "0"),
+    ];
+    if epub {
+        params.push(("version_code", update_version_code));
+        params.push(("epub", "1"));
+    } else {
+        params.push(("epub", "0"));
+    }
+    join_params(&params)
+}
+
 /// 轻量第三方正文客户端：不依赖 Official-API。
 ///
 /// 约定：第三方服务应返回可直接解析的 JSON（尽量与 Official-API 解密后的结构兼容），
@@ -54,6 +79,8 @@ fn join_params(params: &[(String, String)]) -> String {
 pub(crate) struct ThirdPartyContentClient {
     client: Client,
     batch_full_base: String,
+    query_tail: String,
+    query_tail_epub: String,
 }
 
 impl ThirdPartyContentClient {
@@ -61,6 +88,7 @@ impl ThirdPartyContentClient {
         endpoint: &str,
         timeout_ms: Option<u64>,
         connect_timeout_ms: Option<u64>,
+        max_idle_per_host: Option<usize>,
     ) -> Result<Self> {
         let mut headers = HeaderMap::new();
         headers.insert(ACCEPT_ENCODING, HeaderValue::from_static("identity"));
@@ -83,11 +111,16 @@ impl ThirdPartyContentClient {
         if let Some(ms) = connect_timeout_ms {
             builder = builder.connect_timeout(Duration::from_millis(ms.max(50)));
         }
+        if let Some(n) = max_idle_per_host {
+            builder = builder.pool_max_idle_per_host(n.max(1));
+        }
 
         let client = builder.build()?;
         Ok(Self {
             client,
             batch_full_base: derive_batch_full_base(endpoint),
+            query_tail: static_query_tail(false),
+            query_tail_epub: static_query_tail(true),
         })
     }
 
@@ -97,33 +130,41 @@ impl ThirdPartyContentClient {
             return Err(anyhow!("item_ids 不能为空"));
         }
 
-        // Best-effort compatibility with Official API style params.
-        // Many third-party services ignore extra params.
-        let update_version_code = "0";
-        let mut params: Vec<(String, String)> = vec![
-            ("item_ids".to_string(), item_ids.to_string()),
-            (
-                "update_version_code".to_string(),
-                update_version_code.to_string(),
-            ),
-            ("aid".to_string(), AID.to_string()),
-            ("key_register_ts".to_string(), "0".to_string()),
-            ("device_platform".to_string(), "android".to_string()),
-            ("iid".to_string(), "0".to_string()),
-        ];
-        if epub {
-            params.push(("version_code".to_string(), update_version_code.to_string()));
-            params.push(("epub".to_string(), "1".to_string()));
+        let tail = if epub {
+            &self.query_tail_epub
         } else {
-            params.push(("epub".to_string(), "0".to_string()));
-        }
-
-        let query = join_params(&params);
-        let url = format!("{}{}", self.batch_full_base, query);
+            &self.query_tail
+        };
+        // IMPORTANT: Keep commas unescaped (item_ids is comma-separated).
+        // 前缀与查询尾巴在构造时已拼好，这里按确切长度一次分配后直接追加。
+        let mut url = String::with_capacity(
+            self.batch_full_base.len() + "item_ids=".len() + item_ids.len() + 1 + tail.len(),
+        );
+        url.push_str(&self.batch_full_base);
+        url.push_str("item_ids=");
+        url.push_str(item_ids);
+        url.push('&');
+        url.push_str(tail);
 
         let resp = self.client.get(&url).send()?;
         let resp = resp.error_for_status()?;
-        let v: Value = resp.json()?;
+
+        // 限制读取的响应体大小：异常/配置错误的服务端可能返回超大页面。
+        let declared = resp.content_length();
+        if declared.is_some_and(|n| n > MAX_RESPONSE_BYTES) {
+            return Err(anyhow!(
+                "响应体过大（{} 字节，上限 {}）",
+                declared.unwrap_or_default(),
+                MAX_RESPONSE_BYTES
+            ));
+        }
+        let mut body = Vec::with_capacity(declared.unwrap_or(0) as usize);
+        resp.take(MAX_RESPONSE_BYTES + 1).read_to_end(&mut body)?;
+        if body.len() as u64 > MAX_RESPONSE_BYTES {
+            return Err(anyhow!("响应体超过上限 {} 字节", MAX_RESPONSE_BYTES));
+        }
+
+        let v: Value = serde_json::from_slice(&body)?;
         Ok(v)
     }
 }
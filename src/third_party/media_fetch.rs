@@ -2,9 +2,13 @@ use reqwest::blocking::Client;
 use reqwest::header::{
     ACCEPT, ACCEPT_ENCODING, CONNECTION, HeaderMap, HeaderValue, REFERER, USER_AGENT,
 };
+use std::io::Read;
 use std::sync::OnceLock;
 use std::time::Duration;
 
+/// 按 Content-Length 预分配的上限，防止异常响应头导致一次性申请过大内存。
+const MAX_PREALLOC_BYTES: u64 = 16 * 1024 * 1024;
+
 /// 复用 HTTP Client，避免每次调用都重建导致连接池和 TLS 握手浪费。
 fn shared_client() -> &'static Client {
     static CLIENT: OnceLock<Client> = OnceLock::new();
@@ -37,7 +41,10 @@ pub(crate) fn fetch_bytes(url: &str, timeout: Duration) -> Option<Vec<u8>> {
 
     let client = shared_client();
     let resp = client.get(url).timeout(timeout).send().ok()?;
-    let resp = resp.error_for_status().ok()?;
-    let bytes = resp.bytes().ok()?;
-    Some(bytes.to_vec())
+    let mut resp = resp.error_for_status().ok()?;
+    // 直接读入按 Content-Length 预分配的 Vec，避免 bytes() 之后再 to_vec() 整体拷贝一次。
+    let hint = resp.content_length().unwrap_or(0).min(MAX_PREALLOC_BYTES) as usize;
+    let mut buf = Vec::with_capacity(hint);
+    resp.read_to_end(&mut buf).ok()?;
+    Some(buf)
 }
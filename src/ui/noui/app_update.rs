@@ -63,8 +63,7 @@ pub(super) fn check_update_menu() -> Result<()> {
         }
 
         let ans = super::read_line("是否对该版本设置不再提醒？[y/N]: ")?;
-        let ans = ans.trim().to_ascii_lowercase();
-        if ans == "y" || ans == "yes" {
+        if super::confirm_answer(&ans, false) {
             app_update::dismiss_release_tag(&report.latest.tag_name)?;
             println!("已设置：不再提醒 {}\n", report.latest.tag_name);
         }
@@ -2,6 +2,7 @@
 //!
 //! 提供交互式菜单修改 `config.yml`。
 
+use std::fmt::Write as _;
 use std::fs;
 use std::path::Path;
 
@@ -255,36 +256,22 @@ pub(super) fn show_config_menu(config: &mut Config) -> Result<()> {
     ];
 
     loop {
-        println!("\n=== 配置选项 ===");
-        for (idx, opt) in OPTS.iter().enumerate() {
-            let mut name = opt.name.to_string();
-            if matches!(opt.field, ConfigField::EnableSegmentComments)
-                && config.novel_format.eq_ignore_ascii_case("txt")
-            {
-                name.push_str("（TXT 不支持）");
-            }
-            println!(
-                "{}. {}: {}",
-                idx + 1,
-                name,
-                config_value_display(config, opt.field)
-            );
-        }
-        println!("0. 返回主菜单");
+        print!("{}", render_config_menu(OPTS, config));
 
         let choice = super::read_line("\n请选择要修改的配置项编号: ")?;
-        let choice = choice.trim();
-        if choice == "0" {
-            break;
-        }
-        let Ok(idx) = choice.parse::<usize>() else {
-            println!("请输入数字编号");
-            continue;
+        // 只解析一次：0 表示返回，其余编号在同一次匹配里完成范围校验
+        let idx = match choice.trim().parse::<usize>() {
+            Ok(0) => break,
+            Ok(idx) if idx <= OPTS.len() => idx,
+            Ok(_) => {
+                println!("编号超出范围");
+                continue;
+            }
+            Err(_) => {
+                println!("请输入数字编号");
+                continue;
+            }
         };
-        if idx == 0 || idx > OPTS.len() {
-            println!("编号超出范围");
-            continue;
-        }
         let opt = OPTS[idx - 1];
         let cur = config_value_display(config, opt.field);
 
@@ -325,58 +312,103 @@ pub(super) fn show_config_menu(config: &mut Config) -> Result<()> {
     Ok(())
 }
 
+/// 整个菜单先拼进一个缓冲区再一次性输出，避免逐行加锁写 stdout。
+fn render_config_menu(opts: &[ConfigOption], config: &Config) -> String {
+    let txt_format = config.novel_format.eq_ignore_ascii_case("txt");
+    let mut out = String::with_capacity(64 * (opts.len() + 2));
+    out.push_str("\n=== 配置选项 ===\n");
+    for (idx, opt) in opts.iter().enumerate() {
+        let suffix = if txt_format && matches!(opt.field, ConfigField::EnableSegmentComments) {
+            "（TXT 不支持）"
+        } else {
+            ""
+        };
+        let _ = writeln!(
+            out,
+            "{}. {}{}: {}",
+            idx + 1,
+            opt.name,
+            suffix,
+            ConfigValueDisplay(config, opt.field)
+        );
+    }
+    out.push_str("0. 返回主菜单\n");
+    out
+}
+
 fn config_value_display(config: &Config, field: ConfigField) -> String {
-    match field {
-        ConfigField::SavePath => config.save_path.clone(),
-        ConfigField::NovelFormat => {
-            output_format_label(config.current_output_format_choice()).to_string()
+    ConfigValueDisplay(config, field).to_string()
+}
+
+/// 配置项当前值的展示包装：渲染菜单时直接写进输出缓冲区，不必为每一项先分配一个 String。
+struct ConfigValueDisplay<'a>(&'a Config, ConfigField);
+
+impl std::fmt::Display for ConfigValueDisplay<'_> {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        let config = self.0;
+        match self.1 {
+            ConfigField::SavePath => f.write_str(&config.save_path),
+            ConfigField::NovelFormat => {
+                f.write_str(output_format_label(config.current_output_format_choice()))
+            }
+            ConfigField::AutoClearDump => write!(f, "{}", config.auto_clear_dump),
+            ConfigField::AllowOverwriteFiles => write!(f, "{}", config.allow_overwrite_files),
+            ConfigField::PreferredBookNameField => f.write_str(book_name_field_to_chinese(
+                &config.preferred_book_name_field,
+            )),
+            ConfigField::EnableAudiobook => write!(f, "{}", config.enable_audiobook),
+            ConfigField::AudiobookVoice => f.write_str(&config.audiobook_voice),
+            ConfigField::AudiobookRate => f.write_str(&config.audiobook_rate),
+            ConfigField::AudiobookVolume => f.write_str(&config.audiobook_volume),
+            ConfigField::AudiobookPitch => f.write_str(&config.audiobook_pitch),
+            ConfigField::AudiobookConcurrency => write!(f, "{}", config.audiobook_concurrency),
+            ConfigField::AudiobookFormat => f.write_str(&config.audiobook_format),
+            ConfigField::MaxWorkers => write!(f, "{}", config.max_workers),
+            ConfigField::RequestTimeout => write!(f, "{}", config.request_timeout),
+            ConfigField::MaxRetries => write!(f, "{}", config.max_retries),
+            ConfigField::MinWaitTime => write!(f, "{}", config.min_wait_time),
+            ConfigField::MaxWaitTime => write!(f, "{}", config.max_wait_time),
+            ConfigField::MinConnectTimeout => write!(f, "{}", config.min_connect_timeout),
+            ConfigField::UseOfficialApi => write!(f, "{}", config.use_official_api),
+            ConfigField::ApiEndpoints => write_joined(f, &config.api_endpoints),
+            ConfigField::EnableSegmentComments => write!(f, "{}", config.enable_segment_comments),
+            ConfigField::SegmentCommentsTopN => write!(f, "{}", config.segment_comments_top_n),
+            ConfigField::SegmentCommentsWorkers => write!(f, "{}", config.segment_comments_workers),
+            ConfigField::DownloadCommentImages => write!(f, "{}", config.download_comment_images),
+            ConfigField::DownloadCommentAvatars => write!(f, "{}", config.download_comment_avatars),
+            ConfigField::MediaDownloadWorkers => write!(f, "{}", config.media_download_workers),
+            ConfigField::BlockedMediaDomains => write_joined(f, &config.blocked_media_domains),
+            ConfigField::ForceConvertImagesToJpeg => {
+                write!(f, "{}", config.force_convert_images_to_jpeg)
+            }
+            ConfigField::JpegRetryConvert => write!(f, "{}", config.jpeg_retry_convert),
+            ConfigField::JpegQuality => write!(f, "{}", config.jpeg_quality),
+            ConfigField::ConvertHeicToJpeg => write!(f, "{}", config.convert_heic_to_jpeg),
+            ConfigField::KeepHeicOriginal => write!(f, "{}", config.keep_heic_original),
+            ConfigField::MediaLimitPerChapter => write!(f, "{}", config.media_limit_per_chapter),
+            ConfigField::MediaMaxDimensionPx => write!(f, "{}", config.media_max_dimension_px),
+            ConfigField::FirstLineIndentEm => write!(f, "{}", config.first_line_indent_em),
+            ConfigField::OldCli => write!(f, "{}", config.old_cli),
         }
-        ConfigField::AutoClearDump => config.auto_clear_dump.to_string(),
-        ConfigField::AllowOverwriteFiles => config.allow_overwrite_files.to_string(),
-        ConfigField::PreferredBookNameField => {
-            book_name_field_to_chinese(&config.preferred_book_name_field).to_string()
+    }
+}
+
+fn write_joined(f: &mut std::fmt::Formatter<'_>, items: &[String]) -> std::fmt::Result {
+    for (i, item) in items.iter().enumerate() {
+        if i > 0 {
+            f.write_str(",")?;
         }
-        ConfigField::EnableAudiobook => config.enable_audiobook.to_string(),
-        ConfigField::AudiobookVoice => config.audiobook_voice.clone(),
-        ConfigField::AudiobookRate => config.audiobook_rate.clone(),
-        ConfigField::AudiobookVolume => config.audiobook_volume.clone(),
-        ConfigField::AudiobookPitch => config.audiobook_pitch.clone(),
-        ConfigField::AudiobookConcurrency => config.audiobook_concurrency.to_string(),
-        ConfigField::AudiobookFormat => config.audiobook_format.clone(),
-        ConfigField::MaxWorkers => config.max_workers.to_string(),
-        ConfigField::RequestTimeout => config.request_timeout.to_string(),
-        ConfigField::MaxRetries => config.max_retries.to_string(),
-        ConfigField::MinWaitTime => config.min_wait_time.to_string(),
-        ConfigField::MaxWaitTime => config.max_wait_time.to_string(),
-        ConfigField::MinConnectTimeout => config.min_connect_timeout.to_string(),
-        ConfigField::UseOfficialApi => config.use_official_api.to_string(),
-        ConfigField::ApiEndpoints => config.api_endpoints.join(","),
-        ConfigField::EnableSegmentComments => config.enable_segment_comments.to_string(),
-        ConfigField::SegmentCommentsTopN => config.segment_comments_top_n.to_string(),
-        ConfigField::SegmentCommentsWorkers => config.segment_comments_workers.to_string(),
-        ConfigField::DownloadCommentImages => config.download_comment_images.to_string(),
-        ConfigField::DownloadCommentAvatars => config.download_comment_avatars.to_string(),
-        ConfigField::MediaDownloadWorkers => config.media_download_workers.to_string(),
-        ConfigField::BlockedMediaDomains => config.blocked_media_domains.join(","),
-        ConfigField::ForceConvertImagesToJpeg => config.force_convert_images_to_jpeg.to_string(),
-        ConfigField::JpegRetryConvert => config.jpeg_retry_convert.to_string(),
-        ConfigField::JpegQuality => config.jpeg_quality.to_string(),
-        ConfigField::ConvertHeicToJpeg => config.convert_heic_to_jpeg.to_string(),
-        ConfigField::KeepHeicOriginal => config.keep_heic_original.to_string(),
-        ConfigField::MediaLimitPerChapter => config.media_limit_per_chapter.to_string(),
-        ConfigField::MediaMaxDimensionPx => config.media_max_dimension_px.to_string(),
-        ConfigField::FirstLineIndentEm => config.first_line_indent_em.to_string(),
-        ConfigField::OldCli => config.old_cli.to_string(),
+        f.write_str(item)?;
     }
+    Ok(())
 }
 
 fn apply_config_edit(config: &mut Config, opt: ConfigOption, text: &str) -> Result<()> {
     match opt.ty {
         ConfigValueType::Bool => {
-            let v = matches!(
-                text.to_ascii_lowercase().as_str(),
-                "true" | "1" | "yes" | "y"
-            );
+            let v = ["true", "1", "yes", "y"]
+                .iter()
+                .any(|truthy| text.eq_ignore_ascii_case(truthy));
             set_bool(config, opt.field, v)?;
         }
         ConfigValueType::Int => {
@@ -633,25 +665,29 @@ fn chinese_to_book_name_field(chinese: &str) -> Option<String> {
 fn show_selection_prompt(field: ConfigField, current: &str) -> Result<Option<String>> {
     match field {
         ConfigField::NovelFormat => {
+            let choices = output_format_choices();
             println!("\n当前: {}", current);
-            for (idx, (_, label)) in output_format_choices().iter().enumerate() {
+            for (idx, (_, label)) in choices.iter().enumerate() {
                 println!("  {}. {}", idx + 1, label);
             }
             println!("  0. 取消");
             let choice = super::read_line("请选择: ")?;
             let choice = choice.trim();
-            if choice == "0" || choice.is_empty() {
+            if choice.is_empty() {
                 return Ok(None);
             }
-            let Ok(idx) = choice.parse::<usize>() else {
-                println!("请输入数字编号");
-                return Ok(None);
-            };
-            if idx == 0 || idx > output_format_choices().len() {
-                println!("编号超出范围");
-                return Ok(None);
+            match choice.parse::<usize>() {
+                Ok(0) => Ok(None),
+                Ok(idx) if idx <= choices.len() => Ok(Some(choices[idx - 1].0.to_string())),
+                Ok(_) => {
+                    println!("编号超出范围");
+                    Ok(None)
+                }
+                Err(_) => {
+                    println!("请输入数字编号");
+                    Ok(None)
+                }
             }
-            Ok(Some(output_format_choices()[idx - 1].0.to_string()))
         }
         ConfigField::PreferredBookNameField => {
             const OPTIONS: &[(&str, &str)] = &[
@@ -667,18 +703,21 @@ fn show_selection_prompt(field: ConfigField, current: &str) -> Result<Option<Str
             println!("  0. 取消");
             let choice = super::read_line("请选择: ")?;
             let choice = choice.trim();
-            if choice == "0" || choice.is_empty() {
+            if choice.is_empty() {
                 return Ok(None);
             }
-            let Ok(idx) = choice.parse::<usize>() else {
-                println!("请输入数字编号");
-                return Ok(None);
-            };
-            if idx == 0 || idx > OPTIONS.len() {
-                println!("编号超出范围");
-                return Ok(None);
+            match choice.parse::<usize>() {
+                Ok(0) => Ok(None),
+                Ok(idx) if idx <= OPTIONS.len() => Ok(Some(OPTIONS[idx - 1].0.to_string())),
+                Ok(_) => {
+                    println!("编号超出范围");
+                    Ok(None)
+                }
+                Err(_) => {
+                    println!("请输入数字编号");
+                    Ok(None)
+                }
             }
-            Ok(Some(OPTIONS[idx - 1].0.to_string()))
         }
         _ => Ok(None),
     }
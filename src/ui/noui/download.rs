@@ -1,14 +1,15 @@
 //! 无 UI 下载交互与执行。
 
 use std::fs;
+use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::time::Instant;
 
 use anyhow::{Context, Result, anyhow};
 
+use crate::base_system::book_paths;
 use crate::base_system::context::Config;
 use crate::download::downloader as dl;
-use crate::download::downloader::ChapterRef;
 
 #[derive(Debug, Clone, Copy)]
 struct DownloadOptions {
@@ -83,7 +84,7 @@ fn download_book_with_options(
 ) -> Result<()> {
     let start_time = Instant::now();
 
-    let plan = dl::prepare_download_plan(config, book_id, dl::BookMeta::default())
+    let mut plan = dl::prepare_download_plan(config, book_id, dl::BookMeta::default())
         .with_context(|| format!("准备下载计划失败: book_id={}", book_id))?;
 
     let book_name = plan
@@ -106,29 +107,56 @@ fn download_book_with_options(
     if !plan.meta.tags.is_empty() {
         println!("标签: {}", plan.meta.tags.join("|"));
     }
-    if let Some(desc) = plan.meta.description.as_deref() {
-        let mut short = desc.to_string();
-        if short.chars().count() > 50 {
-            short = short.chars().take(50).collect::<String>() + "...";
+    // 空白简介不展示；截断时只扫描到第 51 个字符并直接切片，不复制整段简介。
+    if let Some(desc) = plan
+        .meta
+        .description
+        .as_deref()
+        .map(str::trim)
+        .filter(|d| !d.is_empty())
+    {
+        match desc.char_indices().nth(50) {
+            Some((cut, _)) => println!("简介: {}...", &desc[..cut]),
+            None => println!("简介: {}", desc),
         }
-        println!("简介: {}", short);
     }
 
-    // 初始化 BookManager 并尝试加载历史状态
-    let mut manager = dl::init_manager_from_plan(config, &plan)?;
-    let resumed =
-        manager.load_existing_status(&manager.book_id.clone(), &manager.book_name.clone());
+    // 初始化 BookManager 并尝试加载历史状态。
+    // 计划阶段刚下载的封面字节仍在内存中：解码与字符画转换放到后台线程，
+    // 与读取历史状态重叠，而不是等状态加载完再在主线程上解码。
+    let (mut manager, resumed, cover_art) = std::thread::scope(|s| -> Result<_> {
+        let cover_job = plan.cover_image.as_deref().map(|bytes| {
+            s.spawn(move || {
+                image::load_from_memory(bytes)
+                    .ok()
+                    .map(|img| render_cover_ascii(&img))
+            })
+        });
+        let mut manager = dl::init_manager_from_plan(config, &plan)?;
+        let resumed =
+            manager.load_existing_status(&manager.book_id.clone(), &manager.book_name.clone());
+        let cover_art = cover_job.and_then(|job| job.join().ok().flatten());
+        Ok((manager, resumed, cover_art))
+    })?;
     if resumed {
         println!("\n已检测到历史下载记录，可继续下载或选择重新下载。\n");
     }
 
-    // 若封面已经下载到状态目录，尝试 ASCII 预览
-    if let Some(cover) = find_cover_image(manager.book_folder()) {
-        let _ = preview_cover_ascii(&cover);
+    // 封面 ASCII 预览：没有现成字节时回退到读取状态目录里已有的封面文件。
+    let cover_art = match plan.cover_image {
+        Some(_) => cover_art,
+        None => find_cover_image(manager.book_folder())
+            .and_then(|p| image::open(p).ok())
+            .map(|img| render_cover_ascii(&img)),
+    };
+    if let Some(art) = cover_art {
+        let mut out = std::io::stdout().lock();
+        let _ = out.write_all(&art).and_then(|()| out.flush());
     }
 
     let total = plan.chapters.len();
-    let (downloaded_ok, failed_count) = count_download_state(&manager, &plan.chapters);
+    let (downloaded_ok, failed_count) =
+        manager.count_chapter_states(plan.chapters.iter().map(|ch| ch.id.as_str()));
     println!(
         "共发现 {} 章，下载失败 {} 章，已下载 {} 章",
         total, failed_count, downloaded_ok
@@ -152,7 +180,10 @@ fn download_book_with_options(
         }
         DownloadMode::Full => {
             manager.downloaded.clear();
-            println!("将重新下载全部章节");
+            // 全部重新下载：跳过目录新鲜缓存重新拉取目录，不沿用预览时可能过期的章节列表。
+            plan = dl::prepare_download_plan_uncached(config, book_id, dl::BookMeta::default())
+                .with_context(|| format!("刷新下载计划失败: book_id={}", book_id))?;
+            println!("将重新下载全部章节（共 {} 章）", plan.chapters.len());
         }
         DownloadMode::RangeIgnoreHistory | DownloadMode::RangeOrAll => {
             range = if options.interactive {
@@ -174,20 +205,22 @@ fn download_book_with_options(
         return Ok(());
     }
 
-    let pending = match mode {
-        DownloadMode::FailedOnly => dl::pending_failed(&manager, &chosen_chapters),
-        _ => dl::pending_resume(&manager, &chosen_chapters),
+    // 这里只为提示数量：一次遍历数出成功/失败，待下载列表由下载流程自己构建。
+    let (chosen_ok, chosen_failed) =
+        manager.count_chapter_states(chosen_chapters.iter().map(|ch| ch.id.as_str()));
+    let pending_len = match mode {
+        DownloadMode::FailedOnly => chosen_failed,
+        _ => chosen_chapters.len().saturating_sub(chosen_ok),
     };
 
     if matches!(mode, DownloadMode::Resume) {
         println!(
             "继续下载剩余章节: {} 章 (已完成 {})",
-            pending.len(),
-            chosen_chapters.len().saturating_sub(pending.len())
+            pending_len, chosen_ok
         );
     }
 
-    if pending.is_empty() {
+    if pending_len == 0 {
         println!("没有需要下载的章节，将仅补齐段评缓存并执行收尾生成。\n");
     }
 
@@ -196,10 +229,11 @@ fn download_book_with_options(
 
     let retry_failed = if options.interactive {
         dl::RetryFailed::Decide(Box::new(|pending_len| {
-            let ans = super::read_line("是否重新下载错误章节？[Y/n]: ")
-                .map(|s| s.trim().to_ascii_lowercase())
-                .unwrap_or_else(|_| "n".to_string());
-            if ans == "n" {
+            // 读取失败按“n”处理；默认（直接回车）为重新下载。
+            let declined = super::read_line("是否重新下载错误章节？[Y/n]: ")
+                .map(|s| !super::confirm_answer(&s, true))
+                .unwrap_or(true);
+            if declined {
                 println!("失败章节已保留在缓存/状态文件中。\n");
                 return false;
             }
@@ -275,36 +309,41 @@ fn select_download_mode(has_failed: bool) -> Result<DownloadMode> {
     }
     println!("4. 指定章节范围重新下载 (忽略历史记录)");
     println!("q. 取消");
-    let sel = super::read_line("请选择(默认1): ")?;
-    let sel = sel.trim().to_ascii_lowercase();
-    let mode = match sel.as_str() {
-        "" | "1" => DownloadMode::Resume,
-        "2" => DownloadMode::Full,
-        "3" if has_failed => DownloadMode::FailedOnly,
-        "4" => DownloadMode::RangeIgnoreHistory,
-        "q" => DownloadMode::Cancel,
-        _ => DownloadMode::Resume,
-    };
-    Ok(mode)
+    loop {
+        let sel = super::read_line("请选择(默认1): ")?;
+        let sel = sel.trim();
+        // 输错时重新询问，而不是静默按“继续下载”处理。
+        let mode = match sel {
+            "" | "1" => DownloadMode::Resume,
+            "2" => DownloadMode::Full,
+            "3" if has_failed => DownloadMode::FailedOnly,
+            "4" => DownloadMode::RangeIgnoreHistory,
+            s if s.eq_ignore_ascii_case("q") => DownloadMode::Cancel,
+            _ => {
+                println!("无效选项，请重新输入");
+                continue;
+            }
+        };
+        return Ok(mode);
+    }
 }
 
 fn prompt_range(total: usize) -> Result<Option<dl::ChapterRange>> {
-    let text = super::read_line("输入章节范围 形如 10~200 (留空表示全部): ")?;
-    let text = text.trim();
-    if text.is_empty() {
-        return Ok(None);
-    }
-    let Some((a, b)) = text.split_once('~') else {
-        println!("范围格式错误，应为 a~b，将使用全部章节");
-        return Ok(None);
-    };
-    let Ok(mut start) = a.trim().parse::<usize>() else {
-        println!("范围解析失败，将使用全部章节");
-        return Ok(None);
-    };
-    let Ok(mut end) = b.trim().parse::<usize>() else {
-        println!("范围解析失败，将使用全部章节");
-        return Ok(None);
+    // 输错时重新询问：回退到“全部章节”会把一次笔误变成整本书的重新下载。
+    let (mut start, mut end) = loop {
+        let text = super::read_line("输入章节范围 形如 10~200 (留空表示全部): ")?;
+        let text = text.trim();
+        if text.is_empty() {
+            return Ok(None);
+        }
+        let Some((a, b)) = text.split_once('~') else {
+            println!("范围格式错误，应为 a~b，请重新输入");
+            continue;
+        };
+        match (a.trim().parse::<usize>(), b.trim().parse::<usize>()) {
+            (Ok(start), Ok(end)) => break (start, end),
+            _ => println!("范围解析失败，请输入数字，如 10~200"),
+        }
     };
     if start == 0 {
         start = 1;
@@ -321,77 +360,55 @@ fn prompt_range(total: usize) -> Result<Option<dl::ChapterRange>> {
     Ok(Some(dl::ChapterRange { start, end }))
 }
 
-fn count_download_state(
-    manager: &crate::book_parser::book_manager::BookManager,
-    chapters: &[ChapterRef],
-) -> (usize, usize) {
-    let mut ok = 0usize;
-    let mut failed = 0usize;
-    for ch in chapters {
-        match manager.downloaded.get(&ch.id) {
-            Some((_, Some(_))) => ok += 1,
-            Some((_, None)) => failed += 1,
-            None => {}
-        }
-    }
-    (ok, failed)
-}
-
 fn find_cover_image(folder: &Path) -> Option<PathBuf> {
     let rd = fs::read_dir(folder).ok()?;
     for entry in rd.flatten() {
         let p = entry.path();
-        if !p.is_file() {
-            continue;
-        }
-        let ext = p
-            .extension()
-            .and_then(|e| e.to_str())
-            .unwrap_or("")
-            .to_ascii_lowercase();
-        if matches!(ext.as_str(), "jpg" | "jpeg" | "png" | "webp") {
+        let is_img = p.extension().and_then(|e| e.to_str()).is_some_and(|ext| {
+            ["jpg", "jpeg", "png", "webp"]
+                .iter()
+                .any(|x| ext.eq_ignore_ascii_case(x))
+        });
+        if is_img && book_paths::dir_entry_is_file(&entry) {
             return Some(p);
         }
     }
     None
 }
 
-fn preview_cover_ascii(image_path: &Path) -> Result<()> {
+/// 把封面缩放成字符画，返回可一次性写到终端的字节（不做任何输出，可在后台线程调用）。
+fn render_cover_ascii(img: &image::DynamicImage) -> Vec<u8> {
     let (cols, rows) = crossterm::terminal::size().unwrap_or((80, 24));
     let cols = cols.max(40) as u32;
     let rows = rows.max(10) as u32;
-    println!(
-        "\n{}封面预览{}",
-        "=".repeat((cols as usize).saturating_sub(16) / 2),
-        "=".repeat((cols as usize).saturating_sub(16) / 2)
-    );
-
-    let img = image::open(image_path)
-        .with_context(|| format!("打开封面失败: {}", image_path.display()))?;
-    let gray = img.to_luma8();
 
     // 字符宽高比矫正：字符通常更“高”，所以宽度多取一些、并降低高度
     let target_w = cols;
     let target_h = (rows.saturating_sub(6)).max(8);
-    let resized = image::imageops::resize(
-        &gray,
-        target_w,
-        target_h,
-        image::imageops::FilterType::Triangle,
-    );
+    // 先缩到终端尺寸再转灰度：只为实际要画的几千个字符格付出像素转换的开销，
+    // 而不是对整张原图做一次全分辨率的灰度拷贝。
+    let resized = img.thumbnail_exact(target_w, target_h).to_luma8();
 
     const PALETTE: &[u8] = b" .:-=+*#%@";
-    for y in 0..resized.height() {
-        let mut line = String::with_capacity(resized.width() as usize);
-        for x in 0..resized.width() {
-            let v = resized.get_pixel(x, y)[0] as usize;
-            let idx = v * (PALETTE.len() - 1) / 255;
-            line.push(PALETTE[idx] as char);
-        }
-        println!("{}", line);
+    // 标题与整幅字符画先写入同一个缓冲区，由调用方加锁一次性输出并 flush，
+    // 整个预览只落一次 write，避免逐行 println。
+    let width = resized.width() as usize;
+    let rule = "=".repeat((cols as usize).saturating_sub(16) / 2);
+    let mut art = Vec::with_capacity((width + 1) * resized.height() as usize + rule.len() * 2 + 32);
+    art.push(b'\n');
+    art.extend_from_slice(rule.as_bytes());
+    art.extend_from_slice("封面预览".as_bytes());
+    art.extend_from_slice(rule.as_bytes());
+    art.push(b'\n');
+    for row in resized.as_raw().chunks_exact(width.max(1)) {
+        art.extend(
+            row.iter()
+                .map(|&v| PALETTE[v as usize * (PALETTE.len() - 1) / 255]),
+        );
+        art.push(b'\n');
     }
-    println!();
-    Ok(())
+    art.push(b'\n');
+    art
 }
 
 #[cfg(test)]
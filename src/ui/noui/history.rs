@@ -1,5 +1,7 @@
 //! noUI 下载历史查看。
 
+use std::fmt::Write as _;
+
 use anyhow::Result;
 
 use crate::base_system::download_history::read_download_history;
@@ -9,16 +11,18 @@ pub(super) fn show_history_menu() -> Result<()> {
 
     loop {
         let items = read_download_history(50, keyword.as_deref());
-        println!("\n===== 下载历史（最近 50 条） =====");
+        // 整页历史先渲染进一个缓冲区再一次性输出，避免逐条 println。
+        let mut page = String::from("\n===== 下载历史（最近 50 条） =====\n");
         if let Some(k) = keyword.as_deref() {
-            println!("过滤关键字: {}", k);
+            let _ = writeln!(page, "过滤关键字: {}", k);
         }
 
         if items.is_empty() {
-            println!("暂无记录");
+            page.push_str("暂无记录\n");
         } else {
             for (i, it) in items.iter().enumerate() {
-                println!(
+                let _ = writeln!(
+                    page,
                     "{:>2}. [{}] 《{}》({}) | 作者: {} | {} | 状态: {}",
                     i + 1,
                     it.timestamp,
@@ -35,7 +39,8 @@ pub(super) fn show_history_menu() -> Result<()> {
             }
         }
 
-        println!("\n操作：Enter=刷新, f=设置过滤关键字, c=清空过滤, q=返回");
+        page.push_str("\n操作：Enter=刷新, f=设置过滤关键字, c=清空过滤, q=返回");
+        println!("{page}");
         let cmd = super::read_line("选择: ")?;
         let cmd = cmd.trim();
         if cmd.is_empty() {
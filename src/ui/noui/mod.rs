@@ -65,6 +65,8 @@ Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite \n\
     app_update::startup_check();
 
     let mut shown_iid_error: Option<String> = None;
+    // 提示语只依赖保存目录：缓存起来，仅在配置菜单返回后重建。
+    let mut prompt = main_menu_prompt(config);
     loop {
         if let Some(err) = prewarm_state::prewarm_error()
             && shown_iid_error.as_deref() != Some(err.as_str())
@@ -73,10 +75,6 @@ Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite \n\
             shown_iid_error = Some(err);
         }
 
-        let prompt = format!(
-            "旧 CLI 已禁用新建下载；请输入命令（s配置 / h下载历史 / u更新小说 / c检查更新 / U程序自更新 / q退出，默认保存到 {}）：",
-            config.default_save_dir().display()
-        );
         let input = read_line(&prompt)?;
         let text = input.trim();
         if text.is_empty() {
@@ -88,6 +86,7 @@ Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite \n\
         }
         if text.eq_ignore_ascii_case("s") {
             show_config_menu(config)?;
+            prompt = main_menu_prompt(config);
             continue;
         }
         if text.eq_ignore_ascii_case("h") {
@@ -127,6 +126,26 @@ Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite \n\
     Ok(())
 }
 
+fn main_menu_prompt(config: &Config) -> String {
+    format!(
+        "旧 CLI 已禁用新建下载；请输入命令（s配置 / h下载历史 / u更新小说 / c检查更新 / U程序自更新 / q退出，默认保存到 {}）：",
+        config.default_save_dir().display()
+    )
+}
+
+/// 解析 `[Y/n]` / `[y/N]` 类确认输入：忽略首尾空白与大小写，空输入或无法识别时取 `default`。
+/// 直接与原始输入比较，不为判断再分配一份小写副本。
+fn confirm_answer(input: &str, default: bool) -> bool {
+    let ans = input.trim();
+    if ans.eq_ignore_ascii_case("y") || ans.eq_ignore_ascii_case("yes") {
+        true
+    } else if ans.eq_ignore_ascii_case("n") || ans.eq_ignore_ascii_case("no") {
+        false
+    } else {
+        default
+    }
+}
+
 fn read_line(prompt: &str) -> Result<String> {
     print!("{}", prompt);
     io::stdout().flush().ok();
@@ -1,5 +1,6 @@
 //! 无 UI 的更新检查与提示。
 
+use std::fmt::Write as _;
 use std::io::{self, Write};
 use std::path::Path;
 
@@ -30,23 +31,24 @@ pub(super) fn update_menu(config: &Config) -> Result<Option<String>> {
         return Ok(None);
     }
 
+    // 列表在循环中不会变化：整段菜单只渲染一次，每轮一次性输出。
+    let mut menu = String::from("\n===== 可供更新的小说列表 =====\n");
+    render_entry_list(&mut menu, &updates);
+    let opt_no_update = if no_updates.is_empty() {
+        None
+    } else {
+        let n = updates.len() + 1;
+        let _ = writeln!(menu, "{}. 无更新 ({})", n, no_updates.len());
+        Some(n)
+    };
+    menu.push_str("q. 退出\n");
+
     loop {
-        println!("\n===== 可供更新的小说列表 =====");
-        for (idx, u) in updates.iter().enumerate() {
-            println!("{}. {}", idx + 1, u.label);
-        }
-        let opt_no_update = if no_updates.is_empty() {
-            None
-        } else {
-            let n = updates.len() + 1;
-            println!("{}. 无更新 ({})", n, no_updates.len());
-            Some(n)
-        };
-        println!("q. 退出\n");
+        println!("{menu}");
 
         let sel = super::read_line("请输入编号：")?;
-        let sel = sel.trim().to_ascii_lowercase();
-        if sel == "q" {
+        let sel = sel.trim();
+        if sel.eq_ignore_ascii_case("q") {
             println!("已取消更新\n");
             return Ok(None);
         }
@@ -59,15 +61,12 @@ pub(super) fn update_menu(config: &Config) -> Result<Option<String>> {
             return Ok(Some(updates[n - 1].book_id.clone()));
         }
 
-        if let Some(no_idx) = opt_no_update
-            && n == no_idx
-            && let Some(book_id) = select_from_list(&no_updates, "无更新的书籍")?
-        {
-            return Ok(Some(book_id));
-        }
         if let Some(no_idx) = opt_no_update
             && n == no_idx
         {
+            if let Some(book_id) = select_from_list(&no_updates, "无更新的书籍")? {
+                return Ok(Some(book_id));
+            }
             continue;
         }
 
@@ -77,16 +76,16 @@ pub(super) fn update_menu(config: &Config) -> Result<Option<String>> {
 }
 
 fn select_from_list(list: &[UpdateEntry], title: &str) -> Result<Option<String>> {
+    let mut menu = format!("\n===== {} =====\n", title);
+    render_entry_list(&mut menu, list);
+    menu.push_str("q. 取消并返回上级菜单\n");
+
     loop {
-        println!("\n===== {} =====", title);
-        for (idx, u) in list.iter().enumerate() {
-            println!("{}. {}", idx + 1, u.label);
-        }
-        println!("q. 取消并返回上级菜单\n");
+        println!("{menu}");
 
         let sel = super::read_line("请输入编号：")?;
-        let sel = sel.trim().to_ascii_lowercase();
-        if sel == "q" {
+        let sel = sel.trim();
+        if sel.eq_ignore_ascii_case("q") {
             return Ok(None);
         }
         let Ok(n) = sel.parse::<usize>() else {
@@ -100,18 +99,28 @@ fn select_from_list(list: &[UpdateEntry], title: &str) -> Result<Option<String>>
     }
 }
 
+fn render_entry_list(out: &mut String, entries: &[UpdateEntry]) {
+    for (idx, u) in entries.iter().enumerate() {
+        let _ = writeln!(out, "{}. {}", idx + 1, u.label);
+    }
+}
+
 fn scan_updates(_config: &Config, save_dir: &Path) -> Result<(Vec<UpdateEntry>, Vec<UpdateEntry>)> {
     println!("开始扫描更新（会边检查边显示结果）…");
     let scan = novel_updates::scan_novel_updates_with_progress(save_dir, |progress| {
         let row = progress.row;
-        print!(
+        // 每本书只加一次 stdout 锁，进度与“发现更新”整段写出后刷新一次。
+        // 锁不能跨回调持有：扫描线程的日志同样输出到 stdout。
+        let mut out = io::stdout().lock();
+        let _ = write!(
+            out,
             "\r已检查 {}/{}，当前：《{}》({})      ",
             progress.scanned, progress.total, row.book_name, row.book_id
         );
-        let _ = io::stdout().flush();
         if row.has_update && !row.is_ignored {
-            println!("\n发现更新：{}", update_label(&row));
+            let _ = writeln!(out, "\n发现更新：{}", update_label(&row));
         }
+        let _ = out.flush();
     })?;
     println!(
         "\r扫描完成：有更新 {} 本，无更新 {} 本      ",
@@ -119,9 +128,12 @@ fn scan_updates(_config: &Config, save_dir: &Path) -> Result<(Vec<UpdateEntry>,
         scan.no_updates.len()
     );
 
-    let to_entry = |it: novel_updates::NovelUpdateRow| UpdateEntry {
-        book_id: it.book_id.clone(),
-        label: update_label(&it),
+    let to_entry = |it: novel_updates::NovelUpdateRow| {
+        let label = update_label(&it);
+        UpdateEntry {
+            book_id: it.book_id,
+            label,
+        }
     };
 
     Ok((
@@ -4,6 +4,24 @@
 
 use super::*;
 
+/// 关于页的固定说明文字：编译期拼好，重绘时直接复用，不再每帧逐段格式化。
+const ABOUT_INTRO: &str = concat!(
+    "项目地址: https://github.com/zhongbai2333/Tomato-Novel-Downloader\n",
+    "Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite\n",
+    "作者: zhongbai2333\n",
+    "本项目仅供学习交流使用，请勿用于商业及违法行为。\n",
+    "\n当前版本: v",
+    env!("CARGO_PKG_VERSION"),
+    "\n",
+);
+
+#[cfg(feature = "official-api")]
+const FREE_NOTICE: &str = concat!(
+    "\n===== 免费声明 =====\n",
+    "本程序完全免费，官方仓库: https://github.com/zhongbai2333/Tomato-Novel-Downloader\n",
+    "如果你为此付费，你被欺骗了。\n",
+);
+
 pub(super) fn handle_event_about(app: &mut App, event: Event) -> Result<()> {
     match event {
         Event::Key(key) if key.kind == KeyEventKind::Press => match key.code {
@@ -103,21 +121,10 @@ pub(super) fn draw_about(frame: &mut ratatui::Frame, app: &mut App) {
     frame.render_stateful_widget(btn_list, button_area, &mut app.about_btn_state);
     app.last_about_buttons = Some(button_area);
 
-    let mut text = String::new();
-    text.push_str("项目地址: https://github.com/zhongbai2333/Tomato-Novel-Downloader\n");
-    text.push_str("Fork From: https://github.com/Dlmily/Tomato-Novel-Downloader-Lite\n");
-    text.push_str("作者: zhongbai2333\n");
-    text.push_str("本项目仅供学习交流使用，请勿用于商业及违法行为。\n");
-    text.push_str(&format!("\n当前版本: v{}\n", env!("CARGO_PKG_VERSION")));
-
+    let mut text = String::with_capacity(ABOUT_INTRO.len() + 512);
+    text.push_str(ABOUT_INTRO);
     #[cfg(feature = "official-api")]
-    {
-        text.push_str("\n===== 免费声明 =====\n");
-        text.push_str(
-            "本程序完全免费，官方仓库: https://github.com/zhongbai2333/Tomato-Novel-Downloader\n",
-        );
-        text.push_str("如果你为此付费，你被欺骗了。\n");
-    }
+    text.push_str(FREE_NOTICE);
 
     text.push_str("\n===== 程序更新 =====\n");
     if cfg!(feature = "docker") {
@@ -692,13 +692,21 @@ pub(super) fn draw_config(frame: &mut ratatui::Frame, app: &mut App) {
         frame.render_stateful_widget(sb, sb_area, &mut sb_state);
     }
 
+    super::ensure_cfg_value_cache(app);
+    let cached_values = app
+        .cfg_cat_state
+        .selected()
+        .and_then(|cat| app.cfg_value_cache.as_ref()?.get(cat));
     let entries = super::current_cfg_entries(app);
     let entry_items: Vec<ListItem> = if let Some(entries) = entries {
         entries
             .iter()
             .enumerate()
             .map(|(idx, entry)| {
-                let val = super::current_cfg_value(app, entry.field);
+                let val = cached_values
+                    .and_then(|values| values.get(idx))
+                    .map(String::as_str)
+                    .unwrap_or_default();
                 let mut spans = vec![Span::raw(format!("{}: {}", entry.title, val))];
                 if let Some((cat_i, entry_i)) = app.cfg_editing
                     && Some(cat_i) == app.cfg_cat_state.selected()
@@ -68,7 +68,7 @@ pub(in crate::ui) struct ConfigEntry {
 #[derive(Debug, Clone)]
 pub(in crate::ui) struct ConfigCategory {
     pub(in crate::ui) title: &'static str,
-    pub(in crate::ui) entries: Vec<ConfigEntry>,
+    pub(in crate::ui) entries: &'static [ConfigEntry],
 }
 
 #[derive(Debug, Clone, Copy)]
@@ -188,204 +188,203 @@ pub(in crate::ui) fn cfg_combo_presets(field: ConfigField) -> Option<&'static [V
     }
 }
 
-pub(in crate::ui) fn build_config_categories() -> Vec<ConfigCategory> {
-    vec![
-        ConfigCategory {
-            title: "基础与格式",
-            entries: vec![
-                ConfigEntry {
-                    title: "保存路径",
-                    field: ConfigField::SavePath,
-                },
-                ConfigEntry {
-                    title: "小说格式",
-                    field: ConfigField::NovelFormat,
-                },
-                ConfigEntry {
-                    title: "首行缩进(em)",
-                    field: ConfigField::FirstLineIndentEm,
-                },
-                ConfigEntry {
-                    title: "自动清理缓存",
-                    field: ConfigField::AutoClearDump,
-                },
-                ConfigEntry {
-                    title: "下载完成后自动打开",
-                    field: ConfigField::AutoOpenDownloadedFiles,
-                },
-                ConfigEntry {
-                    title: "允许覆盖已存在文件",
-                    field: ConfigField::AllowOverwriteFiles,
-                },
-                ConfigEntry {
-                    title: "优先书名字段",
-                    field: ConfigField::PreferredBookNameField,
-                },
-                ConfigEntry {
-                    title: "旧版 CLI UI",
-                    field: ConfigField::OldCli,
-                },
-            ],
-        },
-        ConfigCategory {
-            title: "网络与调度",
-            entries: vec![
-                ConfigEntry {
-                    title: "最大线程数",
-                    field: ConfigField::MaxWorkers,
-                },
-                ConfigEntry {
-                    title: "请求超时(s)",
-                    field: ConfigField::RequestTimeout,
-                },
-                ConfigEntry {
-                    title: "最大重试次数",
-                    field: ConfigField::MaxRetries,
-                },
-                ConfigEntry {
-                    title: "最小连接超时(s)",
-                    field: ConfigField::MinConnectTimeout,
-                },
-                ConfigEntry {
-                    title: "最小等待时间(ms)",
-                    field: ConfigField::MinWait,
-                },
-                ConfigEntry {
-                    title: "最大等待时间(ms)",
-                    field: ConfigField::MaxWait,
-                },
-            ],
-        },
-        ConfigCategory {
-            title: "API",
-            entries: vec![
-                ConfigEntry {
-                    title: "使用官方API",
-                    field: ConfigField::UseOfficialApi,
-                },
-                ConfigEntry {
-                    title: "API 列表(逗号分隔)",
-                    field: ConfigField::ApiEndpoints,
-                },
-            ],
-        },
-        ConfigCategory {
-            title: "段评",
-            entries: vec![
-                ConfigEntry {
-                    title: "启用段评",
-                    field: ConfigField::EnableSegmentComments,
-                },
-                ConfigEntry {
-                    title: "每段评论数上限",
-                    field: ConfigField::SegmentCommentsTopN,
-                },
-                ConfigEntry {
-                    title: "段评并发线程数",
-                    field: ConfigField::SegmentCommentsWorkers,
-                },
-            ],
-        },
-        ConfigCategory {
-            title: "媒体下载",
-            entries: vec![
-                ConfigEntry {
-                    title: "下载评论图片",
-                    field: ConfigField::DownloadCommentImages,
-                },
-                ConfigEntry {
-                    title: "下载评论头像",
-                    field: ConfigField::DownloadCommentAvatars,
-                },
-                ConfigEntry {
-                    title: "媒体下载线程数",
-                    field: ConfigField::MediaDownloadWorkers,
-                },
-                ConfigEntry {
-                    title: "阻止的图片域名",
-                    field: ConfigField::BlockedMediaDomains,
-                },
-                ConfigEntry {
-                    title: "强制转成 JPEG",
-                    field: ConfigField::ForceConvertImagesToJpeg,
-                },
-                ConfigEntry {
-                    title: "失败重试再转 JPEG",
-                    field: ConfigField::JpegRetryConvert,
-                },
-                ConfigEntry {
-                    title: "JPEG 质量(0-100)",
-                    field: ConfigField::JpegQuality,
-                },
-                ConfigEntry {
-                    title: "HEIC 转 JPEG",
-                    field: ConfigField::ConvertHeicToJpeg,
-                },
-                ConfigEntry {
-                    title: "保留 HEIC 原图",
-                    field: ConfigField::KeepHeicOriginal,
-                },
-                ConfigEntry {
-                    title: "单章节媒体上限",
-                    field: ConfigField::MediaLimitPerChapter,
-                },
-                ConfigEntry {
-                    title: "媒体最大尺寸(px)",
-                    field: ConfigField::MediaMaxDimensionPx,
-                },
-            ],
-        },
-        ConfigCategory {
-            title: "有声书",
-            entries: vec![
-                ConfigEntry {
-                    title: "启用有声书",
-                    field: ConfigField::EnableAudiobook,
-                },
-                ConfigEntry {
-                    title: "发音人",
-                    field: ConfigField::AudiobookVoice,
-                },
-                ConfigEntry {
-                    title: "TTS 服务类型(edge/third_party)",
-                    field: ConfigField::AudiobookTtsProvider,
-                },
-                ConfigEntry {
-                    title: "第三方 TTS API 地址",
-                    field: ConfigField::AudiobookTtsApiUrl,
-                },
-                ConfigEntry {
-                    title: "第三方 TTS Token",
-                    field: ConfigField::AudiobookTtsApiToken,
-                },
-                ConfigEntry {
-                    title: "第三方 TTS 模型",
-                    field: ConfigField::AudiobookTtsModel,
-                },
-                ConfigEntry {
-                    title: "语速调整",
-                    field: ConfigField::AudiobookRate,
-                },
-                ConfigEntry {
-                    title: "音量调整",
-                    field: ConfigField::AudiobookVolume,
-                },
-                ConfigEntry {
-                    title: "音调调整",
-                    field: ConfigField::AudiobookPitch,
-                },
-                ConfigEntry {
-                    title: "输出格式(mp3/wav)",
-                    field: ConfigField::AudiobookFormat,
-                },
-                ConfigEntry {
-                    title: "并发生成章节数",
-                    field: ConfigField::AudiobookConcurrency,
-                },
-            ],
-        },
-    ]
-}
+/// 配置页的分类与字段表：编译期常量，App 直接持有 `&'static` 切片，无需运行时构建。
+pub(in crate::ui) const CONFIG_CATEGORIES: &[ConfigCategory] = &[
+    ConfigCategory {
+        title: "基础与格式",
+        entries: &[
+            ConfigEntry {
+                title: "保存路径",
+                field: ConfigField::SavePath,
+            },
+            ConfigEntry {
+                title: "小说格式",
+                field: ConfigField::NovelFormat,
+            },
+            ConfigEntry {
+                title: "首行缩进(em)",
+                field: ConfigField::FirstLineIndentEm,
+            },
+            ConfigEntry {
+                title: "自动清理缓存",
+                field: ConfigField::AutoClearDump,
+            },
+            ConfigEntry {
+                title: "下载完成后自动打开",
+                field: ConfigField::AutoOpenDownloadedFiles,
+            },
+            ConfigEntry {
+                title: "允许覆盖已存在文件",
+                field: ConfigField::AllowOverwriteFiles,
+            },
+            ConfigEntry {
+                title: "优先书名字段",
+                field: ConfigField::PreferredBookNameField,
+            },
+            ConfigEntry {
+                title: "旧版 CLI UI",
+                field: ConfigField::OldCli,
+            },
+        ],
+    },
+    ConfigCategory {
+        title: "网络与调度",
+        entries: &[
+            ConfigEntry {
+                title: "最大线程数",
+                field: ConfigField::MaxWorkers,
+            },
+            ConfigEntry {
+                title: "请求超时(s)",
+                field: ConfigField::RequestTimeout,
+            },
+            ConfigEntry {
+                title: "最大重试次数",
+                field: ConfigField::MaxRetries,
+            },
+            ConfigEntry {
+                title: "最小连接超时(s)",
+                field: ConfigField::MinConnectTimeout,
+            },
+            ConfigEntry {
+                title: "最小等待时间(ms)",
+                field: ConfigField::MinWait,
+            },
+            ConfigEntry {
+                title: "最大等待时间(ms)",
+                field: ConfigField::MaxWait,
+            },
+        ],
+    },
+    ConfigCategory {
+        title: "API",
+        entries: &[
+            ConfigEntry {
+                title: "使用官方API",
+                field: ConfigField::UseOfficialApi,
+            },
+            ConfigEntry {
+                title: "API 列表(逗号分隔)",
+                field: ConfigField::ApiEndpoints,
+            },
+        ],
+    },
+    ConfigCategory {
+        title: "段评",
+        entries: &[
+            ConfigEntry {
+                title: "启用段评",
+                field: ConfigField::EnableSegmentComments,
+            },
+            ConfigEntry {
+                title: "每段评论数上限",
+                field: ConfigField::SegmentCommentsTopN,
+            },
+            ConfigEntry {
+                title: "段评并发线程数",
+                field: ConfigField::SegmentCommentsWorkers,
+            },
+        ],
+    },
+    ConfigCategory {
+        title: "媒体下载",
+        entries: &[
+            ConfigEntry {
+                title: "下载评论图片",
+                field: ConfigField::DownloadCommentImages,
+            },
+            ConfigEntry {
+                title: "下载评论头像",
+                field: ConfigField::DownloadCommentAvatars,
+            },
+            ConfigEntry {
+                title: "媒体下载线程数",
+                field: ConfigField::MediaDownloadWorkers,
+            },
+            ConfigEntry {
+                title: "阻止的图片域名",
+                field: ConfigField::BlockedMediaDomains,
+            },
+            ConfigEntry {
+                title: "强制转成 JPEG",
+                field: ConfigField::ForceConvertImagesToJpeg,
+            },
+            ConfigEntry {
+                title: "失败重试再转 JPEG",
+                field: ConfigField::JpegRetryConvert,
+            },
+            ConfigEntry {
+                title: "JPEG 质量(0-100)",
+                field: ConfigField::JpegQuality,
+            },
+            ConfigEntry {
+                title: "HEIC 转 JPEG",
+                field: ConfigField::ConvertHeicToJpeg,
+            },
+            ConfigEntry {
+                title: "保留 HEIC 原图",
+                field: ConfigField::KeepHeicOriginal,
+            },
+            ConfigEntry {
+                title: "单章节媒体上限",
+                field: ConfigField::MediaLimitPerChapter,
+            },
+            ConfigEntry {
+                title: "媒体最大尺寸(px)",
+                field: ConfigField::MediaMaxDimensionPx,
+            },
+        ],
+    },
+    ConfigCategory {
+        title: "有声书",
+        entries: &[
+            ConfigEntry {
+                title: "启用有声书",
+                field: ConfigField::EnableAudiobook,
+            },
+            ConfigEntry {
+                title: "发音人",
+                field: ConfigField::AudiobookVoice,
+            },
+            ConfigEntry {
+                title: "TTS 服务类型(edge/third_party)",
+                field: ConfigField::AudiobookTtsProvider,
+            },
+            ConfigEntry {
+                title: "第三方 TTS API 地址",
+                field: ConfigField::AudiobookTtsApiUrl,
+            },
+            ConfigEntry {
+                title: "第三方 TTS Token",
+                field: ConfigField::AudiobookTtsApiToken,
+            },
+            ConfigEntry {
+                title: "第三方 TTS 模型",
+                field: ConfigField::AudiobookTtsModel,
+            },
+            ConfigEntry {
+                title: "语速调整",
+                field: ConfigField::AudiobookRate,
+            },
+            ConfigEntry {
+                title: "音量调整",
+                field: ConfigField::AudiobookVolume,
+            },
+            ConfigEntry {
+                title: "音调调整",
+                field: ConfigField::AudiobookPitch,
+            },
+            ConfigEntry {
+                title: "输出格式(mp3/wav)",
+                field: ConfigField::AudiobookFormat,
+            },
+            ConfigEntry {
+                title: "并发生成章节数",
+                field: ConfigField::AudiobookConcurrency,
+            },
+        ],
+    },
+];
 
 pub(in crate::ui) fn current_cfg_value(app: &App, field: ConfigField) -> String {
     match field {
@@ -439,6 +438,26 @@ pub(in crate::ui) fn current_cfg_value(app: &App, field: ConfigField) -> String
     }
 }
 
+/// 确保配置页展示值缓存可用：只在配置修改后重新格式化全部字段，
+/// 平时每帧重绘直接复用，不再为每个字段重复生成字符串。
+pub(in crate::ui) fn ensure_cfg_value_cache(app: &mut App) {
+    if app.cfg_value_cache.is_some() {
+        return;
+    }
+    let values = app
+        .cfg_categories
+        .iter()
+        .map(|category| {
+            category
+                .entries
+                .iter()
+                .map(|entry| current_cfg_value(app, entry.field))
+                .collect()
+        })
+        .collect();
+    app.cfg_value_cache = Some(values);
+}
+
 pub(in crate::ui) fn cfg_field_is_bool(field: ConfigField) -> bool {
     matches!(
         field,
@@ -524,6 +543,8 @@ pub(in crate::ui) fn apply_cfg_edit(app: &mut App, cat_idx: usize, entry_idx: us
     }
     let field = category.entries[entry_idx].field;
     let entry_title = category.entries[entry_idx].title;
+    // 一次修改可能连带其它字段（如 txt 格式会关闭段评），整体失效后下一帧重建。
+    super::invalidate_config_caches(app);
     let raw = app.cfg_edit_buffer.trim();
 
     let mut note: Option<String> = None;
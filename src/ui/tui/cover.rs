@@ -1,7 +1,10 @@
 //! TUI 封面/基础信息展示。
 
 use super::*;
-use image::{DynamicImage, GenericImageView, imageops::FilterType};
+use image::{DynamicImage, GenericImageView};
+use std::fs;
+use std::sync::{Mutex, OnceLock};
+use std::time::SystemTime;
 
 pub(super) fn handle_event_cover(app: &mut App, event: Event) -> Result<()> {
     match event {
@@ -41,9 +44,11 @@ pub(super) fn show_cover(
         return Ok(());
     };
 
-    let img = image::open(&path).with_context(|| format!("读取封面失败: {}", path.display()))?;
-    let (term_w, term_h) = crossterm::terminal::size().unwrap_or((80, 24));
-    let ascii = image_to_ascii(img, term_w, term_h);
+    let (term_w, term_h) = match app.last_frame_area {
+        Some(area) => (area.width, area.height),
+        None => crossterm::terminal::size().unwrap_or((80, 24)),
+    };
+    let ascii = cached_cover_ascii(&path, term_w, term_h)?;
     app.cover_lines = if ascii.is_empty() {
         vec!["封面太小，无法显示".to_string()]
     } else {
@@ -57,15 +62,19 @@ pub(super) fn show_cover(
 pub(super) fn draw_cover(frame: &mut ratatui::Frame, app: &mut App) {
     let (main, log_area) = super::split_with_log(frame.size());
     let title = if app.cover_title.is_empty() {
-        "封面预览".to_string()
+        "封面预览"
     } else {
-        app.cover_title.clone()
+        app.cover_title.as_str()
     };
 
+    // 每帧都会重绘：直接借用已渲染好的字符画行，不再逐行克隆整幅封面。
     let lines: Vec<Line> = if app.cover_lines.is_empty() {
         vec![Line::from("未找到封面，按 q 返回")]
     } else {
-        app.cover_lines.iter().cloned().map(Line::from).collect()
+        app.cover_lines
+            .iter()
+            .map(|line| Line::from(line.as_str()))
+            .collect()
     };
 
     let paragraph = Paragraph::new(lines)
@@ -113,6 +122,49 @@ fn push_cover_candidates(list: &mut Vec<PathBuf>, base: &Path, title: &str) {
     }
 }
 
+/// 封面字符画缓存的最大条目数（按最近使用淘汰）。
+const COVER_ASCII_CACHE_CAP: usize = 8;
+
+/// 缓存键：封面路径 + 文件 mtime/大小 + 终端尺寸，任一变化都会重新渲染。
+type CoverAsciiKey = (PathBuf, Option<SystemTime>, u64, u16, u16);
+
+/// 读取并渲染封面字符画；同一封面、同一终端尺寸再次打开时直接复用上次结果，
+/// 不必重复解码 JPEG 和缩放。
+fn cached_cover_ascii(path: &Path, term_w: u16, term_h: u16) -> Result<Vec<String>> {
+    static CACHE: OnceLock<Mutex<Vec<(CoverAsciiKey, Vec<String>)>>> = OnceLock::new();
+
+    let meta = fs::metadata(path).ok();
+    let key: CoverAsciiKey = (
+        path.to_path_buf(),
+        meta.as_ref().and_then(|m| m.modified().ok()),
+        meta.as_ref().map(|m| m.len()).unwrap_or(0),
+        term_w,
+        term_h,
+    );
+
+    let cache = CACHE.get_or_init(|| Mutex::new(Vec::new()));
+    if let Ok(mut entries) = cache.lock()
+        && let Some(pos) = entries.iter().position(|(k, _)| *k == key)
+    {
+        // 命中后移到队尾，保持“最近使用”顺序。
+        let entry = entries.remove(pos);
+        let lines = entry.1.clone();
+        entries.push(entry);
+        return Ok(lines);
+    }
+
+    let img = image::open(path).with_context(|| format!("读取封面失败: {}", path.display()))?;
+    let lines = image_to_ascii(img, term_w, term_h);
+
+    if let Ok(mut entries) = cache.lock() {
+        if entries.len() >= COVER_ASCII_CACHE_CAP {
+            entries.remove(0);
+        }
+        entries.push((key, lines.clone()));
+    }
+    Ok(lines)
+}
+
 fn image_to_ascii(img: DynamicImage, term_w: u16, term_h: u16) -> Vec<String> {
     const PALETTE: &[u8] = b" .:-=+*#%@";
     let max_width = term_w.saturating_sub(6).max(16) as u32;
@@ -131,12 +183,11 @@ fn image_to_ascii(img: DynamicImage, term_w: u16, term_h: u16) -> Vec<String> {
         target_height = max_height;
     }
 
+    // 缓存未命中时的主要开销在缩放：封面原图通常有数十万像素，而字符画只需要
+    // 几千个格子。thumbnail 用整数区域平均一次性缩到目标尺寸（同样保持宽高比），
+    // 比对整张原图做 Triangle 卷积便宜得多，灰度转换也只作用于缩小后的图。
     let gray = img
-        .resize(
-            target_width.max(1),
-            target_height.max(1),
-            FilterType::Triangle,
-        )
+        .thumbnail(target_width.max(1), target_height.max(1))
         .to_luma8();
     let mut lines = Vec::with_capacity(gray.height() as usize);
     for y in 0..gray.height() {
@@ -69,25 +69,7 @@ pub(super) fn handle_event_home(app: &mut App, event: Event) -> Result<()> {
             }
             KeyCode::Char('v') if key.modifiers.contains(KeyModifiers::CONTROL) => {
                 #[cfg(feature = "clipboard")]
-                {
-                    match super::clipboard::get_text() {
-                        Ok(Some(text)) => app.input.push_str(&text),
-                        Ok(None) => {
-                            #[cfg(target_os = "android")]
-                            {
-                                app.status = "Android 剪贴板未就绪：需要 Termux + termux-api（termux-clipboard-get）".to_string();
-                            }
-                            #[cfg(not(target_os = "android"))]
-                            {
-                                app.status = "当前构建未包含剪贴板后端（启用 clipboard-arboard）"
-                                    .to_string();
-                            }
-                        }
-                        Err(e) => {
-                            app.status = format!("读取剪贴板失败：{e}");
-                        }
-                    }
-                }
+                request_clipboard_text(app);
 
                 #[cfg(not(feature = "clipboard"))]
                 {
@@ -301,6 +283,7 @@ pub(super) fn process_input(app: &mut App) -> Result<()> {
 
     if text.eq_ignore_ascii_case("ooo") {
         app.config.old_cli = true;
+        super::invalidate_config_caches(app);
         let path = Path::new(<Config as ConfigSpec>::FILE_NAME);
         if let Err(err) = write_with_comments(&app.config, path) {
             app.status = format!("切换失败: {err}");
@@ -317,10 +300,12 @@ pub(super) fn process_input(app: &mut App) -> Result<()> {
         return Ok(());
     }
 
-    if let Some(pending) = app.pending_download.clone() {
-        match parse_range_input(text, pending.plan.chapters.len()) {
+    if let Some(total) = app.pending_download.as_ref().map(|p| p.plan.chapters.len()) {
+        match parse_range_input(text, total) {
             Ok(range) => {
-                super::start_download_task(app, pending, range)?;
+                if let Some(pending) = app.pending_download.take() {
+                    super::start_download_task(app, pending, range)?;
+                }
                 app.input.clear();
             }
             Err(err) => {
@@ -490,6 +475,38 @@ fn current_selection_detail_lines(app: &App) -> Option<Vec<Line<'static>>> {
     Some(lines)
 }
 
+/// 在后台线程读取剪贴板：桌面后端可能要和 X11/Wayland 往返，Android 需要拉起
+/// `termux-clipboard-get` 子进程，都不应卡住事件循环。结果经 worker 通道回到主循环。
+#[cfg(feature = "clipboard")]
+fn request_clipboard_text(app: &mut App) {
+    let tx = app.worker_tx.clone();
+    thread::spawn(move || {
+        let _ = tx.send(WorkerMsg::ClipboardText(super::clipboard::get_text()));
+    });
+}
+
+#[cfg(feature = "clipboard")]
+pub(super) fn apply_clipboard_text(app: &mut App, result: Result<Option<String>>) {
+    match result {
+        Ok(Some(text)) => app.input.push_str(&text),
+        Ok(None) => {
+            #[cfg(target_os = "android")]
+            {
+                app.status =
+                    "Android 剪贴板未就绪：需要 Termux + termux-api（termux-clipboard-get）"
+                        .to_string();
+            }
+            #[cfg(not(target_os = "android"))]
+            {
+                app.status = "当前构建未包含剪贴板后端（启用 clipboard-arboard）".to_string();
+            }
+        }
+        Err(e) => {
+            app.status = format!("读取剪贴板失败：{e}");
+        }
+    }
+}
+
 pub(super) fn draw_home(frame: &mut ratatui::Frame, app: &mut App) {
     let (main, log_area) = super::split_with_log(frame.size());
     let layout = Layout::default()
@@ -508,6 +525,11 @@ pub(super) fn draw_home(frame: &mut ratatui::Frame, app: &mut App) {
         app.last_home_layout = Some(arr);
     }
 
+    // 保存目录为空时 default_save_dir 会查询当前工作目录；标题栏每帧都画，
+    // 因此只在配置变化后重新生成一次展示文本。
+    let save_dir = app
+        .save_dir_label
+        .get_or_insert_with(|| app.config.default_save_dir().display().to_string());
     let header_line = {
         #[cfg(feature = "official-api")]
         let notice = "  |  本程序完全免费，若发现收费渠道，请勿上当受骗！";
@@ -522,10 +544,7 @@ pub(super) fn draw_home(frame: &mut ratatui::Frame, app: &mut App) {
                     .add_modifier(Modifier::BOLD),
             ),
             Span::raw("  |  输出目录: "),
-            Span::styled(
-                app.config.default_save_dir().display().to_string(),
-                Style::default().fg(Color::Green),
-            ),
+            Span::styled(save_dir.as_str(), Style::default().fg(Color::Green)),
             Span::styled(
                 notice,
                 #[cfg(feature = "official-api")]
@@ -57,8 +57,9 @@ use crate::download::downloader::{BookMeta, ChapterRange, DownloadPlan, Progress
 use crate::prewarm_state;
 
 pub(super) use config_model::{
-    AUDIOBOOK_VOICE_PRESETS, ConfigCategory, ConfigEntry, apply_cfg_edit, build_config_categories,
-    cfg_combo_presets, cfg_field_is_bool, cfg_field_is_combo, current_cfg_value, start_cfg_edit,
+    AUDIOBOOK_VOICE_PRESETS, CONFIG_CATEGORIES, ConfigCategory, ConfigEntry, apply_cfg_edit,
+    cfg_combo_presets, cfg_field_is_bool, cfg_field_is_combo, ensure_cfg_value_cache,
+    start_cfg_edit,
 };
 
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -142,6 +143,8 @@ enum WorkerMsg {
     },
     UpdateScanned(Result<(Vec<UpdateEntry>, Vec<UpdateEntry>)>),
     AppUpdateChecked(Result<crate::base_system::app_update::UpdateCheckReport>),
+    #[cfg(feature = "clipboard")]
+    ClipboardText(Result<Option<String>>),
 }
 
 #[derive(Clone, Debug)]
@@ -205,7 +208,8 @@ pub(super) struct App {
     focus: Focus,
     status: String,
     messages: Vec<String>,
-    logs: Vec<String>,
+    /// 日志行在写入时就解析并着色好，绘制时只借用其中的文本。
+    logs: Vec<Line<'static>>,
     results: Vec<SearchItem>,
     list_state: ListState,
     config: Config,
@@ -214,9 +218,17 @@ pub(super) struct App {
     view: View,
     previous_view: View,
     menu_state: ListState,
+    /// 最近一次绘制时的终端区域；需要终端尺寸时直接读取，免去额外的 ioctl 查询。
+    last_frame_area: Option<Rect>,
+    /// 自上次绘制以来界面状态是否有变化；空闲时跳过重绘（每次绘制都会查询一次终端尺寸）。
+    needs_redraw: bool,
 
     // config state
-    cfg_categories: Vec<ConfigCategory>,
+    cfg_categories: &'static [ConfigCategory],
+    /// 各字段的展示值缓存（按分类/字段索引）；None 表示配置已修改、需重新生成。
+    cfg_value_cache: Option<Vec<Vec<String>>>,
+    /// 首页标题栏展示的保存目录；None 表示需按当前配置重新生成。
+    save_dir_label: Option<String>,
     cfg_cat_state: ListState,
     cfg_cat_hover: Option<usize>,
     cfg_entry_state: ListState,
@@ -291,6 +303,7 @@ pub(super) struct App {
     iid_prewarm_active: bool,
     iid_prewarm_error: Option<String>,
     iid_prewarm_error_seen: Option<String>,
+    iid_prewarm_error_version: u64,
     prewarm_spinner_idx: usize,
     prewarm_spinner_last: Instant,
 
@@ -351,7 +364,6 @@ impl App {
         let mut about_btn_state = ListState::default();
         about_btn_state.select(Some(0));
 
-        let cfg_categories = build_config_categories();
         let mut cfg_cat_state = ListState::default();
         cfg_cat_state.select(Some(0));
         let mut cfg_entry_state = ListState::default();
@@ -389,7 +401,11 @@ impl App {
             view: View::Home,
             previous_view: View::Home,
             menu_state,
-            cfg_categories,
+            last_frame_area: None,
+            needs_redraw: true,
+            cfg_categories: CONFIG_CATEGORIES,
+            cfg_value_cache: None,
+            save_dir_label: None,
             cfg_cat_state,
             cfg_cat_hover: None,
             cfg_entry_state,
@@ -438,6 +454,7 @@ impl App {
             iid_prewarm_active: prewarm_state::is_prewarm_in_progress(),
             iid_prewarm_error: None,
             iid_prewarm_error_seen: None,
+            iid_prewarm_error_version: 0,
             prewarm_spinner_idx: 0,
             prewarm_spinner_last: Instant::now(),
             preview_focus: PreviewFocus::Range,
@@ -484,7 +501,8 @@ impl App {
     fn push_log(&mut self, msg: impl Into<String>) {
         let msg = msg.into();
         let trimmed = msg.trim_end_matches(['\r', '\n']);
-        self.logs.push(trimmed.to_string());
+        self.logs.push(style_log_line(trimmed));
+        self.needs_redraw = true;
         if self.logs.len() > 200 {
             let overflow = self.logs.len() - 200;
             self.logs.drain(0..overflow);
@@ -568,11 +586,15 @@ fn run_loop(
         drain_log_channel(&mut app);
         sync_prewarm_state(&mut app);
 
-        terminal.draw(|f| {
-            draw_ui(f, &mut app);
-            render_prewarm_overlay(f, &app);
-            render_iid_error_overlay(f, &app);
-        })?;
+        // 无按键、无后台消息、无动画推进时界面不会变化，不必每 200ms 重画一整帧。
+        if app.needs_redraw {
+            terminal.draw(|f| {
+                draw_ui(f, &mut app);
+                render_prewarm_overlay(f, &app);
+                render_iid_error_overlay(f, &app);
+            })?;
+            app.needs_redraw = false;
+        }
 
         if !handle_event(&mut app)? {
             break;
@@ -600,6 +622,7 @@ pub(super) fn start_app_update_check(app: &mut App) {
 }
 
 fn draw_ui(frame: &mut ratatui::Frame, app: &mut App) {
+    app.last_frame_area = Some(frame.size());
     match app.view {
         View::Home => home::draw_home(frame, app),
         View::Config => config::draw_config(frame, app),
@@ -624,7 +647,29 @@ fn handle_event(app: &mut App) -> Result<bool> {
         return Ok(true);
     }
 
-    let evt = event::read().context("read event")?;
+    // 鼠标移动事件会成串到达，而悬停效果只取决于最后的位置：
+    // 合并已就绪的连续移动事件，只处理最后一个，避免每个移动事件各重绘一整帧。
+    let mut evt = event::read().context("read event")?;
+    while is_mouse_move(&evt) && event::poll(Duration::ZERO).context("poll event")? {
+        let next = event::read().context("read event")?;
+        if !is_mouse_move(&next) {
+            dispatch_event(app, evt)?;
+            evt = next;
+            break;
+        }
+        evt = next;
+    }
+    dispatch_event(app, evt)?;
+
+    Ok(!app.should_quit)
+}
+
+fn is_mouse_move(evt: &Event) -> bool {
+    matches!(evt, Event::Mouse(me) if matches!(me.kind, MouseEventKind::Moved))
+}
+
+fn dispatch_event(app: &mut App, evt: Event) -> Result<()> {
+    app.needs_redraw = true;
     if app.iid_prewarm_error.is_some() {
         if let Event::Key(key) = evt
             && key.kind == KeyEventKind::Press
@@ -632,16 +677,14 @@ fn handle_event(app: &mut App) -> Result<bool> {
         {
             app.iid_prewarm_error = None;
         }
-        return Ok(!app.should_quit);
+        return Ok(());
     }
 
     if app.book_name_modal_open {
-        handle_book_name_modal_event(app, evt)?;
-        return Ok(!app.should_quit);
+        return handle_book_name_modal_event(app, evt);
     }
     if app.format_modal_open {
-        handle_format_modal_event(app, evt)?;
-        return Ok(!app.should_quit);
+        return handle_format_modal_event(app, evt);
     }
     match app.view {
         View::Home => home::handle_event_home(app, evt)?,
@@ -653,7 +696,7 @@ fn handle_event(app: &mut App) -> Result<bool> {
         View::Preview => handle_event_preview(app, evt)?,
     }
 
-    Ok(!app.should_quit)
+    Ok(())
 }
 
 fn handle_event_preview(app: &mut App, event: Event) -> Result<()> {
@@ -1038,13 +1081,19 @@ const ABOUT_BUTTONS: &[&str] = &[
     "返回",
 ];
 
+/// 配置被修改后调用：丢弃由配置派生的展示缓存，下一帧按新配置重新生成。
+pub(super) fn invalidate_config_caches(app: &mut App) {
+    app.cfg_value_cache = None;
+    app.save_dir_label = None;
+}
+
 fn current_category(app: &App) -> Option<(usize, &ConfigCategory)> {
     let idx = app.cfg_cat_state.selected()?;
     app.cfg_categories.get(idx).map(|c| (idx, c))
 }
 
 pub(super) fn current_cfg_entries(app: &App) -> Option<&[ConfigEntry]> {
-    current_category(app).map(|(_, c)| c.entries.as_slice())
+    current_category(app).map(|(_, c)| c.entries)
 }
 
 pub(super) fn ensure_entry_selection(app: &mut App) {
@@ -1162,6 +1211,7 @@ fn tick_spinner(app: &mut App) {
     }
     app.spinner_idx = (app.spinner_idx + 1) % SPINNER_FRAMES.len();
     app.spinner_last = Instant::now();
+    app.needs_redraw = true;
     app.status = format!("{} {}", app.spinner_text, SPINNER_FRAMES[app.spinner_idx]);
 }
 
@@ -1195,14 +1245,15 @@ fn render_log_box(frame: &mut ratatui::Frame, area: Rect, app: &App) {
             .height
             .saturating_sub(2) // account for block borders
             .max(1) as usize;
-        lines.extend(
-            app.logs
-                .iter()
-                .rev()
-                .take(visible)
-                .rev()
-                .map(|m| style_log_line(m)),
-        );
+        // 日志框每帧都会重绘：复用已着色的行，只借用其文本，不再逐帧重新拆分/着色。
+        lines.extend(app.logs.iter().rev().take(visible).rev().map(|line| {
+            Line::from(
+                line.spans
+                    .iter()
+                    .map(|span| Span::styled(span.content.as_ref(), span.style))
+                    .collect::<Vec<_>>(),
+            )
+        }));
     }
 
     let log = Paragraph::new(lines)
@@ -1439,7 +1490,14 @@ fn drain_log_channel(app: &mut App) {
 fn sync_prewarm_state(app: &mut App) {
     if app.iid_prewarm_active && !prewarm_state::is_prewarm_in_progress() {
         app.iid_prewarm_active = false;
+        app.needs_redraw = true;
+    }
+    // 每轮主循环（含每次按键）都会走到这里：错误未变化时只读一次原子版本号。
+    let version = prewarm_state::prewarm_error_version();
+    if version == app.iid_prewarm_error_version {
+        return;
     }
+    app.iid_prewarm_error_version = version;
     if let Some(err) = prewarm_state::prewarm_error()
         && app.iid_prewarm_error_seen.as_deref() != Some(err.as_str())
     {
@@ -1480,6 +1538,7 @@ fn tick_prewarm_spinner(app: &mut App) {
     }
     app.prewarm_spinner_idx = (app.prewarm_spinner_idx + 1) % SPINNER_FRAMES.len();
     app.prewarm_spinner_last = Instant::now();
+    app.needs_redraw = true;
 }
 
 pub(super) fn switch_view(app: &mut App, action: MenuAction) -> Result<()> {
@@ -1539,7 +1598,15 @@ pub(super) fn start_download_task(
 
 fn poll_worker(app: &mut App) -> Result<()> {
     while let Ok(msg) = app.worker_rx.try_recv() {
-        stop_spinner(app);
+        app.needs_redraw = true;
+        // 剪贴板结果与后台任务无关，不应打断正在进行的搜索/下载提示。
+        #[cfg(feature = "clipboard")]
+        let stops_spinner = !matches!(msg, WorkerMsg::ClipboardText(_));
+        #[cfg(not(feature = "clipboard"))]
+        let stops_spinner = true;
+        if stops_spinner {
+            stop_spinner(app);
+        }
         match msg {
             WorkerMsg::SearchDone(res) => match res {
                 Ok(results) => {
@@ -1658,6 +1725,8 @@ fn poll_worker(app: &mut App) -> Result<()> {
                 download::apply_download_done(app, book_id, result);
             }
             WorkerMsg::DownloadProgress(snap) => download::apply_download_progress(app, snap),
+            #[cfg(feature = "clipboard")]
+            WorkerMsg::ClipboardText(res) => home::apply_clipboard_text(app, res),
             WorkerMsg::AppUpdateChecked(res) => match res {
                 Ok(report) => {
                     let notify = crate::base_system::app_update::should_notify_startup(&report);
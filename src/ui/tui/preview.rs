@@ -16,7 +16,6 @@ use ratatui::widgets::{
 };
 use tracing::{info, warn};
 
-use crate::base_system::context::safe_fs_name;
 use crate::download::downloader::{self, BookMeta, ChapterRange, ProgressSnapshot, SavePhase};
 
 use super::download::{request_cancel_download, start_download_task};
@@ -275,12 +274,11 @@ pub(super) fn start_preview_task(app: &mut App, book_id: String, hint: BookMeta)
 }
 
 pub(super) fn confirm_preview(app: &mut App) -> Result<()> {
-    let pending = match app.pending_download.clone() {
-        Some(p) => p,
-        None => return Ok(()),
+    // 只借用计划读取章节数；校验通过后再把待下载项移交出去，避免深拷贝整份目录。
+    let Some(total) = app.pending_download.as_ref().map(|p| p.plan.chapters.len()) else {
+        return Ok(());
     };
 
-    let total = pending.plan.chapters.len();
     let input = app.preview_range.trim();
     let range = if input.is_empty() {
         None
@@ -300,7 +298,10 @@ pub(super) fn confirm_preview(app: &mut App) -> Result<()> {
     app.focus = Focus::Input;
     app.input.clear();
 
-    start_download_task(app, pending, range)
+    match app.pending_download.take() {
+        Some(pending) => start_download_task(app, pending, range),
+        None => Ok(()),
+    }
 }
 
 pub(super) fn cancel_preview(app: &mut App) {
@@ -342,58 +343,7 @@ pub(super) fn cleanup_preview_cover_artifacts(app: &mut App) {
         &pending.plan.book_id,
         Some(book_name),
     );
-    if !dir.exists() {
-        return;
-    }
-    if dir.join("status.json").exists() {
-        return;
-    }
-
-    let Ok(read_dir) = std::fs::read_dir(&dir) else {
-        return;
-    };
-
-    let safe_name = safe_fs_name(book_name, "_", 120);
-    let mut entries: Vec<std::path::PathBuf> = Vec::new();
-    for ent in read_dir.flatten() {
-        entries.push(ent.path());
-    }
-    if entries.is_empty() {
-        let _ = std::fs::remove_dir_all(&dir);
-        return;
-    }
-
-    let is_cover_like = |p: &std::path::Path| {
-        if p.is_dir() {
-            return false;
-        }
-        let Some(stem) = p.file_stem().and_then(|s| s.to_str()) else {
-            return false;
-        };
-        let Some(ext) = p.extension().and_then(|s| s.to_str()) else {
-            return false;
-        };
-        let ext = ext.to_ascii_lowercase();
-        let is_img = matches!(ext.as_str(), "jpg" | "jpeg" | "png" | "webp" | "gif");
-        if !is_img {
-            return false;
-        }
-        stem == safe_name || stem.eq_ignore_ascii_case("cover")
-    };
-
-    // Abort if there are non-cover files.
-    if entries.iter().any(|p| !is_cover_like(p)) {
-        return;
-    }
-
-    for p in &entries {
-        let _ = std::fs::remove_file(p);
-    }
-
-    // Remove dir if empty.
-    if crate::base_system::file_cleaner::is_empty_dir(&dir).unwrap_or(false) {
-        let _ = std::fs::remove_dir_all(&dir);
-    }
+    crate::base_system::book_paths::remove_preview_cover_folder(&dir, Some(book_name));
 }
 
 pub(super) fn wrapped_line_count(text: &str, width: u16) -> usize {
@@ -296,10 +296,11 @@ fn update_entry_from_row(it: novel_updates::NovelUpdateRow) -> UpdateEntry {
         )
     };
 
+    // 行数据按值传入：标签生成后直接移走各字段，不再逐条克隆 id/书名/目录路径。
     UpdateEntry {
-        book_id: it.book_id.clone(),
-        book_name: it.book_name.clone(),
-        folder: it.folder.clone(),
+        book_id: it.book_id,
+        book_name: it.book_name,
+        folder: it.folder,
         label,
         _new_count: it.new_count,
         _has_update: it.has_update,
@@ -340,13 +341,6 @@ pub(super) fn draw_update(frame: &mut ratatui::Frame, app: &mut App) {
     } else {
         &app.update_entries
     };
-    let items: Vec<ListItem> = if list.is_empty() {
-        vec![ListItem::new("没有可展示的项目")]
-    } else {
-        list.iter()
-            .map(|u| ListItem::new(u.label.clone()))
-            .collect()
-    };
     let list_title = if app.show_no_update {
         "无更新书籍"
     } else {
@@ -377,6 +371,23 @@ pub(super) fn draw_update(frame: &mut ratatui::Frame, app: &mut App) {
         (inner, None)
     };
 
+    // 书库可能有上百本书：只为当前可见窗口构建 ListItem（借用标签，不克隆），
+    // 窗口偏移按 ratatui List 的滚动规则计算并写回 update_state，鼠标命中计算不受影响。
+    let offset = visible_list_offset(&app.update_state, list.len(), list_area.height as usize);
+    let items: Vec<ListItem> = if list.is_empty() {
+        vec![ListItem::new("没有可展示的项目")]
+    } else {
+        list.iter()
+            .skip(offset)
+            .take(list_area.height.max(1) as usize)
+            .map(|u| ListItem::new(u.label.as_str()))
+            .collect()
+    };
+    let mut window_state = ListState::default().with_selected(
+        app.update_state
+            .selected()
+            .map(|i| i.saturating_sub(offset)),
+    );
     let list_widget = List::new(items)
         .highlight_style(
             Style::default()
@@ -384,7 +395,8 @@ pub(super) fn draw_update(frame: &mut ratatui::Frame, app: &mut App) {
                 .add_modifier(Modifier::BOLD),
         )
         .highlight_symbol(">> ");
-    frame.render_stateful_widget(list_widget, list_area, &mut app.update_state);
+    frame.render_stateful_widget(list_widget, list_area, &mut window_state);
+    *app.update_state.offset_mut() = offset;
 
     if let Some(sb_area) = sb_area {
         let pos = app
@@ -434,3 +446,19 @@ pub(super) fn draw_update(frame: &mut ratatui::Frame, app: &mut App) {
 
     super::render_log_box(frame, log_area, app);
 }
+
+/// 与 ratatui `List` 相同的滚动规则：保持选中项可见，偏移不超过最后一项。
+fn visible_list_offset(state: &ListState, len: usize, height: usize) -> usize {
+    if len == 0 || height == 0 {
+        return 0;
+    }
+    let mut offset = state.offset().min(len - 1);
+    if let Some(selected) = state.selected().map(|i| i.min(len - 1)) {
+        if selected >= offset + height {
+            offset = selected + 1 - height;
+        } else if selected < offset {
+            offset = selected;
+        }
+    }
+    offset
+}
@@ -44,7 +44,14 @@ pub fn run(
             }
         });
 
+    // Web UI 面向单用户，重活都在 spawn_blocking 中执行；异步工作线程无需铺满全部核心。
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .clamp(1, MAX_RUNTIME_WORKERS);
     let rt = tokio::runtime::Builder::new_multi_thread()
+        .worker_threads(workers)
+        .thread_name("tomato-web")
         .enable_all()
         .build()?;
 
@@ -59,6 +66,8 @@ pub fn run(
 }
 
 const DEFAULT_BIND: &str = "127.0.0.1:18423";
+/// Web 运行时异步工作线程上限。
+const MAX_RUNTIME_WORKERS: usize = 4;
 
 fn parse_bind_addr(raw: &str) -> Result<SocketAddr> {
     let s = raw.trim();
@@ -141,6 +150,7 @@ async fn run_async(
         self_update: Arc::new(state::SelfUpdateStore::default()),
         library_scan: Arc::new(LibraryScanStore::default()),
         update_scan: Arc::new(state::UpdateScanStore::default()),
+        preview_plans: Arc::new(state::PreviewPlanStore::default()),
         auth,
         // 最多允许 2 个并发的上游 API 请求（search / preview），
         // 单用户正常使用完全够用，SaaS 滥用场景下无法并发服务多用户。
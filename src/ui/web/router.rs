@@ -81,14 +81,15 @@ async fn auth_and_log_mw(
     req: Request<axum::body::Body>,
     next: Next,
 ) -> Response {
-    let path = req.uri().path().to_string();
-    let method = req.method().to_string();
-    let ip = req
+    // 日志字段只保留廉价的克隆（Uri/Method 内部引用计数，地址是 Copy），字符串化交给
+    // tracing 在事件真正启用时再做；状态轮询这类高频请求不必每次都分配三段字符串。
+    let uri = req.uri().clone();
+    let path = uri.path();
+    let method = req.method().clone();
+    let addr = req
         .extensions()
         .get::<ConnectInfo<std::net::SocketAddr>>()
-        .map(|c| c.0)
-        .map(|a| a.to_string())
-        .unwrap_or_else(|| "unknown".to_string());
+        .map(|c| c.0);
 
     // If lock mode enabled, require password for any non-asset route,
     // except the login endpoint and landing page.
@@ -123,17 +124,21 @@ async fn auth_and_log_mw(
             }
 
             if !authorized {
-                warn!(target: "web_security", ip = %ip, method = %method, path = %path, status = 401, "unauthorized");
+                warn!(target: "web_security", ip = %display_addr(addr), method = %method, path = %path, status = 401, "unauthorized");
                 return (StatusCode::UNAUTHORIZED, "unauthorized").into_response();
             }
         }
     }
 
     let resp = next.run(req).await;
-    info!(target: "web_access", ip = %ip, method = %method, path = %path, status = %resp.status().as_u16(), "ok");
+    info!(target: "web_access", ip = %display_addr(addr), method = %method, path = %path, status = %resp.status().as_u16(), "ok");
     resp
 }
 
+fn display_addr(addr: Option<std::net::SocketAddr>) -> String {
+    addr.map_or_else(|| "unknown".to_string(), |a| a.to_string())
+}
+
 fn cookie_value<'a>(raw_cookie: &'a str, key: &str) -> Option<&'a str> {
     let prefix = format!("{key}=");
     raw_cookie
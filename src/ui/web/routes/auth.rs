@@ -251,6 +251,7 @@ pub(crate) async fn set_config_raw(
 
     let mut g = state.config.lock().unwrap_or_else(|e| e.into_inner());
     *g = cfg;
+    state.preview_plans.clear();
 
     Ok(Json(json!({"ok": true})))
 }
@@ -286,6 +287,7 @@ pub(crate) async fn set_config_full(
 
     let mut g = state.config.lock().unwrap_or_else(|e| e.into_inner());
     *g = cfg;
+    state.preview_plans.clear();
 
     Ok(Json(json!({"ok": true})))
 }
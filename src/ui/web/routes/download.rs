@@ -210,18 +210,19 @@ fn add_dir_to_zip<W: Write + Seek>(
             Ok(e) => e,
             Err(_) => continue,
         };
-        let path = entry.path();
-        let meta = match entry.metadata() {
-            Ok(m) => m,
+        // 类型取自目录项本身（与 metadata 一样不跟随符号链接），每个条目省一次 stat。
+        let file_type = match entry.file_type() {
+            Ok(t) => t,
             Err(_) => continue,
         };
+        let path = entry.path();
 
-        if meta.is_dir() {
+        if file_type.is_dir() {
             let _ = add_dir_to_zip(zip, base, &path, options, buf);
             continue;
         }
 
-        if !meta.is_file() {
+        if !file_type.is_file() {
             continue;
         }
 
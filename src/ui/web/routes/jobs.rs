@@ -97,11 +97,16 @@ pub(crate) async fn create_job(
         .clone();
     let range_start = req.range_start;
     let range_end = req.range_end;
+    // 刚预览过的书直接用预览时的计划（用户确认的就是这份目录），省去一次目录请求。
+    let previewed_plan = state.preview_plans.take(&book_id);
 
     thread::spawn(move || {
         jobs.set_running(handle.id);
 
-        let plan = match dl::prepare_download_plan(&cfg, &book_id, dl::BookMeta::default()) {
+        let plan = match previewed_plan
+            .map(Ok)
+            .unwrap_or_else(|| dl::prepare_download_plan(&cfg, &book_id, dl::BookMeta::default()))
+        {
             Ok(p) => p,
             Err(e) => {
                 jobs.set_failed(handle.id, format!("prepare plan failed: {e}"));
@@ -5,12 +5,12 @@ use axum::http::{HeaderValue, StatusCode, header};
 use axum::response::Response;
 use serde_json::{Value, json};
 use std::path::{Path as FsPath, PathBuf};
+use std::sync::Arc;
+use std::time::{Duration, Instant};
 use tracing::{debug, info, warn};
 
 use crate::base_system::book_id::resolve_book_id;
-use crate::base_system::book_paths::book_folder_path;
-use crate::base_system::context::safe_fs_name;
-use crate::base_system::file_cleaner::is_empty_dir;
+use crate::base_system::book_paths::{book_folder_path, remove_preview_cover_folder};
 use crate::book_parser::image_utils::ensure_cached_image;
 use crate::download::downloader as dl;
 use crate::network_parser::network::{FanqieWebConfig, FanqieWebNetwork};
@@ -33,6 +33,11 @@ fn parse_cover_key(path: &FsPath) -> Option<String> {
     Some(stem)
 }
 
+/// 封面候选 URL 的错峰启动间隔：前一个候选在此时间内没有结果才启动下一个。
+const COVER_CANDIDATE_STAGGER: Duration = Duration::from_millis(250);
+/// 次选候选先成功时，继续等待更优候选（detail_cover_url 优先）的宽限时间。
+const COVER_PREFERRED_GRACE: Duration = Duration::from_millis(1000);
+
 fn resolve_local_preview_cover_key(
     cfg: &crate::base_system::context::Config,
     meta: &dl::BookMeta,
@@ -43,38 +48,92 @@ fn resolve_local_preview_cover_key(
     cfg.convert_heic_to_jpeg = true;
     cfg.keep_heic_original = false;
 
-    let cache_dir = preview_cover_cache_dir();
-    let candidates = [meta.detail_cover_url.as_deref(), meta.cover_url.as_deref()];
-
-    for url in candidates.into_iter().flatten() {
+    let mut urls: Vec<String> = Vec::with_capacity(2);
+    for url in [meta.detail_cover_url.as_deref(), meta.cover_url.as_deref()]
+        .into_iter()
+        .flatten()
+    {
         let u = url.trim();
-        if !(u.starts_with("http://") || u.starts_with("https://")) {
-            continue;
+        if (u.starts_with("http://") || u.starts_with("https://")) && !urls.iter().any(|x| x == u) {
+            urls.push(u.to_string());
         }
+    }
 
-        match ensure_cached_image(&cfg, u, &cache_dir) {
-            Ok(Some((path, mime, ext))) => {
-                let is_jpeg = mime.eq_ignore_ascii_case("image/jpeg")
-                    || ext.eq_ignore_ascii_case(".jpg")
-                    || ext.eq_ignore_ascii_case(".jpeg");
-                if !is_jpeg {
-                    debug!(url = u, mime, ext, "封面非 JPEG 格式，跳过");
-                    continue;
-                }
-                if let Some(key) = parse_cover_key(&path) {
-                    debug!(url = u, key = %key, "成功缓存封面 JPEG");
-                    return Some(key);
-                }
+    // Happy Eyeballs 式错峰竞速：先请求首选 URL，若 COVER_CANDIDATE_STAGGER 内未成功
+    // （或已失败）再启动下一个。结果按候选顺序取舍：更优候选均失败时直接采用；
+    // 次选先成功则最多再等 COVER_PREFERRED_GRACE 给更优候选。落后的请求在后台线程中
+    // 自然结束，其结果只会写入缓存，不再阻塞本次预览。
+    let cfg = Arc::new(cfg);
+    let cache_dir = Arc::new(preview_cover_cache_dir());
+    let (tx, rx) = crossbeam_channel::unbounded::<(usize, Option<String>)>();
+    let mut tx = Some(tx);
+    // None = 仍在进行；Some(None) = 失败；Some(Some(key)) = 成功
+    let mut results: Vec<Option<Option<String>>> = vec![None; urls.len()];
+    let mut started = 0usize;
+    let mut grace_deadline: Option<Instant> = None;
+    loop {
+        if let Some(sender) = tx.as_ref()
+            && started < urls.len()
+        {
+            let (cfg, cache_dir, sender) = (cfg.clone(), cache_dir.clone(), sender.clone());
+            let (idx, url) = (started, urls[started].clone());
+            std::thread::spawn(move || {
+                let _ = sender.send((idx, fetch_preview_cover_key(&cfg, &url, &cache_dir)));
+            });
+            started += 1;
+            if started == urls.len() {
+                // 全部候选已启动：释放本地发送端，候选线程全部结束（包括 panic）后 recv 即返回 Err。
+                tx = None;
             }
-            Ok(None) => {
-                debug!(url = u, "封面下载/转码返回 None");
+        }
+
+        for res in &results {
+            match res {
+                Some(Some(key)) => return Some(key.clone()),
+                Some(None) => continue,
+                None => break,
+            }
+        }
+        if results.iter().all(Option::is_some) {
+            break;
+        }
+        if grace_deadline.is_none() && results.iter().any(|r| matches!(r, Some(Some(_)))) {
+            grace_deadline = Some(Instant::now() + COVER_PREFERRED_GRACE);
+        }
+
+        let pending_start = started < urls.len();
+        let timeout = match grace_deadline {
+            Some(deadline) => {
+                let left = deadline.saturating_duration_since(Instant::now());
+                Some(if pending_start {
+                    left.min(COVER_CANDIDATE_STAGGER)
+                } else {
+                    left
+                })
             }
-            Err(e) => {
-                warn!(url = u, error = %e, "封面下载失败");
+            None if pending_start => Some(COVER_CANDIDATE_STAGGER),
+            None => None,
+        };
+        let received = match timeout {
+            Some(t) => rx.recv_timeout(t).map_err(|e| e.is_disconnected()),
+            None => rx.recv().map_err(|_| true),
+        };
+        match received {
+            Ok((idx, res)) => results[idx] = Some(res),
+            Err(true) => break,
+            Err(false) => {
+                if grace_deadline.is_some_and(|d| Instant::now() >= d) {
+                    break;
+                }
             }
         }
     }
 
+    // 宽限期已过或候选线程异常退出：退而采用已成功的最优候选。
+    if let Some(key) = results.into_iter().flatten().flatten().next() {
+        return Some(key);
+    }
+
     warn!(
         cover_url = ?meta.cover_url,
         detail_cover_url = ?meta.detail_cover_url,
@@ -83,6 +142,35 @@ fn resolve_local_preview_cover_key(
     None
 }
 
+fn fetch_preview_cover_key(
+    cfg: &crate::base_system::context::Config,
+    url: &str,
+    cache_dir: &FsPath,
+) -> Option<String> {
+    match ensure_cached_image(cfg, url, cache_dir) {
+        Ok(Some((path, mime, ext))) => {
+            let is_jpeg = mime.eq_ignore_ascii_case("image/jpeg")
+                || ext.eq_ignore_ascii_case(".jpg")
+                || ext.eq_ignore_ascii_case(".jpeg");
+            if !is_jpeg {
+                debug!(url, mime, ext, "封面非 JPEG 格式，跳过");
+                return None;
+            }
+            let key = parse_cover_key(&path)?;
+            debug!(url, key = %key, "成功缓存封面 JPEG");
+            Some(key)
+        }
+        Ok(None) => {
+            debug!(url, "封面下载/转码返回 None");
+            None
+        }
+        Err(e) => {
+            warn!(url, error = %e, "封面下载失败");
+            None
+        }
+    }
+}
+
 fn load_preview_cover_jpeg(key: &str) -> Option<Vec<u8>> {
     if key.len() != 40 || !key.chars().all(|c| c.is_ascii_hexdigit()) {
         return None;
@@ -209,7 +297,7 @@ pub(crate) async fn api_preview(
         .map(|k| format!("/api/preview-cover/{k}"))
         .or_else(|| Some(format!("/api/preview-cover-by-book/{book_id}")));
 
-    Ok(Json(json!({
+    let body = json!({
         "book_id": book_id,
         "book_name": meta.book_name,
         "original_book_name": meta.original_book_name,
@@ -227,7 +315,10 @@ pub(crate) async fn api_preview(
         "category": meta.category,
         "first_chapter_title": meta.first_chapter_title,
         "last_chapter_title": meta.last_chapter_title,
-    })))
+    });
+    // 暂存计划：随后的封面兜底与创建下载任务直接复用，不再重复拉目录。
+    state.preview_plans.put(plan);
+    Ok(Json(body))
 }
 
 pub(crate) async fn api_preview_cover(Path(key): Path<String>) -> Result<Response, StatusCode> {
@@ -269,16 +360,22 @@ pub(crate) async fn api_preview_cover_by_book(
         .unwrap_or_else(|e| e.into_inner())
         .clone();
 
-    let cfg_for_plan = cfg.clone();
-    let book_id_for_plan = book_id.clone();
-    let plan = tokio::task::spawn_blocking(move || {
-        dl::prepare_download_plan(&cfg_for_plan, &book_id_for_plan, dl::BookMeta::default())
-    })
-    .await
-    .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?
-    .map_err(|_| StatusCode::BAD_GATEWAY)?;
-
-    let meta_for_cover = plan.meta.clone();
+    let meta_for_cover = match state.preview_plans.meta(&book_id) {
+        Some(meta) => meta,
+        None => {
+            let cfg_for_plan = cfg.clone();
+            let book_id_for_plan = book_id.clone();
+            let plan = tokio::task::spawn_blocking(move || {
+                dl::prepare_download_plan(&cfg_for_plan, &book_id_for_plan, dl::BookMeta::default())
+            })
+            .await
+            .map_err(|_| StatusCode::INTERNAL_SERVER_ERROR)?
+            .map_err(|_| StatusCode::BAD_GATEWAY)?;
+            let meta = plan.meta.clone();
+            state.preview_plans.put(plan);
+            meta
+        }
+    };
     let book_id_for_cover = book_id.clone();
     let key = tokio::task::spawn_blocking(move || {
         resolve_local_preview_cover_key_with_web_fallback(&cfg, &book_id_for_cover, &meta_for_cover)
@@ -339,106 +436,18 @@ pub(crate) async fn api_preview_cleanup(
         return StatusCode::NO_CONTENT;
     }
 
-    // 需要获取 book_name 以定位文件夹，调用 prepare_download_plan 一次
-    let cfg_for_plan = cfg.clone();
-    let bid = book_id.clone();
-    let plan_result = tokio::task::spawn_blocking(move || {
-        dl::prepare_download_plan(&cfg_for_plan, &bid, dl::BookMeta::default())
-    })
-    .await;
-
-    let plan = match plan_result {
-        Ok(Ok(p)) => p,
-        _ => {
-            // plan 获取失败，无法定位文件夹，静默返回
-            debug!(book_id = %book_id, "cleanup: 无法获取下载计划，跳过");
-            return StatusCode::NO_CONTENT;
-        }
-    };
-
-    let book_name = match plan.meta.book_name.as_deref() {
-        Some(n) => n.to_string(),
-        None => {
-            debug!(book_id = %book_id, "cleanup: plan 中无 book_name，跳过");
-            return StatusCode::NO_CONTENT;
-        }
-    };
-
-    // 在 blocking 线程执行文件系统清理
-    let cfg_for_cleanup = cfg.clone();
-    let bid_for_cleanup = book_id.clone();
+    // 缓存目录只按 book_id 命名，无需为了书名再准备一次下载计划（那会重新拉目录、
+    // 甚至把刚要清理的封面再下载一遍）；新版封面统一为 cover.*，按此识别即可。
+    let dir = book_folder_path(&cfg, &book_id, None);
     tokio::task::spawn_blocking(move || {
-        cleanup_preview_cover_dir(&cfg_for_cleanup, &bid_for_cleanup, &book_name);
+        if remove_preview_cover_folder(&dir, None) {
+            info!(path = %dir.display(), "cleanup: 已清理预览产生的封面文件夹");
+        } else {
+            debug!(path = %dir.display(), "cleanup: 文件夹不存在或包含非封面文件，跳过");
+        }
     })
     .await
     .ok();
 
     StatusCode::NO_CONTENT
 }
-
-/// 实际的文件清理逻辑（同步），与 TUI 版本逻辑一致。
-fn cleanup_preview_cover_dir(
-    cfg: &crate::base_system::context::Config,
-    book_id: &str,
-    book_name: &str,
-) {
-    let dir = book_folder_path(cfg, book_id, Some(book_name));
-    if !dir.exists() {
-        return;
-    }
-    // 存在 status.json 说明已有真正的下载，不应删除
-    if dir.join("status.json").exists() {
-        return;
-    }
-
-    let Ok(read_dir) = std::fs::read_dir(&dir) else {
-        return;
-    };
-
-    let safe_name = safe_fs_name(book_name, "_", 120);
-    let mut entries: Vec<PathBuf> = Vec::new();
-    for ent in read_dir.flatten() {
-        entries.push(ent.path());
-    }
-    if entries.is_empty() {
-        let _ = std::fs::remove_dir_all(&dir);
-        info!(path = %dir.display(), "cleanup: 删除空的预览文件夹");
-        return;
-    }
-
-    let is_cover_like = |p: &FsPath| -> bool {
-        if p.is_dir() {
-            return false;
-        }
-        let Some(stem) = p.file_stem().and_then(|s| s.to_str()) else {
-            return false;
-        };
-        let Some(ext) = p.extension().and_then(|s| s.to_str()) else {
-            return false;
-        };
-        let ext_lower = ext.to_ascii_lowercase();
-        let is_img = matches!(
-            ext_lower.as_str(),
-            "jpg" | "jpeg" | "png" | "webp" | "gif" | "heic" | "heif"
-        );
-        if !is_img {
-            return false;
-        }
-        stem == safe_name || stem.eq_ignore_ascii_case("cover")
-    };
-
-    // 如果存在非封面文件，中止清理
-    if entries.iter().any(|p| !is_cover_like(p)) {
-        debug!(path = %dir.display(), "cleanup: 文件夹包含非封面文件，跳过");
-        return;
-    }
-
-    for p in &entries {
-        let _ = std::fs::remove_file(p);
-    }
-
-    if is_empty_dir(&dir).unwrap_or(false) {
-        let _ = std::fs::remove_dir_all(&dir);
-        info!(path = %dir.display(), "cleanup: 已清理预览产生的封面文件夹");
-    }
-}
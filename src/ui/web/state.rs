@@ -11,7 +11,7 @@ use sha2::{Digest, Sha256};
 use uuid::Uuid;
 
 use crate::base_system::context::Config;
-use crate::download::downloader::{BookNameOption, ProgressSnapshot};
+use crate::download::downloader::{BookMeta, BookNameOption, DownloadPlan, ProgressSnapshot};
 
 #[derive(Clone, Debug)]
 pub(crate) struct ConfigView {
@@ -32,6 +32,7 @@ pub(crate) struct AppState {
     pub(crate) self_update: Arc<SelfUpdateStore>,
     pub(crate) library_scan: Arc<LibraryScanStore>,
     pub(crate) update_scan: Arc<UpdateScanStore>,
+    pub(crate) preview_plans: Arc<PreviewPlanStore>,
     pub(crate) auth: Option<AuthState>,
     /// 限制同时访问上游 API（search / preview）的并发数，防止 WebUI 被用作多用户 API 代理。
     /// 仅在启用 official-api feature 时有意义，其他 feature 下置 None。
@@ -374,6 +375,48 @@ impl UpdateScanStore {
     }
 }
 
+/// 预览计划的复用时限：超过后视为过期，重新拉取目录，避免错过新章节。
+const PREVIEW_PLAN_TTL_MS: u64 = 10 * 60 * 1000;
+
+/// 预览时准备好的下载计划，按 book_id 暂存。
+///
+/// WebUI 的一次下载通常是「预览 → 封面 → 创建任务」，三个请求都需要同一份计划；
+/// 暂存后只有预览真正拉取目录，后两者直接复用，不再各自重复请求上游。
+#[derive(Debug, Default)]
+pub(crate) struct PreviewPlanStore {
+    inner: Mutex<HashMap<String, (u64, DownloadPlan)>>,
+}
+
+impl PreviewPlanStore {
+    pub(crate) fn put(&self, plan: DownloadPlan) {
+        let now = now_ms();
+        let mut g = self.inner.lock().unwrap_or_else(|e| e.into_inner());
+        g.retain(|_, (stored_ms, _)| now.saturating_sub(*stored_ms) <= PREVIEW_PLAN_TTL_MS);
+        g.insert(plan.book_id.clone(), (now, plan));
+    }
+
+    /// 仅取元数据（封面解析用），不复制整份目录。
+    pub(crate) fn meta(&self, book_id: &str) -> Option<BookMeta> {
+        let g = self.inner.lock().unwrap_or_else(|e| e.into_inner());
+        g.get(book_id)
+            .filter(|(stored_ms, _)| now_ms().saturating_sub(*stored_ms) <= PREVIEW_PLAN_TTL_MS)
+            .map(|(_, plan)| plan.meta.clone())
+    }
+
+    /// 取出计划交给下载任务；取出后即移除，下次预览会重新拉取最新目录。
+    pub(crate) fn take(&self, book_id: &str) -> Option<DownloadPlan> {
+        let mut g = self.inner.lock().unwrap_or_else(|e| e.into_inner());
+        g.remove(book_id)
+            .filter(|(stored_ms, _)| now_ms().saturating_sub(*stored_ms) <= PREVIEW_PLAN_TTL_MS)
+            .map(|(_, plan)| plan)
+    }
+
+    /// 配置变化（书名偏好、保存路径、API 地址等）会影响计划内容，直接全部作废。
+    pub(crate) fn clear(&self) {
+        self.inner.lock().unwrap_or_else(|e| e.into_inner()).clear();
+    }
+}
+
 #[derive(Clone)]
 pub(crate) struct AuthState {
     pub(crate) password_sha256: [u8; 32],